@@ -1,5 +1,4 @@
 import asyncio
-import json
 import time
 import traceback
 import uuid
@@ -19,6 +18,7 @@ from langflow.api.utils import (
     format_exception_message,
     get_top_level_vertices,
     parse_exception,
+    update_graph_from_data,
 )
 from langflow.api.v1.schemas import (
     FlowDataRequest,
@@ -32,10 +32,20 @@ from langflow.graph.graph.base import Graph
 from langflow.graph.utils import log_vertex_build
 from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
+from langflow.services.build_scheduler.service import BuildQueueFullError
 from langflow.services.database.models.flow.model import Flow
-from langflow.services.deps import get_chat_service, get_telemetry_service, session_scope
+from langflow.services.deps import (
+    get_build_scheduler_service,
+    get_chat_service,
+    get_telemetry_service,
+    session_scope,
+)
 from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
+from langflow.services.tracing.profiler import bind_to_current_span, profile_span
+
+# The graphs with a build in progress, which the next builds of their flow can't patch until it is done
+_graphs_being_built: set[int] = set()
 
 
 async def start_flow_build(
@@ -54,10 +64,21 @@ async def start_flow_build(
 ) -> str:
     """Start the flow build process by setting up the queue and starting the build task.
 
+    The build task waits for a slot from the build scheduler before running.
+
     Returns:
         the job_id.
+
+    Raises:
+        HTTPException: With status 429 if the build scheduler rejects the build.
     """
     job_id = str(uuid.uuid4())
+    build_scheduler = get_build_scheduler_service()
+    try:
+        ticket = build_scheduler.submit(current_user.id)
+    except BuildQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
+
     try:
         _, event_manager = queue_service.create_queue(job_id)
         task_coro = generate_flow_events(
@@ -73,8 +94,13 @@ async def start_flow_build(
             current_user=current_user,
             flow_name=flow_name,
         )
-        queue_service.start_job(job_id, task_coro)
+        queue_service.start_job(job_id, build_scheduler.run(ticket, task_coro))
+        # Gives the slot back even if the task is cancelled before it starts
+        _, _, task, _ = queue_service.get_queue_data(job_id)
+        if task is not None:
+            task.add_done_callback(lambda _: ticket.release())
     except Exception as e:
+        ticket.release()
         logger.exception("Failed to create queue and start task")
         raise HTTPException(status_code=500, detail=str(e)) from e
     return job_id
@@ -201,6 +227,7 @@ async def generate_flow_events(
     """
     chat_service = get_chat_service()
     telemetry_service = get_telemetry_service()
+    build_scheduler = get_build_scheduler_service()
     if not inputs:
         inputs = InputValueRequest(session=str(flow_id))
 
@@ -213,6 +240,7 @@ async def generate_flow_events(
             # Create a fresh session for database operations
             async with session_scope() as fresh_session:
                 graph = await create_graph(fresh_session, flow_id_str, flow_name)
+            _graphs_being_built.add(id(graph))
 
             first_layer = sort_vertices(graph)
 
@@ -225,10 +253,13 @@ async def generate_flow_events(
             components_count = len(graph.vertices)
             vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
 
-            await chat_service.set_cache(flow_id_str, graph)
+            async with profile_span("cache graph", "persistence"):
+                await chat_service.set_cache(flow_id_str, graph)
             await log_telemetry(start_time, components_count, success=True)
 
         except Exception as exc:
+            if graph is not None:
+                _graphs_being_built.discard(id(graph))
             await log_telemetry(start_time, components_count, success=False, error_message=str(exc))
 
             if "stream or streaming set to True" in str(exc):
@@ -269,6 +300,17 @@ async def generate_flow_events(
             result = await fresh_session.exec(select(Flow.name).where(Flow.id == flow_id))
             flow_name = result.first()
 
+        # Playground builds send the flow, which mostly changed in a few components since the last build
+        previous_graph = await get_previous_graph(flow_id_str)
+        if previous_graph is not None:
+            try:
+                return await update_graph_from_data(
+                    previous_graph, data.model_dump(), session_id=effective_session_id, flow_name=flow_name
+                )
+            except Exception:  # noqa: BLE001
+                _graphs_being_built.discard(id(previous_graph))
+                logger.opt(exception=True).debug("Could not patch the graph of the last build, building it again")
+
         return await build_graph_from_data(
             flow_id=flow_id_str,
             payload=data.model_dump(),
@@ -277,6 +319,16 @@ async def generate_flow_events(
             session_id=effective_session_id,
         )
 
+    async def get_previous_graph(flow_id_str: str) -> Graph | None:
+        """Returns the graph of the last build of the flow, marked as being built, unless another build has it."""
+        cached = await chat_service.get_cache(flow_id_str)
+        graph = cached.get("result") if isinstance(cached, dict) else None
+        if not isinstance(graph, Graph) or graph.user_id != str(current_user.id) or id(graph) in _graphs_being_built:
+            return None
+        # Claimed before awaiting anything else, so that concurrent builds of the flow don't patch it too
+        _graphs_being_built.add(id(graph))
+        return graph
+
     def sort_vertices(graph: Graph) -> list[str]:
         try:
             return graph.sort_vertices(stop_component_id, start_component_id)
@@ -330,19 +382,10 @@ async def generate_flow_events(
 
             result_data_response.message = artifacts
 
-            # Log the vertex build
-            if not vertex.will_stream and log_builds:
-                background_tasks.add_task(
-                    log_vertex_build,
-                    flow_id=flow_id_str,
-                    vertex_id=vertex_id,
-                    valid=valid,
-                    params=params,
-                    data=result_data_response,
-                    artifacts=artifacts,
-                )
-            else:
-                await chat_service.set_cache(flow_id_str, graph)
+            # The vertex build is logged once the response is serialized, see build_vertices
+            if vertex.will_stream or not log_builds:
+                async with profile_span("cache graph", "persistence"):
+                    await chat_service.set_cache(flow_id_str, graph)
 
             timedelta = time.perf_counter() - start_time
             duration = format_elapsed_time(timedelta)
@@ -409,21 +452,34 @@ async def generate_flow_events(
             event_manager: Manager for handling events
         """
         try:
-            vertex_build_response: VertexBuildResponse = await _build_vertex(vertex_id, graph, event_manager)
+            async with build_scheduler.vertex_slot():
+                vertex_build_response: VertexBuildResponse = await _build_vertex(vertex_id, graph, event_manager)
         except asyncio.CancelledError as exc:
             logger.error(f"Build cancelled: {exc}")
             raise
 
         # send built event or error event
         try:
-            vertex_build_response_json = vertex_build_response.model_dump_json()
-            build_data = json.loads(vertex_build_response_json)
+            # Serialized once, the same payload is sent to the client and stored in the database
+            build_data = vertex_build_response.model_dump(mode="json")
         except Exception as exc:
             msg = f"Error serializing vertex build response: {exc}"
             raise ValueError(msg) from exc
 
         event_manager.on_end_vertex(data={"build_data": build_data})
 
+        if log_builds and not graph.get_vertex(vertex_id).will_stream:
+            background_tasks.add_task(
+                bind_to_current_span(log_vertex_build),
+                flow_id=str(flow_id),
+                vertex_id=vertex_id,
+                valid=vertex_build_response.valid,
+                params=vertex_build_response.params,
+                data=build_data["data"],
+                artifacts=build_data["data"]["message"],
+                serialized=True,
+            )
+
         if vertex_build_response.valid and vertex_build_response.next_vertices_ids:
             tasks = []
             for next_vertex_id in vertex_build_response.next_vertices_ids:
@@ -447,7 +503,7 @@ async def generate_flow_events(
         event_manager.on_error(data=error_message.data)
         raise
 
-    event_manager.on_vertices_sorted(data={"ids": ids, "to_run": vertices_to_run})
+    event_manager.on_vertices_sorted(data={"ids": ids, "to_run": vertices_to_run, "run_id": graph.run_id})
 
     tasks = []
     for vertex_id in ids:
@@ -457,6 +513,10 @@ async def generate_flow_events(
         await asyncio.gather(*tasks)
     except asyncio.CancelledError:
         background_tasks.add_task(graph.end_all_traces_in_context())
+        # Don't keep the graph of a cancelled build alive in the cache
+        cached = await chat_service.get_cache(str(flow_id))
+        if isinstance(cached, dict) and cached.get("result") is graph:
+            await chat_service.clear_cache(str(flow_id))
         raise
     except Exception as e:
         logger.error(f"Error building vertices: {e}")
@@ -470,6 +530,8 @@ async def generate_flow_events(
         )
         event_manager.on_error(data=error_message.data)
         raise
+    finally:
+        _graphs_being_built.discard(id(graph))
 
     event_manager.on_end(data={})
     await graph.end_all_traces()
@@ -13,6 +13,8 @@ from sqlalchemy import delete
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.graph.graph.base import Graph
+from langflow.helpers.subflow_cache import get_subflow_graph_cache
+from langflow.memory import get_message_tail_cache
 from langflow.services.auth.utils import get_current_active_user, get_current_active_user_mcp
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageTable
@@ -169,6 +171,23 @@ async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwarg
     session_id = kwargs.get("session_id") or str_flow_id
 
     graph = Graph.from_payload(payload, str_flow_id, flow_name, kwargs.get("user_id"))
+    _set_session_id(graph, session_id)
+    await graph.initialize_run()
+    return graph
+
+
+async def update_graph_from_data(graph: Graph, payload: dict, session_id: str, flow_name: str | None = None) -> Graph:
+    """Patch the graph of a previous build of the flow with its new payload, and start a new run of it."""
+    graph.apply_diff(payload)
+    graph.reset_run_state()
+    if flow_name:
+        graph.flow_name = flow_name
+    _set_session_id(graph, session_id)
+    await graph.initialize_run()
+    return graph
+
+
+def _set_session_id(graph: Graph, session_id: str) -> None:
     for vertex_id in graph.has_session_id_vertices:
         vertex = graph.get_vertex(vertex_id)
         if vertex is None:
@@ -178,8 +197,6 @@ async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwarg
             vertex.update_raw_params({"session_id": session_id}, overwrite=True)
 
     graph.session_id = session_id
-    await graph.initialize_run()
-    return graph
 
 
 async def build_graph_from_db_no_cache(flow_id: uuid.UUID, session: AsyncSession, **kwargs):
@@ -304,9 +321,12 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
         # it might cause unexpected behaviors because the session id could still be
         # used elsewhere to search for these messages.
         await session.exec(delete(MessageTable).where(MessageTable.flow_id == flow_id))
+        # The sessions of the flow are not known here
+        get_message_tail_cache().invalidate()
         await session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))
         await session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id))
         await session.exec(delete(Flow).where(Flow.id == flow_id))
+        get_subflow_graph_cache().invalidate(flow_id)
     except Exception as e:
         msg = f"Unable to cascade delete flow: {flow_id}"
         raise RuntimeError(msg, e) from e
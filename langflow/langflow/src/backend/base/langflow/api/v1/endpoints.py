@@ -26,6 +26,7 @@ from langflow.api.v1.schemas import (
     UpdateCustomComponentRequest,
     UploadFileResponse,
 )
+from langflow.custom.component_updates import get_build_config_update_coalescer, get_component_template_cache
 from langflow.custom.custom_component.component import Component
 from langflow.custom.utils import (
     add_code_field_to_build_config,
@@ -48,8 +49,14 @@ from langflow.services.cache.utils import save_uploaded_file
 from langflow.services.database.models.flow.model import Flow, FlowRead
 from langflow.services.database.models.flow.utils import get_all_webhook_components_in_flow
 from langflow.services.database.models.user.model import User, UserRead
-from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
+from langflow.services.deps import (
+    get_session_service,
+    get_settings_service,
+    get_telemetry_service,
+    get_webhook_queue_service,
+)
 from langflow.services.telemetry.schema import RunPayload
+from langflow.services.webhook_queue.service import WebhookQueueFullError
 from langflow.utils.compression import compress_response
 from langflow.utils.version import get_version_info
 
@@ -400,6 +407,10 @@ async def webhook_run_flow(
 ):
     """Run a flow using a webhook request.
 
+    The run is stored in the webhook queue and run by its workers, unless the queue is disabled, in which case
+    it runs as a background task of the request. Requests with an `Idempotency-Key` header already received for
+    the flow are not run again.
+
     Args:
         flow (Flow, optional): The flow to be executed. Defaults to Depends(get_flow_by_id).
         user (User): The flow user.
@@ -407,12 +418,14 @@ async def webhook_run_flow(
         background_tasks (BackgroundTasks): The background tasks manager.
 
     Returns:
-        dict: A dictionary containing the status of the task.
+        dict: A dictionary containing the status of the task, and the id of the run when it is queued.
 
     Raises:
-        HTTPException: If the flow is not found or if there is an error processing the request.
+        HTTPException: If the flow is not found, if there is an error processing the request, or with status 429
+            if too many webhook runs are pending.
     """
     telemetry_service = get_telemetry_service()
+    webhook_queue = get_webhook_queue_service()
     start_time = time.perf_counter()
     logger.debug("Received webhook request")
     error_msg = ""
@@ -427,13 +440,31 @@ async def webhook_run_flow(
             error_msg = "Request body is empty. You should provide a JSON payload containing the flow ID."
             raise HTTPException(status_code=400, detail=error_msg)
 
+        body = data.decode() if isinstance(data, bytes) else data
+        if webhook_queue.enabled:
+            try:
+                run, created = await webhook_queue.enqueue(
+                    flow.id, user.id, body, idempotency_key=request.headers.get("Idempotency-Key")
+                )
+            except WebhookQueueFullError as exc:
+                error_msg = str(exc)
+                raise HTTPException(
+                    status_code=429, detail=error_msg, headers={"Retry-After": str(exc.retry_after)}
+                ) from exc
+            except Exception as exc:
+                error_msg = str(exc)
+                raise HTTPException(status_code=500, detail=error_msg) from exc
+            if not created:
+                return {"message": "Task already received", "status": run.status.value, "run_id": run.id}
+            return {"message": "Task started in the background", "status": "in progress", "run_id": run.id}
+
         try:
             # get all webhook components in the flow
             webhook_components = get_all_webhook_components_in_flow(flow.data)
             tweaks = {}
 
             for component in webhook_components:
-                tweaks[component["id"]] = {"data": data.decode() if isinstance(data, bytes) else data}
+                tweaks[component["id"]] = {"data": body}
             input_request = SimplifiedAPIRequest(
                 input_value="",
                 input_type="chat",
@@ -686,55 +717,18 @@ async def custom_component_update(
     database), updates the component's build configuration, and validates outputs. Returns the updated component node as
     a JSON-serializable dictionary.
 
+    When the request has a node id, a newer update of the same field of the node cancels this one, which then returns
+    the result of the newer update.
+
     Raises:
         HTTPException: If an error occurs during component building or updating.
         SerializationError: If serialization of the updated component node fails.
     """
+    coalescer = get_build_config_update_coalescer()
+    # Updates of other fields have their own effects on the node, they are never cancelled
+    key = (str(user.id), code_request.node_id, code_request.field) if code_request.node_id else None
     try:
-        component = Component(_code=code_request.code)
-        component_node, cc_instance = build_custom_component_template(
-            component,
-            user_id=user.id,
-        )
-
-        component_node["tool_mode"] = code_request.tool_mode
-
-        if hasattr(cc_instance, "set_attributes"):
-            template = code_request.get_template()
-            params = {}
-
-            for key, value_dict in template.items():
-                if isinstance(value_dict, dict):
-                    value = value_dict.get("value")
-                    input_type = str(value_dict.get("_input_type"))
-                    params[key] = parse_value(value, input_type)
-
-            load_from_db_fields = [
-                field_name
-                for field_name, field_dict in template.items()
-                if isinstance(field_dict, dict) and field_dict.get("load_from_db") and field_dict.get("value")
-            ]
-
-            params = await update_params_with_load_from_db_fields(cc_instance, params, load_from_db_fields)
-            cc_instance.set_attributes(params)
-        updated_build_config = code_request.get_template()
-        await update_component_build_config(
-            cc_instance,
-            build_config=updated_build_config,
-            field_value=code_request.field_value,
-            field_name=code_request.field,
-        )
-        if "code" not in updated_build_config:
-            updated_build_config = add_code_field_to_build_config(updated_build_config, code_request.code)
-        component_node["template"] = updated_build_config
-
-        if isinstance(cc_instance, Component):
-            await cc_instance.run_and_validate_update_outputs(
-                frontend_node=component_node,
-                field_name=code_request.field,
-                field_value=code_request.field_value,
-            )
-
+        component_node = await coalescer.run(key, lambda: _update_component_node(code_request, user))
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -744,6 +738,49 @@ async def custom_component_update(
         raise SerializationError.from_exception(exc, data=component_node) from exc
 
 
+async def _update_component_node(code_request: UpdateCustomComponentRequest, user: User) -> dict:
+    component_node, cc_instance = get_component_template_cache().build(code_request.code, user_id=user.id)
+
+    component_node["tool_mode"] = code_request.tool_mode
+
+    if hasattr(cc_instance, "set_attributes"):
+        template = code_request.get_template()
+        params = {}
+
+        for key, value_dict in template.items():
+            if isinstance(value_dict, dict):
+                value = value_dict.get("value")
+                input_type = str(value_dict.get("_input_type"))
+                params[key] = parse_value(value, input_type)
+
+        load_from_db_fields = [
+            field_name
+            for field_name, field_dict in template.items()
+            if isinstance(field_dict, dict) and field_dict.get("load_from_db") and field_dict.get("value")
+        ]
+
+        params = await update_params_with_load_from_db_fields(cc_instance, params, load_from_db_fields)
+        cc_instance.set_attributes(params)
+    updated_build_config = code_request.get_template()
+    await update_component_build_config(
+        cc_instance,
+        build_config=updated_build_config,
+        field_value=code_request.field_value,
+        field_name=code_request.field,
+    )
+    if "code" not in updated_build_config:
+        updated_build_config = add_code_field_to_build_config(updated_build_config, code_request.code)
+    component_node["template"] = updated_build_config
+
+    if isinstance(cc_instance, Component):
+        await cc_instance.run_and_validate_update_outputs(
+            frontend_node=component_node,
+            field_name=code_request.field,
+            field_value=code_request.field_value,
+        )
+    return component_node
+
+
 @router.get("/config")
 async def get_config() -> ConfigResponse:
     """Retrieve the current application configuration settings.
@@ -1,4 +1,5 @@
 import hashlib
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from http import HTTPStatus
 from io import BytesIO
@@ -14,7 +15,7 @@ from langflow.api.v1.schemas import UploadFileResponse
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.settings.service import SettingsService
-from langflow.services.storage.service import StorageService
+from langflow.services.storage.service import STREAM_CHUNK_SIZE, StorageService
 from langflow.services.storage.utils import build_content_type_from_extension
 
 router = APIRouter(tags=["Files"], prefix="/files")
@@ -37,6 +38,19 @@ async def get_flow(
     return flow
 
 
+async def _upload_chunks(file: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+async def _hash_upload(file: UploadFile) -> str:
+    sha256 = hashlib.sha256()
+    async for chunk in _upload_chunks(file, STREAM_CHUNK_SIZE):
+        sha256.update(chunk)
+    await file.seek(0)
+    return sha256.hexdigest()
+
+
 @router.post("/upload/{flow_id}", status_code=HTTPStatus.CREATED)
 async def upload_file(
     *,
@@ -60,12 +74,13 @@ async def upload_file(
         raise HTTPException(status_code=403, detail="You don't have access to this flow")
 
     try:
-        file_content = await file.read()
         timestamp = datetime.now(tz=timezone.utc).astimezone().strftime("%Y-%m-%d_%H-%M-%S")
-        file_name = file.filename or hashlib.sha256(file_content).hexdigest()
+        file_name = file.filename or await _hash_upload(file)
         full_file_name = f"{timestamp}_{file_name}"
         folder = str(flow.id)
-        await storage_service.save_file(flow_id=folder, file_name=full_file_name, data=file_content)
+        await storage_service.save_file_stream(
+            flow_id=folder, file_name=full_file_name, stream=_upload_chunks(file, STREAM_CHUNK_SIZE)
+        )
         return UploadFileResponse(flow_id=str(flow.id), file_path=f"{folder}/{full_file_name}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -89,13 +104,14 @@ async def download_file(
         raise HTTPException(status_code=500, detail=f"Content type not found for extension {extension}")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
+        file_size = await storage_service.get_file_size(flow_id=flow_id_str, file_name=file_name)
         headers = {
             "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
             "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(file_content)),
+            "Content-Length": str(file_size),
         }
-        return StreamingResponse(BytesIO(file_content), media_type=content_type, headers=headers)
+        file_stream = storage_service.get_file_stream(flow_id=flow_id_str, file_name=file_name)
+        return StreamingResponse(file_stream, media_type=content_type, headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import io
 import json
 import re
-import zipfile
 from datetime import datetime, timezone
 from typing import Annotated
 from uuid import UUID
@@ -21,6 +19,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
 from langflow.api.v1.schemas import FlowListCreate
+from langflow.helpers.subflow_cache import get_subflow_graph_cache
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.logging import logger
@@ -36,7 +35,7 @@ from langflow.services.database.models.flow.utils import get_webhook_component_i
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.folder.model import Folder
 from langflow.services.deps import get_settings_service
-from langflow.utils.compression import compress_response
+from langflow.utils.compression import compress_response, stream_zip
 
 # build router
 router = APIRouter(prefix="/flows", tags=["Flows"])
@@ -350,6 +349,7 @@ async def update_flow(
         session.add(db_flow)
         await session.commit()
         await session.refresh(db_flow)
+        get_subflow_graph_cache().invalidate(db_flow.id)
 
         await _save_flow_to_fs(db_flow)
 
@@ -502,27 +502,18 @@ async def download_multiple_file(
     flows_without_api_keys = [remove_api_keys(flow.model_dump()) for flow in flows]
 
     if len(flows_without_api_keys) > 1:
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for flow in flows_without_api_keys:
-                # Convert the flow object to JSON
-                flow_json = json.dumps(jsonable_encoder(flow))
-
-                # Write the JSON to the ZIP file
-                zip_file.writestr(f"{flow['name']}.json", flow_json)
-
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        # Convert each flow to JSON only when the ZIP stream reaches it
+        zip_entries = (
+            (f"{flow['name']}.json", json.dumps(jsonable_encoder(flow)).encode("utf-8"))
+            for flow in flows_without_api_keys
+        )
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=timezone.utc).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_flows.zip"
 
         return StreamingResponse(
-            zip_stream,
+            stream_zip(zip_entries),
             media_type="application/x-zip-compressed",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -1,11 +1,12 @@
 import asyncio
 import base64
+import json
 from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
 from functools import wraps
 from typing import Any, ParamSpec, TypeVar
 from urllib.parse import quote, unquote, urlparse
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pydantic
 from anyio import BrokenResourceError
@@ -82,6 +83,8 @@ current_user_ctx: ContextVar[User] = ContextVar("current_user_ctx")
 
 # Define constants
 MAX_RETRIES = 2
+# Number of resources returned by a resources/list request, clients get the rest with the cursor of the result
+MCP_RESOURCES_PAGE_SIZE = 500
 
 
 def get_enable_progress_notifications() -> bool:
@@ -93,46 +96,93 @@ async def handle_list_prompts():
     return []
 
 
-@server.list_resources()
-async def handle_list_resources():
-    resources = []
-    try:
-        db_service = get_db_service()
-        storage_service = get_storage_service()
-        settings_service = get_settings_service()
+def list_resources_with_cursor(mcp_server: Server):
+    """Like `Server.list_resources`, for handlers that take the cursor of the request and return a page."""
 
-        # Build full URL from settings
-        host = getattr(settings_service.settings, "host", "localhost")
-        port = getattr(settings_service.settings, "port", 3000)
+    def decorator(func: Callable[[str | None], Awaitable[types.ListResourcesResult]]):
+        async def handler(request: types.ListResourcesRequest):
+            cursor = request.params.cursor if request.params else None
+            return types.ServerResult(await func(cursor))
 
-        base_url = f"http://{host}:{port}".rstrip("/")
+        mcp_server.request_handlers[types.ListResourcesRequest] = handler
+        return func
 
-        async with db_service.with_session() as session:
-            flows = (await session.exec(select(Flow))).all()
+    return decorator
 
-            for flow in flows:
-                if flow.id:
-                    try:
-                        files = await storage_service.list_files(flow_id=str(flow.id))
-                        for file_name in files:
-                            # URL encode the filename
-                            safe_filename = quote(file_name)
-                            resource = types.Resource(
-                                uri=f"{base_url}/api/v1/files/{flow.id}/{safe_filename}",
-                                name=file_name,
-                                description=f"File in flow: {flow.name}",
-                                mimeType=build_content_type_from_extension(file_name),
-                            )
-                            resources.append(resource)
-                    except FileNotFoundError as e:
-                        msg = f"Error listing files for flow {flow.id}: {e}"
-                        logger.debug(msg)
-                        continue
+
+def _encode_resources_cursor(flow_id: UUID, file_name: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([str(flow_id), file_name]).encode()).decode()
+
+
+def _decode_resources_cursor(cursor: str) -> tuple[UUID, str]:
+    try:
+        flow_id, file_name = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return UUID(flow_id), file_name
+    except (ValueError, TypeError) as e:
+        msg = f"Invalid cursor: {cursor}"
+        raise ValueError(msg) from e
+
+
+async def list_flow_file_resources(
+    user_id: UUID, cursor: str | None = None, project_id: UUID | None = None
+) -> types.ListResourcesResult:
+    """List the files of the flows of a user, or of a project of the user, as MCP resources.
+
+    The flows are read with one query and their files come from `StorageService.list_files_by_flow`.
+    Resources are ordered by flow and file name and returned in pages of `MCP_RESOURCES_PAGE_SIZE`,
+    the cursor being the last resource of the previous page.
+    """
+    storage_service = get_storage_service()
+    settings_service = get_settings_service()
+
+    # Build full URL from settings
+    host = getattr(settings_service.settings, "host", "localhost")
+    port = getattr(settings_service.settings, "port", 3000)
+
+    base_url = f"http://{host}:{port}".rstrip("/")
+
+    after_flow_id, after_file_name = _decode_resources_cursor(cursor) if cursor else (None, None)
+    stmt = select(Flow.id, Flow.name).where(Flow.user_id == user_id).order_by(Flow.id)
+    if project_id is not None:
+        stmt = stmt.where(Flow.folder_id == project_id)
+    if after_flow_id is not None:
+        stmt = stmt.where(Flow.id >= after_flow_id)
+    async with session_scope() as session:
+        flows = (await session.exec(stmt)).all()
+
+    files_by_flow = await storage_service.list_files_by_flow([str(flow_id) for flow_id, _ in flows])
+    files = [
+        (flow_id, flow_name, file_name)
+        for flow_id, flow_name in flows
+        for file_name in files_by_flow.get(str(flow_id), [])
+        if flow_id != after_flow_id or file_name > after_file_name
+    ]
+    page = files[:MCP_RESOURCES_PAGE_SIZE]
+    resources = [
+        types.Resource(
+            # URL encode the filename
+            uri=f"{base_url}/api/v1/files/{flow_id}/{quote(file_name)}",
+            name=file_name,
+            description=f"File in flow: {flow_name}",
+            mimeType=build_content_type_from_extension(file_name),
+        )
+        for flow_id, flow_name, file_name in page
+    ]
+    next_cursor = None
+    if len(files) > len(page):
+        last_flow_id, _, last_file_name = page[-1]
+        next_cursor = _encode_resources_cursor(last_flow_id, last_file_name)
+    return types.ListResourcesResult(resources=resources, nextCursor=next_cursor)
+
+
+@list_resources_with_cursor(server)
+async def handle_list_resources(cursor: str | None = None) -> types.ListResourcesResult:
+    try:
+        return await list_flow_file_resources(current_user_ctx.get().id, cursor)
     except Exception as e:
         msg = f"Error in listing resources: {e!s}"
         logger.exception(msg)
         raise
-    return resources
 
 
 @server.read_resource()
@@ -4,13 +4,15 @@ import json
 import logging
 import os
 import platform
+import time
 from asyncio.subprocess import create_subprocess_exec
+from collections import Counter
 from contextvars import ContextVar
 from datetime import datetime, timezone
 from ipaddress import ip_address
 from pathlib import Path
 from subprocess import CalledProcessError
-from urllib.parse import quote, unquote, urlparse
+from urllib.parse import unquote, urlparse
 from uuid import UUID, uuid4
 
 from anyio import BrokenResourceError
@@ -28,6 +30,8 @@ from langflow.api.v1.mcp import (
     current_user_ctx,
     get_mcp_config,
     handle_mcp_errors,
+    list_flow_file_resources,
+    list_resources_with_cursor,
     with_db_session,
 )
 from langflow.api.v1.schemas import MCPInstallRequest, MCPSettings, SimplifiedAPIRequest
@@ -37,7 +41,6 @@ from langflow.helpers.flow import json_schema_from_flow
 from langflow.schema.message import Message
 from langflow.services.database.models import Flow, Folder
 from langflow.services.deps import get_settings_service, get_storage_service, session_scope
-from langflow.services.storage.utils import build_content_type_from_extension
 
 logger = logging.getLogger(__name__)
 
@@ -47,13 +50,21 @@ router = APIRouter(prefix="/mcp/project", tags=["mcp_projects"])
 current_project_ctx: ContextVar[UUID | None] = ContextVar("current_project_ctx", default=None)
 
 # Create a mapping of project-specific SSE transports
-project_sse_transports = {}
+project_sse_transports: dict[str, SseServerTransport] = {}
+
+# The SSE transports and MCP servers of projects are created when a client first connects to a project.
+# They are dropped once they have been idle for `mcp_project_server_idle_timeout` seconds, or the least recently
+# used ones when there are more than `mcp_project_servers_max`, but never while a client is connected.
+_project_last_used: dict[str, float] = {}
+_project_connections: Counter[str] = Counter()
 
 
 def get_project_sse(project_id: UUID) -> SseServerTransport:
     """Get or create an SSE transport for a specific project."""
     project_id_str = str(project_id)
+    _project_last_used[project_id_str] = time.monotonic()
     if project_id_str not in project_sse_transports:
+        prune_project_mcp_servers(keep=project_id_str)
         project_sse_transports[project_id_str] = SseServerTransport(f"/api/v1/mcp/project/{project_id_str}/")
     return project_sse_transports[project_id_str]
 
@@ -151,6 +162,7 @@ async def handle_project_sse(
     sse = get_project_sse(project_id)
     project_server = get_project_mcp_server(project_id)
     logger.debug("Project MCP server name: %s", project_server.server.name)
+    _project_connections[str(project_id)] += 1
 
     # Set context variables
     user_token = current_user_ctx.set(current_user)
@@ -181,6 +193,8 @@ async def handle_project_sse(
     finally:
         current_user_ctx.reset(user_token)
         current_project_ctx.reset(project_token)
+        _project_connections[str(project_id)] -= 1
+        _project_last_used[str(project_id)] = time.monotonic()
 
     return Response(status_code=200)
 
@@ -693,45 +707,15 @@ class ProjectMCPServer:
         async def handle_list_prompts():
             return []
 
-        @self.server.list_resources()
-        async def handle_list_resources():
-            resources = []
+        @list_resources_with_cursor(self.server)
+        async def handle_list_resources(cursor: str | None = None) -> types.ListResourcesResult:
             try:
-                storage_service = get_storage_service()
-                settings_service = get_settings_service()
-
-                # Build full URL from settings
-                host = getattr(settings_service.settings, "host", "localhost")
-                port = getattr(settings_service.settings, "port", 3000)
-
-                base_url = f"http://{host}:{port}".rstrip("/")
-
-                async with session_scope() as session:
-                    flows = (await session.exec(select(Flow))).all()
-
-                    for flow in flows:
-                        if flow.id:
-                            try:
-                                files = await storage_service.list_files(flow_id=str(flow.id))
-                                for file_name in files:
-                                    # URL encode the filename
-                                    safe_filename = quote(file_name)
-                                    resource = types.Resource(
-                                        uri=f"{base_url}/api/v1/files/{flow.id}/{safe_filename}",
-                                        name=file_name,
-                                        description=f"File in flow: {flow.name}",
-                                        mimeType=build_content_type_from_extension(file_name),
-                                    )
-                                    resources.append(resource)
-                            except FileNotFoundError as e:
-                                msg = f"Error listing files for flow {flow.id}: {e}"
-                                logger.debug(msg)
-                                continue
+                current_user = current_user_ctx.get()
+                return await list_flow_file_resources(current_user.id, cursor, project_id=self.project_id)
             except Exception as e:
                 msg = f"Error in listing resources: {e!s}"
                 logger.exception(msg)
                 raise
-            return resources
 
         @self.server.read_resource()
         async def handle_read_resource(uri: str) -> bytes:
@@ -885,32 +869,57 @@ class ProjectMCPServer:
 
 
 # Cache of project MCP servers
-project_mcp_servers = {}
+project_mcp_servers: dict[str, ProjectMCPServer] = {}
 
 
 def get_project_mcp_server(project_id: UUID) -> ProjectMCPServer:
     """Get or create an MCP server for a specific project."""
     project_id_str = str(project_id)
+    _project_last_used[project_id_str] = time.monotonic()
     if project_id_str not in project_mcp_servers:
+        prune_project_mcp_servers(keep=project_id_str)
         project_mcp_servers[project_id_str] = ProjectMCPServer(project_id)
     return project_mcp_servers[project_id_str]
 
 
-async def init_mcp_servers():
-    """Initialize MCP servers for all projects."""
-    try:
-        async with session_scope() as session:
-            projects = (await session.exec(select(Folder))).all()
+def _close_project_mcp_server(project_id_str: str) -> None:
+    sse = project_sse_transports.pop(project_id_str, None)
+    if sse is not None:
+        # The transport keeps the streams of the sessions it ever had, close them before dropping it. They are
+        # private to the mcp package, so the transport is just dropped if they are not there
+        read_stream_writers = getattr(sse, "_read_stream_writers", {})
+        for read_stream_writer in read_stream_writers.values():
+            read_stream_writer.close()
+        read_stream_writers.clear()
+    project_mcp_servers.pop(project_id_str, None)
+    _project_last_used.pop(project_id_str, None)
+    _project_connections.pop(project_id_str, None)
 
-            for project in projects:
-                try:
-                    get_project_sse(project.id)
-                    get_project_mcp_server(project.id)
-                except Exception as e:
-                    msg = f"Failed to initialize MCP server for project {project.id}: {e}"
-                    logger.exception(msg)
-                    # Continue to next project even if this one fails
 
-    except Exception as e:
-        msg = f"Failed to initialize MCP servers: {e}"
-        logger.exception(msg)
+def prune_project_mcp_servers(keep: str | None = None) -> None:
+    """Drop the MCP servers of projects without clients that are idle or that exceed the maximum count.
+
+    Args:
+        keep: The project whose server or transport is being created, it is never dropped.
+    """
+    settings = get_settings_service().settings
+    now = time.monotonic()
+    project_ids = project_sse_transports.keys() | project_mcp_servers.keys()
+    if keep is not None:
+        project_ids.add(keep)
+    idle_project_ids = sorted(
+        (
+            project_id
+            for project_id in project_ids
+            if project_id != keep and _project_connections.get(project_id, 0) <= 0
+        ),
+        key=lambda project_id: _project_last_used.get(project_id, 0.0),
+    )
+    # Make room for the server or transport that is about to be created
+    excess = len(project_ids) - settings.mcp_project_servers_max
+    for project_id in idle_project_ids:
+        idle_for = now - _project_last_used.get(project_id, 0.0)
+        if excess <= 0 and idle_for < settings.mcp_project_server_idle_timeout:
+            break
+        _close_project_mcp_server(project_id)
+        excess -= 1
@@ -1,13 +1,15 @@
-from typing import Annotated
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy import delete
 from sqlmodel import col, select
 
-from langflow.api.utils import DbSession, custom_params
+from langflow.api.utils import CurrentActiveUser, DbSession, custom_params
+from langflow.memory import get_message_tail_cache
 from langflow.schema.message import MessageResponse
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
@@ -18,6 +20,7 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.tracing.profiler import profile_store
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -94,6 +97,7 @@ async def delete_messages(message_ids: list[UUID], session: DbSession) -> None:
     try:
         await session.exec(delete(MessageTable).where(MessageTable.id.in_(message_ids)))  # type: ignore[attr-defined]
         await session.commit()
+        get_message_tail_cache().remove(message_ids)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -120,6 +124,7 @@ async def update_message(
         session.add(db_message)
         await session.commit()
         await session.refresh(db_message)
+        get_message_tail_cache().invalidate(db_message.session_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
     return db_message
@@ -152,6 +157,8 @@ async def update_session_id(
         session.add_all(messages)
 
         await session.commit()
+        get_message_tail_cache().invalidate(old_session_id)
+        get_message_tail_cache().invalidate(new_session_id)
         message_responses = []
         for message in messages:
             await session.refresh(message)
@@ -174,6 +181,7 @@ async def delete_messages_session(
             .execution_options(synchronize_session="fetch")
         )
         await session.commit()
+        get_message_tail_cache().invalidate(session_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -201,3 +209,21 @@ async def get_transactions(
             return await apaginate(session, stmt, params=params, transformer=transform_transaction_table)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/profile/{run_id}", response_model=None)
+async def get_run_profile(
+    run_id: str,
+    current_user: CurrentActiveUser,
+    output_format: Annotated[Literal["json", "collapsed"], Query(alias="format")] = "json",
+) -> dict[str, Any] | PlainTextResponse:
+    """Return the execution profile of a recent run, as a span tree or as collapsed stacks for flamegraphs.
+
+    Runs are only profiled when the `profile_runs` setting is enabled.
+    """
+    profile = profile_store.get(run_id)
+    if profile is None or (str(profile.user_id) != str(current_user.id) and not current_user.is_superuser):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if output_format == "collapsed":
+        return PlainTextResponse(profile.to_collapsed())
+    return profile.to_dict()
@@ -1,6 +1,4 @@
-import io
 import json
-import zipfile
 from datetime import datetime, timezone
 from typing import Annotated
 from urllib.parse import quote
@@ -32,6 +30,7 @@ from langflow.services.database.models.folder.model import (
     FolderUpdate,
 )
 from langflow.services.database.models.folder.pagination_model import FolderWithPaginatedFlows
+from langflow.utils.compression import stream_zip
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
@@ -288,14 +287,10 @@ async def download_file(
             raise HTTPException(status_code=404, detail="No flows found in project")
 
         flows_without_api_keys = [remove_api_keys(flow.model_dump()) for flow in flows]
-        zip_stream = io.BytesIO()
-
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for flow in flows_without_api_keys:
-                flow_json = json.dumps(jsonable_encoder(flow))
-                zip_file.writestr(f"{flow['name']}.json", flow_json.encode("utf-8"))
-
-        zip_stream.seek(0)
+        zip_entries = (
+            (f"{flow['name']}.json", json.dumps(jsonable_encoder(flow)).encode("utf-8"))
+            for flow in flows_without_api_keys
+        )
 
         current_time = datetime.now(tz=timezone.utc).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_{project.name}_flows.zip"
@@ -304,7 +299,7 @@ async def download_file(
         encoded_filename = quote(filename)
 
         return StreamingResponse(
-            zip_stream,
+            stream_zip(zip_entries),
             media_type="application/x-zip-compressed",
             headers={"Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"},
         )
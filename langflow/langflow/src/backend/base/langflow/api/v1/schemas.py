@@ -205,6 +205,8 @@ class UpdateCustomComponentRequest(CustomComponentRequest):
     field_value: str | int | float | bool | dict | list | None = None
     template: dict
     tool_mode: bool = False
+    node_id: str | None = None
+    """The id of the node being edited. A newer update of the same field of the node cancels this one while it runs."""
 
     def get_template(self):
         return dotdict(self.template)
@@ -34,9 +34,8 @@ from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_variable_service, session_scope
 from langflow.utils.voice_utils import (
-    BYTES_PER_24K_FRAME,
-    VAD_SAMPLE_RATE_16K,
-    resample_24k_to_16k,
+    VADPipeline,
+    coalesce_audio_chunks,
 )
 
 router = APIRouter(prefix="/voice", tags=["Voice"])
@@ -775,34 +774,27 @@ async def flow_as_tool_websocket(
 
             # Setup for VAD processing.
             vad_queue: asyncio.Queue = asyncio.Queue()
-            vad_audio_buffer = bytearray()
             bot_speaking_flag = [False]
 
             async def process_vad_audio() -> None:
-                nonlocal vad_audio_buffer
                 last_speech_time = datetime.now(tz=timezone.utc)
-                vad = get_vad()
+                vad_pipeline = VADPipeline(get_vad())
                 while True:
-                    base64_data = await vad_queue.get()
-                    raw_chunk_24k = base64.b64decode(base64_data)
-                    vad_audio_buffer.extend(raw_chunk_24k)
-                    has_speech = False
-                    while len(vad_audio_buffer) >= BYTES_PER_24K_FRAME:
-                        frame_24k = vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        del vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        try:
-                            frame_16k = resample_24k_to_16k(frame_24k)
-                            is_speech = vad.is_speech(frame_16k, VAD_SAMPLE_RATE_16K)
-                            if is_speech:
-                                has_speech = True
-                                logger.trace("!", end="")
-                                if bot_speaking_flag[0]:
-                                    msg_handler.openai_send({"type": "response.cancel"})
-                                    bot_speaking_flag[0] = False
-                        except Exception as e:  # noqa: BLE001
-                            logger.error(f"[ERROR] VAD processing failed (ValueError): {e}")
-                            continue
+                    chunks = [await vad_queue.get()]
+                    # Process the audio received meanwhile in the same batch
+                    while not vad_queue.empty():
+                        chunks.append(vad_queue.get_nowait())
+                    try:
+                        speech_frames = vad_pipeline.process(b"".join(base64.b64decode(chunk) for chunk in chunks))
+                    except Exception as e:  # noqa: BLE001
+                        logger.error(f"[ERROR] VAD processing failed (ValueError): {e}")
+                        continue
+                    has_speech = any(speech_frames)
                     if has_speech:
+                        logger.trace("!", end="")
+                        if bot_speaking_flag[0]:
+                            msg_handler.openai_send({"type": "response.cancel"})
+                            bot_speaking_flag[0] = False
                         last_speech_time = datetime.now(tz=timezone.utc)
                         logger.trace(".", end="")
                     else:
@@ -910,7 +902,7 @@ async def flow_as_tool_websocket(
                             voice_settings=None,
                             stream=True,
                         )
-                        for audio_chunk in audio_chunks:
+                        for audio_chunk in coalesce_audio_chunks(audio_chunks):
                             base64_audio = base64.b64encode(audio_chunk).decode("utf-8")
                             # Schedule sending the audio chunk in the main event loop.
                             event = {
@@ -1293,7 +1285,7 @@ async def flow_tts_websocket(
                                             voice_settings=None,
                                             stream=True,
                                         )
-                                        for chunk in audio_stream:
+                                        for chunk in coalesce_audio_chunks(audio_stream):
                                             base64_audio = base64.b64encode(chunk).decode("utf-8")
                                             audio_event = {"type": "response.audio.delta", "delta": base64_audio}
                                             client_send(audio_event)
@@ -1,7 +1,5 @@
-import io
 import re
 import uuid
-import zipfile
 from collections.abc import AsyncGenerator, AsyncIterable
 from datetime import datetime
 from http import HTTPStatus
@@ -9,8 +7,9 @@ from pathlib import Path
 from typing import Annotated
 from zoneinfo import ZoneInfo
 
+import anyio
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from loguru import logger
 from sqlmodel import col, select
 
@@ -18,7 +17,9 @@ from langflow.api.schemas import UploadFileResponse
 from langflow.api.utils import CurrentActiveUser, DbSession
 from langflow.services.database.models.file.model import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
+from langflow.services.storage.local import LocalStorageService
 from langflow.services.storage.service import StorageService
+from langflow.utils.compression import stream_zip
 
 router = APIRouter(tags=["Files"], prefix="/files")
 
@@ -64,16 +65,22 @@ async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser,
 
 
 async def save_file_routine(file, storage_service, current_user: CurrentActiveUser, file_content=None, file_name=None):
-    """Routine to save the file content to the storage service."""
+    """Routine to save the file content to the storage service.
+
+    Without `file_content`, the file is streamed to the storage in chunks instead of being read in memory.
+    """
     file_id = uuid.uuid4()
 
-    if not file_content:
-        file_content = await file.read()
     if not file_name:
         file_name = file.filename
 
     # Save the file using the storage service.
-    await storage_service.save_file(flow_id=str(current_user.id), file_name=file_name, data=file_content)
+    if file_content:
+        await storage_service.save_file(flow_id=str(current_user.id), file_name=file_name, data=file_content)
+    else:
+        await storage_service.save_file_stream(
+            flow_id=str(current_user.id), file_name=file_name, stream=byte_stream_generator(file)
+        )
 
     return file_id, file_name
 
@@ -307,34 +314,22 @@ async def download_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
-                    flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
-                )
-
-                # Get the file extension from the original filename
-                file_extension = Path(file.path).suffix
-                # Create the filename with extension
-                filename_with_extension = f"{file.name}{file_extension}"
-
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
-
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        # Get the file content from storage only when the ZIP stream reaches it,
+        # with the proper extension from the original filename
+        zip_entries = [
+            (
+                f"{file.name}{Path(file.path).suffix}",
+                storage_service.get_file_stream(flow_id=str(current_user.id), file_name=file.path.split("/")[-1]),
+            )
+            for file in files
+        ]
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=ZoneInfo("UTC")).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_files.zip"
 
         return StreamingResponse(
-            zip_stream,
+            stream_zip(zip_entries),
             media_type="application/x-zip-compressed",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -357,16 +352,17 @@ async def read_file_content(file_stream: AsyncIterable[bytes] | bytes, *, decode
         ValueError: If the stream yields non-bytes chunks.
         HTTPException: If decoding fails or an error occurs while reading.
     """
-    content = b""
     try:
         if isinstance(file_stream, bytes):
             content = file_stream
         else:
+            chunks = []
             async for chunk in file_stream:
                 if not isinstance(chunk, bytes):
                     msg = "File stream must yield bytes"
                     raise TypeError(msg)
-                content += chunk
+                chunks.append(chunk)
+            content = b"".join(chunks)
         if not decode:
             return content
         try:
@@ -409,28 +405,39 @@ async def download_file(
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
 
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-
-        if file_stream is None:
-            raise HTTPException(status_code=404, detail="File stream not available")
-
         # If return_content is True, read the file content and return it
         if return_content:
-            return await read_file_content(file_stream, decode=True)
-
-        # For streaming, ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
+            file_content = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
+            if file_content is None:
+                raise HTTPException(status_code=404, detail="File stream not available")
+            return await read_file_content(file_content, decode=True)
 
         # Create the filename with extension
         file_extension = Path(file.path).suffix
         filename_with_extension = f"{file.name}{file_extension}"
 
+        # Local files are sent from disk in chunks, zero-copy when the server supports it
+        if isinstance(storage_service, LocalStorageService):
+            file_path = storage_service.build_full_path(flow_id=str(current_user.id), file_name=file_name)
+            if not await anyio.Path(file_path).is_file():
+                raise HTTPException(status_code=404, detail="File stream not available")
+            return FileResponse(
+                file_path,
+                media_type="application/octet-stream",
+                filename=filename_with_extension,
+            )
+
+        # Fails early if the file is missing, before the streaming response starts
+        file_size = await storage_service.get_file_size(flow_id=str(current_user.id), file_name=file_name)
+
         # Return the file as a streaming response
         return StreamingResponse(
-            byte_stream,
+            storage_service.get_file_stream(flow_id=str(current_user.id), file_name=file_name),
             media_type="application/octet-stream",
-            headers={"Content-Disposition": f'attachment; filename="{filename_with_extension}"'},
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename_with_extension}"',
+                "Content-Length": str(file_size),
+            },
         )
 
     except HTTPException:
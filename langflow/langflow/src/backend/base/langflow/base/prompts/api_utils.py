@@ -1,12 +1,13 @@
 from collections import defaultdict
+from functools import lru_cache
 from typing import Any
 
 from fastapi import HTTPException
 from langchain_core.prompts import PromptTemplate
 from loguru import logger
 
+from langflow.base.prompts.formatter import get_prompt_formatter
 from langflow.inputs.inputs import DefaultPromptField
-from langflow.interface.utils import extract_input_variables_from_prompt
 
 _INVALID_CHARACTERS = {
     " ",
@@ -123,7 +124,13 @@ def _check_input_variables(input_variables):
 
 
 def validate_prompt(prompt_template: str, *, silent_errors: bool = False) -> list[str]:
-    input_variables = extract_input_variables_from_prompt(prompt_template)
+    return list(_validate_prompt(prompt_template, silent_errors=silent_errors))
+
+
+@lru_cache(maxsize=256)
+def _validate_prompt(prompt_template: str, *, silent_errors: bool) -> tuple[str, ...]:
+    """Validates a prompt once per template, since every update of a prompt field validates it again."""
+    input_variables = list(get_prompt_formatter(prompt_template).variables)
 
     # Check if there are invalid characters in the input_variables
     input_variables = _check_input_variables(input_variables)
@@ -139,7 +146,7 @@ def validate_prompt(prompt_template: str, *, silent_errors: bool = False) -> lis
         if not silent_errors:
             raise ValueError(msg) from exc
 
-    return input_variables
+    return tuple(input_variables)
 
 
 def get_old_custom_fields(custom_fields, name):
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from functools import lru_cache, partial
+from string import Formatter
+from typing import Any
+
+from langchain_core.utils.formatting import formatter
+
+
+class PromptFormatter:
+    """A prompt template parsed once, holding its variables and the parts to join when it is formatted.
+
+    Formats like `PromptTemplate.from_template(template).format(**kwargs)`, which parses the template again on
+    every call. Templates whose fields only name a variable are formatted by joining their literal parts with
+    the values, the others (attribute access, conversions or format specs) fall back to LangChain's formatter.
+    """
+
+    __slots__ = ("_fallback", "_plan", "template", "variables")
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        # Raises ValueError for malformed templates, like PromptTemplate.from_template
+        fields = list(Formatter().parse(template))
+        self.variables: tuple[str, ...] = tuple(dict.fromkeys(name for _, name, _, _ in fields if name))
+        self._plan: tuple[tuple[str, str | None], ...] = tuple((literal, name) for literal, name, _, _ in fields)
+        simple = all(
+            name is None or (name.isidentifier() and not spec and not conversion)
+            for _, name, spec, conversion in fields
+        )
+        self._fallback = None if simple else partial(formatter.format, template)
+
+    def format(self, **kwargs: Any) -> str:
+        if self._fallback is not None:
+            return self._fallback(**kwargs)
+        parts: list[str] = []
+        append = parts.append
+        for literal, name in self._plan:
+            append(literal)
+            if name is not None:
+                append(format(kwargs[name], ""))
+        return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def get_prompt_formatter(template: str) -> PromptFormatter:
+    return PromptFormatter(template)
@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 from langchain_core.documents import Document
 
 from langflow.schema.data import Data
@@ -24,29 +22,24 @@ def dict_values_to_string(d: dict) -> dict:
         d (dict): The dictionary whose values need to be converted.
 
     Returns:
-        dict: The dictionary with values converted to strings.
+        dict: A new dictionary with values converted to strings. Values that are not converted are not copied.
     """
     from langflow.schema.message import Message
 
-    # Do something similar to the above
-    d_copy = deepcopy(d)
-    for key, value in d_copy.items():
-        # it could be a list of data or documents or strings
-        if isinstance(value, list):
-            for i, item in enumerate(value):
-                if isinstance(item, Message):
-                    d_copy[key][i] = item.text
-                elif isinstance(item, Data):
-                    d_copy[key][i] = data_to_string(item)
-                elif isinstance(item, Document):
-                    d_copy[key][i] = document_to_string(item)
-        elif isinstance(value, Message):
-            d_copy[key] = value.text
-        elif isinstance(value, Data):
-            d_copy[key] = data_to_string(value)
-        elif isinstance(value, Document):
-            d_copy[key] = document_to_string(value)
-    return d_copy
+    def to_string(value):
+        if isinstance(value, Message):
+            return value.text
+        if isinstance(value, Data):
+            return data_to_string(value)
+        if isinstance(value, Document):
+            return document_to_string(value)
+        return value
+
+    # it could be a list of data or documents or strings
+    return {
+        key: [to_string(item) for item in value] if isinstance(value, list) else to_string(value)
+        for key, value in d.items()
+    }
 
 
 def document_to_string(document: Document) -> str:
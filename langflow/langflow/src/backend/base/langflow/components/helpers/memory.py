@@ -213,11 +213,11 @@ class MemoryComponent(Component):
                 sender=sender_type,
                 sender_name=sender_name,
                 session_id=session_id,
-                limit=10000,
-                order=order,
+                limit=n_messages or 10000,
+                order="DESC",
             )
-            if n_messages:
-                stored = stored[-n_messages:] if order == "ASC" else stored[:n_messages]
+            if order == "ASC":
+                stored = stored[::-1]
 
         # self.status = stored
         return cast(Data, stored)
@@ -253,11 +253,11 @@ class DataFrameOperationsComponent(Component):
         elif operator == "not equals":
             mask = column != filter_value
         elif operator == "contains":
-            mask = column.astype(str).str.contains(str(filter_value), na=False)
+            mask = self._as_strings(column).str.contains(str(filter_value), na=False)
         elif operator == "starts with":
-            mask = column.astype(str).str.startswith(str(filter_value), na=False)
+            mask = self._as_strings(column).str.startswith(str(filter_value), na=False)
         elif operator == "ends with":
-            mask = column.astype(str).str.endswith(str(filter_value), na=False)
+            mask = self._as_strings(column).str.endswith(str(filter_value), na=False)
         elif operator == "greater than":
             try:
                 # Try to convert filter_value to numeric for comparison
@@ -279,6 +279,16 @@ class DataFrameOperationsComponent(Component):
 
         return DataFrame(df[mask])
 
+    @staticmethod
+    def _as_strings(column: pd.Series) -> pd.Series:
+        # String columns of Arrow-backed DataFrames are searched with pyarrow compute as they are,
+        # converting them to Python strings first would take longer than the search
+        dtype = column.dtype
+        is_arrow = isinstance(dtype, pd.ArrowDtype) or getattr(dtype, "storage", None) in {"pyarrow", "pyarrow_numpy"}
+        if is_arrow and pd.api.types.is_string_dtype(dtype):
+            return column
+        return column.astype(str)
+
     def sort_by_column(self, df: DataFrame) -> DataFrame:
         return DataFrame(df.sort_values(by=self.column_name, ascending=self.ascending))
 
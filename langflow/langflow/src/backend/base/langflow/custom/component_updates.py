@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+from cachetools import LRUCache
+
+from langflow.custom.custom_component.component import Component
+from langflow.custom.utils import build_custom_component_template
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+    from uuid import UUID
+
+    from langflow.custom.custom_component.custom_component import CustomComponent
+
+T = TypeVar("T")
+
+
+class _TemplateEntry(NamedTuple):
+    class_object: type[Component]
+    component_node: dict[str, Any]
+
+
+class ComponentTemplateCache:
+    """Keeps the frontend node built from the code of a component, for the updates sent while editing it.
+
+    Every change of a field in the editor sends the code of the component, which used to be evaluated and
+    turned into a frontend node on each request. The node only depends on the code, so it is built once per
+    code and copied for each update, along with a new instance of the evaluated class. Components defined
+    with a `build_config` method are not cached, since their template can depend on the user.
+    """
+
+    def __init__(self, max_size: int = 64) -> None:
+        self.enabled = max_size > 0
+        self._entries: LRUCache[str, _TemplateEntry] = LRUCache(maxsize=max(max_size, 1))
+        self._lock = threading.Lock()
+
+    def build(self, code: str, user_id: str | UUID | None = None) -> tuple[dict, CustomComponent | Component]:
+        """Returns the frontend node of the code and a new instance, like `build_custom_component_template`."""
+        if not self.enabled:
+            return build_custom_component_template(Component(_code=code), user_id=user_id)
+
+        key = hashlib.sha256(code.encode()).hexdigest()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            return copy.deepcopy(entry.component_node), entry.class_object(_user_id=user_id, _code=code)
+
+        component_node, instance = build_custom_component_template(Component(_code=code), user_id=user_id)
+        if isinstance(instance, Component):
+            with self._lock:
+                self._entries[key] = _TemplateEntry(type(instance), copy.deepcopy(component_node))
+        return component_node, instance
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _PendingUpdate:
+    """The latest update of a node, followed by the requests of the updates it superseded."""
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+
+
+class BuildConfigUpdateCoalescer:
+    """Runs the build config updates of a key one at a time, cancelling the ones a newer update supersedes.
+
+    The editor sends an update for every change of a field, so a burst of keystrokes produces many requests
+    for the same field of a node whose results are thrown away but the last. When an update arrives for a key
+    that is still running one, the running one is cancelled, and the requests waiting for it get the result of
+    the newer update instead.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Hashable, _PendingUpdate] = {}
+
+    async def run(self, key: Hashable | None, update: Callable[[], Awaitable[T]]) -> T:
+        if key is None:
+            return await update()
+
+        task = asyncio.ensure_future(update())
+        pending = self._pending.get(key)
+        if pending is None or pending.task.done():
+            pending = self._pending[key] = _PendingUpdate(task)
+        else:
+            pending.task.cancel()
+            pending.task = task
+        task.add_done_callback(lambda done: self._forget(key, pending, done))
+
+        while True:
+            current = pending.task
+            try:
+                return await asyncio.shield(current)
+            except asyncio.CancelledError:
+                # Updates are only cancelled when superseded, otherwise the request itself was cancelled
+                if current.cancelled() and pending.task is not current:
+                    continue
+                raise
+
+    def _forget(self, key: Hashable, pending: _PendingUpdate, task: asyncio.Future) -> None:
+        if pending.task is task and self._pending.get(key) is pending:
+            del self._pending[key]
+
+
+@lru_cache(maxsize=1)
+def get_component_template_cache() -> ComponentTemplateCache:
+    from langflow.services.deps import get_settings_service
+
+    return ComponentTemplateCache(max_size=get_settings_service().settings.component_template_cache_max_size)
+
+
+@lru_cache(maxsize=1)
+def get_build_config_update_coalescer() -> BuildConfigUpdateCoalescer:
+    return BuildConfigUpdateCoalescer()
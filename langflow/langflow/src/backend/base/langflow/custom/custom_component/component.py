@@ -12,6 +12,7 @@ from uuid import UUID
 import nanoid
 import pandas as pd
 import yaml
+from cachetools import TTLCache
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, ValidationError
 
@@ -35,6 +36,7 @@ from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
 from langflow.schema.message import ErrorMessage, Message
 from langflow.schema.properties import Source
+from langflow.services.tracing.profiler import profile_span
 from langflow.services.tracing.schema import Log
 from langflow.template.field.base import UNDEFINED, Input, Output
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode
@@ -71,6 +73,13 @@ BACKWARDS_COMPATIBLE_ATTRIBUTES = ["user_id", "vertex", "tracing_service"]
 CONFIG_ATTRIBUTES = ["_display_name", "_description", "_icon", "_name", "_metadata"]
 
 
+def _copy_template_field(field: InputTypes | Output) -> InputTypes | Output:
+    """Copies an input or output definition, duplicating its mutable containers so instances don't share them."""
+    return field.model_copy(
+        update={key: value.copy() for key, value in field.__dict__.items() if isinstance(value, list | dict)}
+    )
+
+
 class PlaceholderGraph(NamedTuple):
     """A placeholder graph structure for components, providing backwards compatibility.
 
@@ -334,6 +343,50 @@ class Component(CustomComponent):
         memo[id(self)] = new_component
         return new_component
 
+    def clone(self, **config) -> Component:
+        """Creates a new instance of this component for a new run without calling ``__init__`` again.
+
+        Inputs and outputs are shallow copies of the ones of this instance, and all the per-run state
+        (results, artifacts, logs, output values and context) starts empty.
+
+        Args:
+            **config: The ``_``-prefixed configuration (e.g. ``_vertex``, ``_id``) of the new instance.
+
+        Returns:
+            Component: The new component instance.
+        """
+        new_component = object.__new__(type(self))
+        new_component.__dict__.update(self.__dict__)
+        new_component.__dict__.update(
+            {
+                "_inputs": {name: _copy_template_field(input_) for name, input_ in self._inputs.items()},
+                "_outputs_map": {name: _copy_template_field(output) for name, output in self._outputs_map.items()},
+                "_results": {},
+                "_artifacts": {},
+                "_attributes": {},
+                "_outputs": [],
+                "_output_logs": {},
+                "_logs": [],
+                "_ctx": {},
+                "_metadata": dict(self._metadata),
+                "_edges": [],
+                "_components": [],
+                "_current_output": "",
+                "_event_manager": None,
+                "_state_model": None,
+                "field_config": dict(self.field_config),
+                "status": None,
+                "repr_value": "",
+                "cache": TTLCache(maxsize=1024, ttl=60),
+                "_Component__inputs": {},
+                "_Component__config": {**self.__config, **config},
+            }
+        )
+        # Bypass BaseComponent.__setattr__, the user_id of a fresh instance is not set yet
+        new_component.__dict__.update(config)
+        new_component._reset_all_output_values()
+        return new_component
+
     def set_class_code(self) -> None:
         # Get the source code of the calling class
         if self._code:
@@ -1149,7 +1202,8 @@ class Component(CustomComponent):
 
         method = getattr(self, output.method)
         try:
-            result = await method() if inspect.iscoroutinefunction(method) else await asyncio.to_thread(method)
+            async with profile_span(f"{self.__class__.__name__}.{output.method}", "output"):
+                result = await method() if inspect.iscoroutinefunction(method) else await asyncio.to_thread(method)
         except TypeError as e:
             msg = f'Error running method "{output.method}": {e}'
             raise TypeError(msg) from e
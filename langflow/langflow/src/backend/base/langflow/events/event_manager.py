@@ -7,11 +7,13 @@ import uuid
 from functools import partial
 from typing import TYPE_CHECKING
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from loguru import logger
 from typing_extensions import Protocol
 
 from langflow.schema.playground_events import create_event_by_type
+from langflow.services.tracing.profiler import profile_span
 
 if TYPE_CHECKING:
     import asyncio
@@ -73,11 +75,21 @@ class EventManager:
             logger.debug(f"Error creating playground event: {e}")
         except Exception:
             raise
-        jsonable_data = jsonable_encoder(data)
-        json_data = {"event": event_type, "data": jsonable_data}
         event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        with profile_span(event_type, "events"):
+            try:
+                # orjson handles JSON-native data directly and only hands other objects (e.g. pydantic models)
+                # to jsonable_encoder, so already serialized payloads aren't walked again.
+                encoded_data = (
+                    orjson.dumps(
+                        {"event": event_type, "data": data}, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS
+                    )
+                    + b"\n\n"
+                )
+            except TypeError:
+                json_data = {"event": event_type, "data": jsonable_encoder(data)}
+                encoded_data = (json.dumps(json_data) + "\n\n").encode("utf-8")
+        self.queue.put_nowait((event_id, encoded_data, time.time()))
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -21,7 +21,7 @@ from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
-from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
+from langflow.graph.graph.schema import GraphData, GraphDiff, GraphDump, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_model import create_state_model_from_graph
 from langflow.graph.graph.utils import (
     find_all_cycle_edges,
@@ -36,11 +36,13 @@ from langflow.graph.utils import log_vertex_build
 from langflow.graph.vertex.base import Vertex, VertexStates
 from langflow.graph.vertex.schema import NodeData, NodeTypeEnum
 from langflow.graph.vertex.vertex_types import ComponentVertex, InterfaceVertex, StateVertex
+from langflow.interface.initialize.loading import prefetch_load_from_db_variables
 from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_settings_service, get_tracing_service
+from langflow.services.tracing.profiler import profile_span, profile_store
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -52,6 +54,7 @@ if TYPE_CHECKING:
     from langflow.graph.edge.schema import EdgeData
     from langflow.graph.schema import ResultData
     from langflow.services.chat.schema import GetCache, SetCache
+    from langflow.services.tracing.profiler import RunProfile
     from langflow.services.tracing.service import TracingService
 
 
@@ -94,6 +97,9 @@ class Graph:
         self._is_state_vertices: list[str] | None = None
         self.has_session_id_vertices: list[str] = []
         self._sorted_vertices_layers: list[list[str]] = []
+        # The arguments the layers were sorted with, and whether apply_diff left them valid
+        self._sorted_layers_args: tuple[str | None, str | None] | None = None
+        self._keep_sorted_layers = False
         self._run_id = ""
         self._session_id = ""
         self._start_time = datetime.now(timezone.utc)
@@ -125,6 +131,7 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        self._profile: RunProfile | None = None
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -551,6 +558,30 @@ class Graph:
         """Resets the activated vertices in the graph."""
         self.activated_vertices = []
 
+    def reset_run_state(self) -> None:
+        """Resets what a run left on the graph, so that it can run again from the start with a new run ID.
+
+        The vertices get the params of their data back and all but the frozen ones are reset to be built again.
+        The context is cleared, as components like the Loop keep their state for the run in it.
+        """
+        self._context = dotdict()
+        self.run_manager = RunnableVerticesManager()
+        for vertex_id in self.cycle_vertices:
+            self.run_manager.add_to_cycle_vertices(vertex_id)
+        self.reset_inactivated_vertices()
+        self.reset_activated_vertices()
+        self._call_order = []
+        self._snapshots = []
+        self._profile = None
+        for vertex in self.vertices:
+            # The inputs and session ID of the last run were set on the params
+            vertex.updated_raw_params = False
+            vertex.build_params()
+        self._reset_vertices_and_successors(set(self.vertex_map))
+        self._set_cache_to_vertices_in_cycle()
+        self._set_cache_if_listen_notify_components()
+        self.set_run_id()
+
     def validate_stream(self) -> None:
         """Validates the stream configuration of the graph.
 
@@ -618,6 +649,8 @@ class Graph:
     async def initialize_run(self) -> None:
         if not self._run_id:
             self.set_run_id()
+        if get_settings_service().settings.profile_runs:
+            self._profile = profile_store.start(self._run_id, user_id=self.user_id, name=self.flow_name or "run")
         if self.tracing_service:
             run_name = f"{self.flow_name} - {self.flow_id}"
             await self.tracing_service.start_tracers(
@@ -626,6 +659,16 @@ class Graph:
                 user_id=self.user_id,
                 session_id=self.session_id,
             )
+        await self._prefetch_variables()
+
+    async def _prefetch_variables(self) -> None:
+        """Fetch the variables used by the components at once, before they are built one by one."""
+        if not self.user_id:
+            return
+        try:
+            await prefetch_load_from_db_variables(self.vertices, self.user_id)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"Could not prefetch the variables of the flow: {e}")
 
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
         task = asyncio.create_task(self.end_all_traces(outputs, error))
@@ -646,6 +689,8 @@ class Graph:
         return async_end_traces_func
 
     async def end_all_traces(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
+        if self._profile is not None:
+            self._profile.finish()
         if not self.tracing_service:
             return
         self._end_time = datetime.now(timezone.utc)
@@ -1038,6 +1083,9 @@ class Graph:
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
         self.__dict__.update(state)
+        self._sorted_layers_args = None
+        self._keep_sorted_layers = False
+        self._profile = None
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.tracing_service = get_tracing_service()
         self.set_run_id(self._run_id)
@@ -1161,6 +1209,151 @@ class Graph:
         self.increment_update_count()
         return self
 
+    def apply_diff(self, payload: dict) -> GraphDiff:
+        """Updates the graph to a new version of its flow, rebuilding only the vertices that changed.
+
+        Nodes are compared by their data, so moving a node doesn't change it. Changed and added nodes get
+        new vertices and only the edges touching them are built again, unless the edges changed. The layers
+        are kept for the next `sort_vertices` call if the vertices and edges are the same. The changed
+        vertices and their successors are reset to be built again, while the others keep their results.
+
+        Args:
+            payload: The new flow data, with its nodes and edges.
+
+        Returns:
+            GraphDiff: The vertices added, removed, changed and reset, and whether the edges changed.
+        """
+        if "data" in payload:
+            payload = payload["data"]
+        nodes, edges = payload["nodes"], payload["edges"]
+        if any(node.get("data", {}).get("node", {}).get("flow") for node in nodes):
+            # Group nodes are replaced by the nodes they contain, in a copy of the payload
+            graph_data = process_flow({"nodes": nodes, "edges": edges})
+        else:
+            graph_data = {"nodes": nodes, "edges": edges}
+
+        old_nodes = {node["id"]: node for node in self._vertices if node.get("type") != NodeTypeEnum.NoteNode}
+        new_nodes = {node["id"]: node for node in graph_data["nodes"] if node.get("type") != NodeTypeEnum.NoteNode}
+        added = new_nodes.keys() - old_nodes.keys()
+        removed = old_nodes.keys() - new_nodes.keys()
+        changed = {
+            vertex_id
+            for vertex_id in old_nodes.keys() & new_nodes.keys()
+            if old_nodes[vertex_id]["data"] != new_nodes[vertex_id]["data"]
+        }
+        rebuilt = added | changed
+        old_edges = {self._edge_key(edge): edge for edge in self._edges}
+        new_edges = {self._edge_key(edge): edge for edge in graph_data["edges"]}
+        edges_changed = old_edges.keys() != new_edges.keys()
+
+        # The vertices keep the data they were built from, so the payload is copied unless it already was
+        copy_data = graph_data["nodes"] is nodes
+        self.raw_graph_data = {"nodes": nodes, "edges": edges}
+        self._vertices = [
+            old_nodes[node["id"]]
+            if node["id"] in old_nodes and node["id"] not in changed
+            else (copy.deepcopy(node) if copy_data else node)
+            for node in graph_data["nodes"]
+        ]
+        self._edges = [
+            old_edges.get(key) or (copy.deepcopy(edge) if copy_data else edge) for key, edge in new_edges.items()
+        ]
+        self.top_level_vertices = [node["id"] for node in nodes if node.get("id")]
+        if edges_changed:
+            self._cycle_vertices = None
+            self._cycles = None
+            self._is_cyclic = None
+
+        for vertex_id in removed | changed:
+            self.vertex_map.pop(vertex_id)
+        for node in self._vertices:
+            if node["id"] in rebuilt:
+                self.vertex_map[node["id"]] = self._create_vertex(node)
+        self.vertices = [self.vertex_map[node["id"]] for node in self._vertices if node["id"] in self.vertex_map]
+
+        # Edges only keep the ids of their vertices, but are validated against them
+        if edges_changed:
+            for vertex in self.vertices:
+                vertex.has_cycle_edges = False
+            self.edges = self._build_edges()
+        elif rebuilt:
+            kept_edges = [
+                edge for edge in self.edges if edge.source_id not in rebuilt and edge.target_id not in rebuilt
+            ]
+            rebuilt_edges = {
+                self.build_edge(edge)
+                for edge in self._edges
+                if edge["data"]["sourceHandle"]["id"] in rebuilt or edge["data"]["targetHandle"]["id"] in rebuilt
+            }
+            self.edges = kept_edges + list(rebuilt_edges)
+        self.build_graph_maps()
+
+        # The params of a vertex hold the vertices connected to it
+        changed_edge_ends = {vertex_id for key in old_edges.keys() ^ new_edges.keys() for vertex_id in key[:2]}
+        neighbors = {
+            neighbor_id
+            for vertex_id in rebuilt | changed_edge_ends
+            for neighbor_id in chain(self.predecessor_map.get(vertex_id, []), self.successor_map.get(vertex_id, []))
+        }
+        for vertex_id in (rebuilt | changed_edge_ends | neighbors) & self.vertex_map.keys():
+            vertex = self.vertex_map[vertex_id]
+            vertex._incoming_edges = None
+            vertex._outgoing_edges = None
+            vertex.updated_raw_params = False
+            vertex.set_top_level(self.top_level_vertices)
+            vertex.build_params()
+        dirty = self._reset_vertices_and_successors(rebuilt | {key[1] for key in old_edges.keys() ^ new_edges.keys()})
+        self._set_cache_to_vertices_in_cycle()
+        self._set_cache_if_listen_notify_components()
+        for vertex_id in self.cycle_vertices:
+            self.run_manager.add_to_cycle_vertices(vertex_id)
+
+        self._is_input_vertices = []
+        self._is_output_vertices = []
+        self.has_session_id_vertices = []
+        self._is_state_vertices = None
+        self.define_vertices_lists()
+
+        if edges_changed or added or removed:
+            self._sorted_vertices_layers = []
+            self.vertices_layers = []
+        self._keep_sorted_layers = bool(self._sorted_vertices_layers)
+        self.increment_update_count()
+        return GraphDiff(added=added, removed=removed, changed=changed, dirty=dirty, edges_changed=edges_changed)
+
+    @staticmethod
+    def _edge_key(edge: EdgeData) -> tuple[str, str, str]:
+        """The vertices an edge connects and its handles, which the rest of the edge data doesn't matter for."""
+        return (
+            edge["data"]["sourceHandle"]["id"],
+            edge["data"]["targetHandle"]["id"],
+            json.dumps(edge["data"], sort_keys=True),
+        )
+
+    def _reset_vertices_and_successors(self, vertex_ids: set[str]) -> set[str]:
+        """Resets the results of vertices and of all their successors, except the frozen ones, and returns their ids.
+
+        The successors of a frozen vertex are not reset, since its results don't change. The reset vertices get
+        new component instances, as components can keep attributes they set while building.
+        """
+        reset: set[str] = set()
+        to_visit = deque(vertex_ids & self.vertex_map.keys())
+        while to_visit:
+            vertex_id = to_visit.popleft()
+            if vertex_id in reset:
+                continue
+            vertex = self.vertex_map[vertex_id]
+            if vertex.frozen and vertex.built:
+                continue
+            reset.add(vertex_id)
+            vertex.built = False
+            vertex.result = None
+            vertex.artifacts = {}
+            vertex.custom_component = None
+            vertex.instantiate_component(self.user_id)
+            to_visit.extend(self.successor_map.get(vertex_id, []))
+        return reset
+
     def update_vertex_from_another(self, vertex: Vertex, other_vertex: Vertex) -> None:
         """Updates a vertex from another vertex.
 
@@ -1571,6 +1764,8 @@ class Graph:
             layer_index += 1
 
         logger.debug("Graph processing complete")
+        if self._profile is not None:
+            self._profile.finish()
         return self
 
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
@@ -1605,7 +1800,7 @@ class Graph:
         v_id = vertex.id
         v_successors_ids = vertex.successors_ids
         self.run_manager.ran_at_least_once.add(v_id)
-        async with lock:
+        async with profile_span("next runnable vertices", "scheduling"), lock:
             self.run_manager.remove_vertex_from_runnables(v_id)
             next_runnable_vertices = self.find_next_runnable_vertices(v_successors_ids)
 
@@ -2024,20 +2219,27 @@ class Graph:
         """Sorts the vertices in the graph."""
         self.mark_all_vertices("ACTIVE")
 
-        first_layer, remaining_layers = get_sorted_vertices(
-            vertices_ids=self.get_vertex_ids(),
-            cycle_vertices=self.cycle_vertices,
-            stop_component_id=stop_component_id,
-            start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
-            in_degree_map=self.in_degree_map,
-            successor_map=self.successor_map,
-            predecessor_map=self.predecessor_map,
-            is_input_vertex=self.get_vertex_input_status,
-            get_vertex_predecessors=self.get_vertex_predecessors_ids,
-            get_vertex_successors=self.get_vertex_successors_ids,
-            is_cyclic=self.is_cyclic,
-        )
+        sort_args = (stop_component_id, start_component_id)
+        if self._keep_sorted_layers and sort_args == self._sorted_layers_args:
+            # The flow was patched by apply_diff without changing its vertices or edges
+            first_layer, *remaining_layers = self._sorted_vertices_layers
+        else:
+            first_layer, remaining_layers = get_sorted_vertices(
+                vertices_ids=self.get_vertex_ids(),
+                cycle_vertices=self.cycle_vertices,
+                stop_component_id=stop_component_id,
+                start_component_id=start_component_id,
+                graph_dict=self.__to_dict(),
+                in_degree_map=self.in_degree_map,
+                successor_map=self.successor_map,
+                predecessor_map=self.predecessor_map,
+                is_input_vertex=self.get_vertex_input_status,
+                get_vertex_predecessors=self.get_vertex_predecessors_ids,
+                get_vertex_successors=self.get_vertex_successors_ids,
+                is_cyclic=self.is_cyclic,
+            )
+        self._keep_sorted_layers = False
+        self._sorted_layers_args = sort_args
 
         self.increment_run_count()
         self._sorted_vertices_layers = [first_layer, *remaining_layers]
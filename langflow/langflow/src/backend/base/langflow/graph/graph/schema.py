@@ -41,6 +41,17 @@ class VertexBuildResult(NamedTuple):
     vertex: Vertex
 
 
+class GraphDiff(NamedTuple):
+    """The changes `Graph.apply_diff` made to a graph."""
+
+    added: set[str]
+    removed: set[str]
+    changed: set[str]
+    # The vertices whose results were reset, the added and changed ones and their successors
+    dirty: set[str]
+    edges_changed: bool
+
+
 class OutputConfigDict(TypedDict):
     cache: bool
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Generator
 from enum import Enum
+from functools import partial
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -18,6 +19,7 @@ from langflow.services.database.models.vertex_builds.crud import log_vertex_buil
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase
 from langflow.services.database.utils import session_getter
 from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.tracing.profiler import profile_span
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
@@ -155,11 +157,17 @@ async def log_transaction(
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
-        async with session_getter(get_db_service()) as session:
-            with session.no_autoflush:
-                inserted = await crud_log_transaction(session, transaction)
-                if inserted:
-                    logger.debug(f"Logged transaction: {inserted.id}")
+        db_service = get_db_service()
+        if db_service.writer is not None:
+            inserted = await db_service.writer.write(
+                partial(crud_log_transaction, transaction=transaction, commit=False)
+            )
+        else:
+            async with session_getter(db_service) as session:
+                with session.no_autoflush:
+                    inserted = await crud_log_transaction(session, transaction)
+        if inserted:
+            logger.debug(f"Logged transaction: {inserted.id}")
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Error logging transaction: {exc!s}")
 
@@ -172,10 +180,12 @@ async def log_vertex_build(
     params: Any,
     data: ResultDataResponse | dict,
     artifacts: dict | None = None,
+    serialized: bool = False,
 ) -> None:
     """Asynchronously logs a vertex build record to the database if vertex build storage is enabled.
 
-    Serializes the provided data and artifacts with configurable length and item limits before storing.
+    Serializes the provided data and artifacts with configurable length and item limits before storing,
+    unless ``serialized`` is set because they were already serialized (e.g. for the build events).
     Converts parameters to string if present. Handles exceptions by logging errors.
     """
     try:
@@ -188,17 +198,25 @@ async def log_vertex_build(
             msg = f"Invalid flow_id passed to log_vertex_build: {flow_id!r}(type: {type(flow_id)})"
             raise ValueError(msg) from None
 
+        max_length, max_items = get_max_text_length(), get_max_items_length()
         vertex_build = VertexBuildBase(
             flow_id=flow_id,
             id=vertex_id,
             valid=valid,
             params=str(params) if params else None,
-            data=serialize(data, max_length=get_max_text_length(), max_items=get_max_items_length()),
-            artifacts=serialize(artifacts, max_length=get_max_text_length(), max_items=get_max_items_length()),
+            data=data if serialized else serialize(data, max_length=max_length, max_items=max_items),
+            artifacts=artifacts if serialized else serialize(artifacts, max_length=max_length, max_items=max_items),
         )
-        async with session_getter(get_db_service()) as session:
-            inserted = await crud_log_vertex_build(session, vertex_build)
-            logger.debug(f"Logged vertex build: {inserted.build_id}")
+        db_service = get_db_service()
+        async with profile_span(f"log build {vertex_id}", "persistence"):
+            if db_service.writer is not None:
+                inserted = await db_service.writer.write(
+                    partial(crud_log_vertex_build, vertex_build=vertex_build, commit=False)
+                )
+            else:
+                async with session_getter(db_service) as session:
+                    inserted = await crud_log_vertex_build(session, vertex_build)
+        logger.debug(f"Logged vertex build: {inserted.build_id}")
     except Exception:  # noqa: BLE001
         logger.exception("Error logging vertex build")
 
@@ -21,6 +21,7 @@ from langflow.schema.data import Data
 from langflow.schema.message import Message
 from langflow.schema.schema import INPUT_FIELD_NAME, OutputValue, build_output_logs
 from langflow.services.deps import get_storage_service
+from langflow.services.tracing.profiler import profile_span
 from langflow.utils.schemas import ChatOutputResponse
 from langflow.utils.util import sync_to_async
 
@@ -718,7 +719,7 @@ class Vertex:
             await ensure_component_loaded(self.vertex_type, component_name, get_settings_service())
 
         # Continue with the original implementation
-        async with self._lock:
+        async with profile_span(f"build {self.id}", "component"), self._lock:
             if self.state == VertexStates.INACTIVE:
                 # If the vertex is inactive, return None
                 self.build_inactive()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
@@ -91,7 +92,21 @@ async def run_flow(
         msg = "Session is invalid"
         raise ValueError(msg)
     if graph is None:
-        graph = await load_flow(user_id, flow_id, flow_name, tweaks)
+        from langflow.helpers.subflow_cache import get_subflow_graph_cache
+
+        async with get_subflow_graph_cache().checkout(user_id, flow_id, flow_name, tweaks) as subflow_graph:
+            return await _arun_flow_graph(subflow_graph, inputs, output_type, user_id, run_id, session_id)
+    return await _arun_flow_graph(graph, inputs, output_type, user_id, run_id, session_id)
+
+
+async def _arun_flow_graph(
+    graph: Graph,
+    inputs: dict | list[dict] | None,
+    output_type: str | None,
+    user_id: str,
+    run_id: str | None,
+    session_id: str | None,
+) -> list[RunOutputs]:
     if run_id:
         graph.set_run_id(UUID(run_id))
     if session_id:
@@ -251,12 +266,17 @@ def build_schema_from_inputs(name: str, inputs: list[Vertex]) -> type[BaseModel]
         BaseModel: The schema model.
 
     """
-    fields = {}
-    for input_ in inputs:
-        field_name = input_.display_name.lower().replace(" ", "_")
-        description = input_.description
-        fields[field_name] = (str, Field(default="", description=description))
-    return create_model(name, **fields)
+    return _build_schema(
+        name, tuple((input_.display_name.lower().replace(" ", "_"), input_.description) for input_ in inputs)
+    )
+
+
+@lru_cache(maxsize=256)
+def _build_schema(name: str, fields: tuple[tuple[str, str], ...]) -> type[BaseModel]:
+    """Flow tools are built on every run, so the schemas of flows with the same inputs are reused."""
+    return create_model(
+        name, **{field_name: (str, Field(default="", description=description)) for field_name, description in fields}
+    )
 
 
 def get_arg_names(inputs: list[Vertex]) -> list[dict[str, str]]:
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import copy
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from cachetools import LRUCache
+from loguru import logger
+from sqlmodel import select
+
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.deps import session_scope
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from datetime import datetime
+
+    from langflow.graph.graph.base import Graph
+
+
+@dataclass
+class _SubflowEntry:
+    updated_at: datetime | None
+    payload: dict
+    idle_graphs: list[Graph] = field(default_factory=list)
+
+
+async def _get_flow_version(
+    user_id: str, flow_id: str | UUID | None, flow_name: str | None
+) -> tuple[UUID, datetime | None]:
+    """Returns the id and the last update time of a flow, without loading its data."""
+    async with session_scope() as session:
+        stmt = select(Flow.id, Flow.updated_at)
+        if flow_id:
+            stmt = stmt.where(Flow.id == (UUID(flow_id) if isinstance(flow_id, str) else flow_id))
+        else:
+            uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+            stmt = stmt.where(Flow.name == flow_name).where(Flow.user_id == uuid_user_id)
+        row = (await session.exec(stmt)).first()
+    if row is None:
+        msg = f"Flow {flow_id or flow_name} not found"
+        raise ValueError(msg)
+    return row[0], row[1]
+
+
+async def _load_flow_data(flow_id: UUID) -> dict:
+    async with session_scope() as session:
+        graph_data = flow.data if (flow := await session.get(Flow, flow_id)) else None
+    if not graph_data:
+        msg = f"Flow {flow_id} not found"
+        raise ValueError(msg)
+    return graph_data
+
+
+class SubflowGraphCache:
+    """Keeps the graphs of flows that are run from other flows, by Run Flow, Sub Flow and flows used as tools.
+
+    Every run of a subflow used to load the flow from the database and build a new graph from it, so an agent
+    calling a flow tool in a loop paid for both on each call. Entries are keyed by flow and user, and hold the
+    flow data and the graphs of finished runs. They are checked against the `updated_at` of the flow on every run
+    and dropped when the flow is saved. A run checks out one of the idle graphs, patches it with its tweaks using
+    `Graph.apply_diff` and resets its run state and session, and only builds a new graph when there is none.
+    """
+
+    def __init__(self, max_flows: int = 100, max_idle_graphs: int = 4) -> None:
+        self.enabled = max_flows > 0
+        self.max_idle_graphs = max_idle_graphs
+        self._entries: LRUCache[tuple[str, str], _SubflowEntry] = LRUCache(maxsize=max(max_flows, 1))
+        self._lock = threading.Lock()
+
+    async def _get_entry(self, key: tuple[str, str], flow_id: UUID, updated_at: datetime | None) -> _SubflowEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.updated_at == updated_at:
+            return entry
+        entry = _SubflowEntry(updated_at=updated_at, payload=await _load_flow_data(flow_id))
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def _take_idle_graph(self, entry: _SubflowEntry) -> Graph | None:
+        with self._lock:
+            return entry.idle_graphs.pop() if entry.idle_graphs else None
+
+    def _release(self, key: tuple[str, str], entry: _SubflowEntry, graph: Graph) -> None:
+        with self._lock:
+            if self._entries.get(key) is entry and len(entry.idle_graphs) < self.max_idle_graphs:
+                entry.idle_graphs.append(graph)
+
+    @asynccontextmanager
+    async def checkout(
+        self,
+        user_id: str,
+        flow_id: str | UUID | None = None,
+        flow_name: str | None = None,
+        tweaks: dict | None = None,
+    ) -> AsyncIterator[Graph]:
+        """Yields a graph of the flow, with the tweaks applied, that belongs to the caller until the block exits.
+
+        The graph is kept for later runs when the block exits without an error.
+        """
+        from langflow.graph.graph.base import Graph
+        from langflow.helpers.flow import load_flow
+        from langflow.processing.process import process_tweaks
+
+        if not self.enabled:
+            yield await load_flow(user_id, str(flow_id) if flow_id else None, flow_name, tweaks)
+            return
+
+        if not flow_id and not flow_name:
+            msg = "Flow ID or Flow Name is required"
+            raise ValueError(msg)
+        flow_uuid, updated_at = await _get_flow_version(user_id, flow_id, flow_name)
+        key = (str(flow_uuid), str(user_id))
+        entry = await self._get_entry(key, flow_uuid, updated_at)
+
+        def tweaked_payload() -> dict:
+            payload = copy.deepcopy(entry.payload)
+            return process_tweaks(graph_data=payload, tweaks=tweaks) if tweaks else payload
+
+        graph = self._take_idle_graph(entry)
+        if graph is not None:
+            try:
+                graph.apply_diff(tweaked_payload())
+                graph.reset_run_state()
+                # The session of the last caller would be used by callers that don't pass one
+                graph.session_id = ""
+            except Exception:  # noqa: BLE001
+                logger.debug(f"Could not reuse a graph of flow {flow_uuid}, building a new one", exc_info=True)
+                graph = None
+        if graph is None:
+            graph = Graph.from_payload(tweaked_payload(), flow_id=str(flow_uuid), user_id=user_id)
+
+        yield graph
+        self._release(key, entry, graph)
+
+    def invalidate(self, flow_id: str | UUID | None = None) -> None:
+        """Drops the entries of a flow, or of all flows if no flow id is given."""
+        with self._lock:
+            if flow_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == str(flow_id)]:
+                del self._entries[key]
+
+
+@lru_cache(maxsize=1)
+def get_subflow_graph_cache() -> SubflowGraphCache:
+    from langflow.services.deps import get_settings_service
+
+    return SubflowGraphCache(max_flows=get_settings_service().settings.subflow_graph_cache_max_flows)
@@ -1,15 +1,19 @@
 import asyncio
 import copy
+import hashlib
 import io
 import json
 import re
 import shutil
+import time
 import zipfile
 from collections import defaultdict
+from collections.abc import AsyncIterator, Collection, Iterable
+from contextlib import aclosing
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from tempfile import TemporaryDirectory, gettempdir
 from typing import AnyStr
 from uuid import UUID
 
@@ -19,6 +23,7 @@ import orjson
 import sqlalchemy as sa
 from aiofile import async_open
 from emoji import demojize, purely_emoji
+from filelock import FileLock
 from loguru import logger
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import selectinload
@@ -1056,48 +1061,158 @@ async def get_or_create_default_folder(session: AsyncSession, user_id: UUID) ->
     return FolderRead.model_validate(folder_obj, from_attributes=True)
 
 
+FS_FLOW_SYNC_FIELDS = ("name", "description", "data", "locked")
+
+
+def _get_fs_flows_sync_lock(database_url: str) -> FileLock:
+    """Return the host-wide lock that elects the worker responsible for syncing flows from the file system.
+
+    The lock is scoped to the database so that separate Langflow instances on the same host don't block each other.
+    It is not thread-local, as it is acquired in a worker thread and released from the event loop.
+    """
+    db_hash = hashlib.sha256(database_url.encode()).hexdigest()[:16]
+    return FileLock(Path(gettempdir()) / f"langflow_fs_flows_sync_{db_hash}.lock", thread_local=False)
+
+
+async def _load_fs_flow_paths() -> dict[str, UUID]:
+    """Return a mapping of absolute flow file paths to the ids of the flows stored in them."""
+    async with session_scope() as session:
+        stmt = select(Flow.id, Flow.fs_path).where(col(Flow.fs_path).is_not(None))
+        rows = (await session.exec(stmt)).all()
+    return {str(Path(fs_path).absolute()): flow_id for flow_id, fs_path in rows}
+
+
+async def _find_modified_fs_flows(paths: Iterable[str], flow_mtimes: dict[str, float]) -> dict[str, float]:
+    """Return the paths (with their new mtime) that changed since they were last synced."""
+    modified = {}
+    for path in paths:
+        try:
+            new_mtime = (await anyio.Path(path).stat()).st_mtime
+        except FileNotFoundError:
+            continue
+        except OSError:
+            logger.exception(f"Error while handling flow file {path}")
+            continue
+        if new_mtime > flow_mtimes.get(path, 0):
+            modified[path] = new_mtime
+    return modified
+
+
+async def _sync_modified_fs_flows(
+    modified: dict[str, float], flow_paths: dict[str, UUID], flow_mtimes: dict[str, float]
+) -> None:
+    """Update the flows stored in the modified files using a single transaction."""
+    updates: dict[UUID, tuple[str, dict]] = {}
+    for path in modified:
+        try:
+            updates[flow_paths[path]] = (path, orjson.loads(await anyio.Path(path).read_text(encoding="utf-8")))
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Error while handling flow file {path}")
+    if not updates:
+        return
+
+    async with session_scope() as session:
+        flows = (await session.exec(select(Flow).where(col(Flow.id).in_(list(updates))))).all()
+        for flow in flows:
+            path, update_data = updates[flow.id]
+            try:
+                for field_name in FS_FLOW_SYNC_FIELDS:
+                    if new_value := update_data.get(field_name):
+                        setattr(flow, field_name, new_value)
+                if folder_id := update_data.get("folder_id"):
+                    flow.folder_id = UUID(folder_id)
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Couldn't update flow {flow.id} in database from path {path}")
+
+    for path, _ in updates.values():
+        flow_mtimes[path] = modified[path]
+
+
+async def _iter_fs_flow_changes(paths: Collection[str], interval: float, *, watch: bool) -> AsyncIterator[set[str]]:
+    """Yield the flow file paths that may have changed.
+
+    When ``watch`` is set and ``watchfiles`` is installed, native file system notifications are used and an empty
+    set is yielded every ``interval`` seconds without changes. Otherwise, all paths are yielded every ``interval``
+    seconds and callers are expected to compare modification times.
+    """
+    awatch = None
+    if watch:
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            logger.debug("watchfiles is not installed, falling back to polling for flow file changes")
+
+    directories = [
+        str(directory) for directory in {Path(path).parent for path in paths} if await anyio.Path(directory).is_dir()
+    ]
+    if awatch is None or not directories:
+        while True:
+            await asyncio.sleep(interval)
+            yield set(paths)
+
+    async for changes in awatch(
+        *directories,
+        debounce=50,
+        rust_timeout=max(int(interval * 1000), 1),
+        yield_on_timeout=True,
+        recursive=False,
+    ):
+        yield {path for _, path in changes if path in paths}
+
+
+async def _sync_flows_from_fs_as_leader(interval: float, *, watch: bool) -> None:
+    flow_mtimes: dict[str, float] = {}
+    flow_paths: dict[str, UUID] = {}
+    while True:
+        try:
+            # (Re)load the watched paths and check all of them once, so that changes made while the watcher
+            # was being (re)started aren't missed.
+            flow_paths = await _load_fs_flow_paths()
+            modified = await _find_modified_fs_flows(flow_paths, flow_mtimes)
+            await _sync_modified_fs_flows(modified, flow_paths, flow_mtimes)
+
+            last_refresh = time.monotonic()
+            async with aclosing(_iter_fs_flow_changes(flow_paths.keys(), interval, watch=watch)) as changes:
+                async for changed_paths in changes:
+                    if changed_paths:
+                        modified = await _find_modified_fs_flows(changed_paths, flow_mtimes)
+                        await _sync_modified_fs_flows(modified, flow_paths, flow_mtimes)
+                    if time.monotonic() - last_refresh >= interval:
+                        # Only ids and paths are loaded here, flows are read from disk when their file changes.
+                        if await _load_fs_flow_paths() != flow_paths:
+                            break
+                        last_refresh = time.monotonic()
+        except (sa.exc.OperationalError, ValueError) as e:
+            if "no active connection" in str(e) or "connection is closed" in str(e):
+                logger.debug("Database connection lost, assuming shutdown")
+                return  # Exit gracefully, don't error
+            raise  # Re-raise if it's a real connection problem
+        except Exception:  # noqa: BLE001
+            logger.exception("Error while syncing flows from database")
+            return
+
+
 async def sync_flows_from_fs():
-    flow_mtimes = {}
-    fs_flows_polling_interval = get_settings_service().settings.fs_flows_polling_interval / 1000
+    """Keep flows that are backed by a file on disk in sync with the content of that file.
+
+    Only one worker per host (and database) performs the sync. The others wait for the lock in case
+    the current leader goes away.
+    """
+    settings = get_settings_service().settings
+    fs_flows_polling_interval = settings.fs_flows_polling_interval / 1000
+    lock = _get_fs_flows_sync_lock(settings.database_url)
     try:
         while True:
             try:
-                async with session_scope() as session:
-                    stmt = select(Flow).where(col(Flow.fs_path).is_not(None))
-                    flows = (await session.exec(stmt)).all()
-                    for flow in flows:
-                        mtime = flow_mtimes.setdefault(flow.id, 0)
-                        path = anyio.Path(flow.fs_path)
-                        try:
-                            if await path.exists():
-                                new_mtime = (await path.stat()).st_mtime
-                                if new_mtime > mtime:
-                                    update_data = orjson.loads(await path.read_text(encoding="utf-8"))
-                                    try:
-                                        for field_name in ("name", "description", "data", "locked"):
-                                            if new_value := update_data.get(field_name):
-                                                setattr(flow, field_name, new_value)
-                                        if folder_id := update_data.get("folder_id"):
-                                            flow.folder_id = UUID(folder_id)
-                                        await session.commit()
-                                        await session.refresh(flow)
-                                    except Exception:  # noqa: BLE001
-                                        logger.exception(f"Couldn't update flow {flow.id} in database from path {path}")
-                                    flow_mtimes[flow.id] = new_mtime
-                        except Exception:  # noqa: BLE001
-                            logger.exception(f"Error while handling flow file {path}")
-            except asyncio.CancelledError:
-                logger.debug("Flow sync cancelled")
-                break
-            except (sa.exc.OperationalError, ValueError) as e:
-                if "no active connection" in str(e) or "connection is closed" in str(e):
-                    logger.debug("Database connection lost, assuming shutdown")
-                    break  # Exit gracefully, don't error
-                raise  # Re-raise if it's a real connection problem
-            except Exception:  # noqa: BLE001
-                logger.exception("Error while syncing flows from database")
-                break
-
-            await asyncio.sleep(fs_flows_polling_interval)
+                await asyncio.to_thread(lock.acquire, timeout=0)
+            except TimeoutError:
+                # Another worker is syncing flows
+                await asyncio.sleep(fs_flows_polling_interval)
+                continue
+            try:
+                await _sync_flows_from_fs_as_leader(fs_flows_polling_interval, watch=settings.fs_flows_watch)
+            finally:
+                lock.release()
+            break
     except asyncio.CancelledError:
         logger.debug("Flow sync task cancelled")
@@ -0,0 +1,82 @@
+"""A static manifest of the built-in components, generated when the package is built.
+
+Building the templates of the built-in components imports every module of `langflow.components` and with them
+every integration they depend on. The manifest stores the templates, and the module each component is defined
+in, so that startup and `/all` can skip the imports. Vertices are instantiated from the code in their template,
+so the dependencies of a component are only imported when a vertex of that type is first built.
+
+Generate it with `python -m langflow.interface.component_manifest`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from loguru import logger
+
+from langflow.services.settings.base import BASE_COMPONENTS_PATH
+
+MANIFEST_PATH = Path(BASE_COMPONENTS_PATH) / "component_manifest.json"
+
+
+def compute_components_fingerprint(components_path: str | Path = BASE_COMPONENTS_PATH) -> str:
+    """Hash the source of the built-in components, so a manifest is not used after they change."""
+    components_path = Path(components_path)
+    sha256_hash = hashlib.sha256()
+    for file_path in sorted(components_path.rglob("*.py")):
+        relative_path = file_path.relative_to(components_path)
+        if "deactivated" in relative_path.parts:
+            continue
+        sha256_hash.update(relative_path.as_posix().encode())
+        sha256_hash.update(file_path.read_bytes())
+    return sha256_hash.hexdigest()
+
+
+def write_component_manifest(
+    components: dict[str, dict[str, Any]],
+    modules: dict[str, dict[str, str]],
+    path: Path | None = None,
+) -> Path:
+    """Write the templates and modules of the built-in components, grouped by category."""
+    path = path or MANIFEST_PATH
+    manifest = {
+        "fingerprint": compute_components_fingerprint(),
+        "components": jsonable_encoder(components),
+        "modules": modules,
+    }
+    path.write_bytes(orjson.dumps(manifest))
+    return path
+
+
+def load_component_manifest(path: Path | None = None) -> dict[str, Any] | None:
+    """Load the manifest, or return None if there is none or it does not match the installed components."""
+    path = path or MANIFEST_PATH
+    if not path.exists():
+        return None
+    try:
+        manifest = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Could not read the component manifest at {path}: {e}")
+        return None
+    if manifest.get("fingerprint") != compute_components_fingerprint():
+        logger.debug(f"The component manifest at {path} is out of date")
+        return None
+    return manifest
+
+
+async def abuild_component_manifest(path: Path | None = None) -> Path:
+    """Import the built-in components and write their manifest."""
+    from langflow.interface.components import scan_langflow_components
+
+    components, modules = await scan_langflow_components()
+    return write_component_manifest(components, modules, path)
+
+
+if __name__ == "__main__":
+    manifest_path = asyncio.run(abuild_component_manifest())
+    logger.info(f"Wrote the component manifest to {manifest_path}")
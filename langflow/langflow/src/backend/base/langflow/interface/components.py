@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from langflow.custom.utils import abuild_custom_components, create_component_template
+from langflow.interface.component_manifest import load_component_manifest
 from langflow.services.settings.base import BASE_COMPONENTS_PATH
 
 if TYPE_CHECKING:
@@ -36,6 +37,24 @@ component_cache = ComponentCache()
 
 
 async def import_langflow_components():
+    """Asynchronously loads all built-in Langflow components.
+
+    Reads their templates from the component manifest when it matches the installed components, without
+    importing them. Otherwise scans the `langflow.components` package with `scan_langflow_components`.
+
+    Returns:
+        A dictionary with a "components" key mapping top-level package names to their component templates.
+    """
+    manifest = await asyncio.to_thread(load_component_manifest)
+    if manifest is not None:
+        logger.debug("Loaded the built-in components from the component manifest")
+        return {"components": manifest["components"]}
+
+    components, _ = await scan_langflow_components()
+    return {"components": components}
+
+
+async def scan_langflow_components() -> tuple[dict[str, dict], dict[str, dict[str, str]]]:
     """Asynchronously discovers and loads all built-in Langflow components with module-level parallelization.
 
     Scans the `langflow.components` package and its submodules in parallel, instantiates classes that are subclasses
@@ -43,14 +62,16 @@ async def import_langflow_components():
     top-level subpackage name.
 
     Returns:
-        A dictionary with a "components" key mapping top-level package names to their component templates.
+        A tuple of the component templates and of the modules the components are defined in, both mapping
+        top-level package names to component names.
     """
-    modules_dict = {}
+    modules_dict: dict[str, dict] = {}
+    component_modules: dict[str, dict[str, str]] = {}
     try:
         import langflow.components as components_pkg
     except ImportError as e:
         logger.error(f"Failed to import langflow.components package: {e}", exc_info=True)
-        return {"components": modules_dict}
+        return modules_dict, component_modules
 
     # Collect all module names to process
     module_names = []
@@ -60,7 +81,7 @@ async def import_langflow_components():
             module_names.append(modname)
 
     if not module_names:
-        return {"components": modules_dict}
+        return modules_dict, component_modules
 
     # Create tasks for parallel module processing
     tasks = [asyncio.to_thread(_process_single_module, modname) for modname in module_names]
@@ -70,10 +91,10 @@ async def import_langflow_components():
         module_results = await asyncio.gather(*tasks, return_exceptions=True)
     except Exception as e:  # noqa: BLE001
         logger.error(f"Error during parallel module processing: {e}", exc_info=True)
-        return {"components": modules_dict}
+        return modules_dict, component_modules
 
     # Merge results from all modules
-    for result in module_results:
+    for modname, result in zip(module_names, module_results, strict=True):
         if isinstance(result, Exception):
             logger.warning(f"Module processing failed: {result}")
             continue
@@ -81,11 +102,10 @@ async def import_langflow_components():
         if result and isinstance(result, tuple) and len(result) == EXPECTED_RESULT_LENGTH:
             top_level, components = result
             if top_level and components:
-                if top_level not in modules_dict:
-                    modules_dict[top_level] = {}
-                modules_dict[top_level].update(components)
+                modules_dict.setdefault(top_level, {}).update(components)
+                component_modules.setdefault(top_level, {}).update(dict.fromkeys(components, modname))
 
-    return {"components": modules_dict}
+    return modules_dict, component_modules
 
 
 def _process_single_module(modname: str) -> tuple[str, dict] | None:
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import orjson
+from cachetools import LRUCache
+
+from langflow.custom.eval import eval_custom_component_code
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.custom.custom_component.component import Component
+    from langflow.custom.custom_component.custom_component import CustomComponent
+    from langflow.graph.vertex.base import Vertex
+
+
+def _supports_cloning(class_object: type) -> bool:
+    """Whether instances of the class can be created with `Component.clone`.
+
+    Classes that override `__init__` may set up state that a clone would share with the prototype.
+    """
+    from langflow.custom.custom_component.component import Component
+
+    for klass in class_object.__mro__:
+        if klass is Component:
+            return True
+        if "__init__" in vars(klass):
+            return False
+    return False
+
+
+def _fingerprint_outputs(outputs: list[dict] | None) -> bytes:
+    return orjson.dumps(outputs or [], option=orjson.OPT_SORT_KEYS, default=str)
+
+
+class _PoolEntry(NamedTuple):
+    code: str
+    outputs_fingerprint: bytes
+    class_object: type[CustomComponent | Component]
+    prototype: Component | None
+
+
+class ComponentPool:
+    """A per-flow pool of evaluated component classes and initialized prototypes.
+
+    Building a component evaluates its code and maps (deep copying them) all of its inputs and outputs.
+    The pool keeps one entry per vertex of recently run flows, so new runs get a cheap clone of the
+    prototype instead. Entries are replaced whenever the code or the outputs of the vertex change.
+    """
+
+    def __init__(self, max_flows: int = 100) -> None:
+        self.enabled = max_flows > 0
+        self._flows: LRUCache[str, dict[str, _PoolEntry]] = LRUCache(maxsize=max(max_flows, 1))
+        self._lock = threading.Lock()
+
+    def _get_entry(self, flow_id: str, vertex: Vertex, code: str, outputs_fingerprint: bytes) -> _PoolEntry | None:
+        with self._lock:
+            prototypes = self._flows.get(flow_id)
+            entry = prototypes.get(vertex.id) if prototypes is not None else None
+        if entry is None or entry.code != code or entry.outputs_fingerprint != outputs_fingerprint:
+            return None
+        return entry
+
+    def _create_entry(self, flow_id: str, vertex: Vertex, code: str, outputs_fingerprint: bytes) -> _PoolEntry:
+        class_object = eval_custom_component_code(code)
+        prototype = None
+        if _supports_cloning(class_object):
+            prototype = class_object(_vertex=vertex, _id=vertex.id)
+            # Prototypes are never run, make sure they don't keep the graph alive
+            prototype.__dict__.update({"_vertex": None, "_Component__config": {}})
+        entry = _PoolEntry(code, outputs_fingerprint, class_object, prototype)
+        with self._lock:
+            self._flows.setdefault(flow_id, {})[vertex.id] = entry
+        return entry
+
+    def instantiate(self, vertex: Vertex, code: str, **config: Any) -> CustomComponent | Component:
+        """Returns a new component instance for the vertex, cloned from the pooled prototype when possible.
+
+        Args:
+            vertex: The vertex the component is built for.
+            code: The code of the component.
+            **config: The ``_``-prefixed configuration of the new instance.
+        """
+        flow_id = vertex.graph.flow_id if vertex.graph is not None else None
+        if not self.enabled or not flow_id:
+            return eval_custom_component_code(code)(_vertex=vertex, **config)
+
+        flow_id = str(flow_id)
+        outputs_fingerprint = _fingerprint_outputs(vertex.outputs)
+        entry = self._get_entry(flow_id, vertex, code, outputs_fingerprint) or self._create_entry(
+            flow_id, vertex, code, outputs_fingerprint
+        )
+        if entry.prototype is None:
+            return entry.class_object(_vertex=vertex, **config)
+        return entry.prototype.clone(_vertex=vertex, **config)
+
+    def invalidate(self, flow_id: str | UUID | None = None) -> None:
+        """Drops the pooled entries of a flow, or of all flows if no flow id is given."""
+        with self._lock:
+            if flow_id is None:
+                self._flows.clear()
+            else:
+                self._flows.pop(str(flow_id), None)
+
+
+@lru_cache(maxsize=1)
+def get_component_pool() -> ComponentPool:
+    from langflow.services.deps import get_settings_service
+
+    return ComponentPool(max_flows=get_settings_service().settings.component_pool_max_flows)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import os
+import uuid
 import warnings
 from typing import TYPE_CHECKING, Any
 
@@ -9,12 +10,16 @@ import orjson
 from loguru import logger
 from pydantic import PydanticDeprecatedSince20
 
-from langflow.custom.eval import eval_custom_component_code
+from langflow.interface.initialize.component_pool import get_component_pool
 from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
-from langflow.services.deps import get_tracing_service, session_scope
+from langflow.services.deps import get_tracing_service, get_variable_service, session_scope
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
     from langflow.custom.custom_component.component import Component
     from langflow.custom.custom_component.custom_component import CustomComponent
     from langflow.events.event_manager import EventManager
@@ -37,11 +42,11 @@ def instantiate_class(
 
     custom_params = get_params(vertex.params)
     code = custom_params.pop("code")
-    class_object: type[CustomComponent | Component] = eval_custom_component_code(code)
-    custom_component: CustomComponent | Component = class_object(
+    custom_component: CustomComponent | Component = get_component_pool().instantiate(
+        vertex,
+        code,
         _user_id=user_id,
         _parameters=custom_params,
-        _vertex=vertex,
         _tracing_service=get_tracing_service(),
         _id=vertex.id,
     )
@@ -107,6 +112,38 @@ def convert_kwargs(params):
     return params
 
 
+def get_load_from_db_variable_names(vertices: Iterable[Vertex]) -> list[str]:
+    """Return the names of the variables loaded from the database by the vertices."""
+    names: dict[str, None] = {}
+    for vertex in vertices:
+        for field in vertex.load_from_db_fields:
+            name = vertex.params.get(field)
+            if name and isinstance(name, str):
+                names[name] = None
+    return list(names)
+
+
+async def _get_variables(user_id, names: list[str], session: AsyncSession) -> dict[str, str]:
+    """Fetch the variables in bulk, leaving them to be resolved one by one if that fails."""
+    if not user_id or not names:
+        return {}
+    try:
+        user_id = user_id if isinstance(user_id, uuid.UUID) else uuid.UUID(str(user_id))
+        return await get_variable_service().get_variables(user_id=user_id, names=names, session=session)
+    except Exception as e:  # noqa: BLE001
+        logger.debug(f"Could not get variables in bulk: {e}")
+        return {}
+
+
+async def prefetch_load_from_db_variables(vertices: Iterable[Vertex], user_id) -> None:
+    """Fetch all the variables used by the vertices in a single query, warming up the variable service cache."""
+    names = get_load_from_db_variable_names(vertices)
+    if not user_id or not names:
+        return
+    async with session_scope() as session:
+        await _get_variables(user_id, names, session)
+
+
 async def update_params_with_load_from_db_fields(
     custom_component: CustomComponent,
     params,
@@ -115,12 +152,19 @@ async def update_params_with_load_from_db_fields(
     fallback_to_env_vars=False,
 ):
     async with session_scope() as session:
-        for field in load_from_db_fields:
-            if field not in params or not params[field]:
+        variable_names = {field: params[field] for field in load_from_db_fields if params.get(field)}
+        user_id = getattr(custom_component, "user_id", None)
+        values = await _get_variables(
+            user_id, [name for name in variable_names.values() if isinstance(name, str)], session
+        )
+        for field, name in variable_names.items():
+            # Credentials can't be used as session ids, which only get_variable checks
+            if field != "session_id" and isinstance(name, str) and name in values:
+                params[field] = values[name]
                 continue
 
             try:
-                key = await custom_component.get_variable(name=params[field], field=field, session=session)
+                key = await custom_component.get_variable(name=name, field=field, session=session)
             except ValueError as e:
                 if any(reason in str(e) for reason in ["User id is not set", "variable not found."]):
                     raise
@@ -128,11 +172,11 @@ async def update_params_with_load_from_db_fields(
                 key = None
 
             if fallback_to_env_vars and key is None:
-                key = os.getenv(params[field])
+                key = os.getenv(name)
                 if key:
-                    logger.info(f"Using environment variable {params[field]} for {field}")
+                    logger.info(f"Using environment variable {name} for {field}")
                 else:
-                    logger.error(f"Environment variable {params[field]} is not set.")
+                    logger.error(f"Environment variable {name} is not set.")
 
             params[field] = key if key is not None else None
             if key is None:
@@ -1,6 +1,10 @@
+import copy
+import threading
+from collections.abc import Callable, Hashable
 from types import UnionType
 from typing import Any, Literal, Union, get_args, get_origin
 
+from cachetools import LRUCache
 from pydantic import BaseModel, Field, create_model
 
 from langflow.inputs.inputs import (
@@ -42,6 +46,57 @@ _convert_type_to_field_type = {
 }
 
 
+# Tool schemas are built for every tool of an agent on every run, so the models are kept and reused
+# for inputs that have the same definition.
+_SCHEMA_CACHE_MAX_SIZE = 1024
+_schema_cache: LRUCache[Hashable, type[BaseModel]] = LRUCache(maxsize=_SCHEMA_CACHE_MAX_SIZE)
+_schema_cache_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return ("dict", tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple | set):
+        return (type(value).__name__, tuple(_freeze(item) for item in value))
+    return (type(value), value)
+
+
+def _input_fingerprint(input_model: Any, field_type: Any) -> tuple:
+    """The parts of an input that end up in its schema field."""
+    required = getattr(input_model, "required", None)
+    return (
+        _freeze(input_model.name),
+        _freeze(getattr(input_model, "display_name", None)),
+        field_type,
+        _freeze(getattr(input_model, "options", None)),
+        _freeze(getattr(input_model, "is_list", False)),
+        _freeze(required),
+        _freeze(getattr(input_model, "info", None)),
+        _freeze(getattr(input_model, "value", None)) if required is False else None,
+    )
+
+
+def _get_or_create_schema(key: Hashable, factory: Callable[[], type[BaseModel]]) -> type[BaseModel]:
+    try:
+        hash(key)
+    except TypeError:
+        # A default value that cannot be hashed, the schema is not cached
+        return factory()
+    with _schema_cache_lock:
+        model = _schema_cache.get(key)
+    if model is None:
+        model = factory()
+        with _schema_cache_lock:
+            _schema_cache[key] = model
+    return model
+
+
+def clear_schema_cache() -> None:
+    """Drops the schemas kept by `create_input_schema` and `create_input_schema_from_dict`."""
+    with _schema_cache_lock:
+        _schema_cache.clear()
+
+
 def flatten_schema(root_schema: dict[str, Any]) -> dict[str, Any]:
     """Flatten a JSON RPC style schema into a single level JSON Schema.
 
@@ -214,9 +269,18 @@ def schema_to_langflow_inputs(schema: type[BaseModel]) -> list[InputTypes]:
 
 
 def create_input_schema(inputs: list["InputTypes"]) -> type[BaseModel]:
+    """Create the arguments schema of a tool from the inputs of a component.
+
+    Inputs with the same definition get the same model.
+    """
     if not isinstance(inputs, list):
         msg = "inputs must be a list of Inputs"
         raise TypeError(msg)
+    key = ("inputs", *(_input_fingerprint(input_model, input_model.field_type) for input_model in inputs))
+    return _get_or_create_schema(key, lambda: _build_input_schema(inputs))
+
+
+def _build_input_schema(inputs: list["InputTypes"]) -> type[BaseModel]:
     fields = {}
     for input_model in inputs:
         # Create a Pydantic Field for each input field
@@ -245,7 +309,9 @@ def create_input_schema(inputs: list["InputTypes"]) -> type[BaseModel]:
             "description": input_model.info or "",
         }
         if input_model.required is False:
-            field_dict["default"] = input_model.value  # type: ignore[assignment]
+            # The model can be reused by other components, so it does not keep the value of this input
+            value = input_model.value
+            field_dict["default"] = copy.deepcopy(value) if isinstance(value, dict | list) else value  # type: ignore[assignment]
         pydantic_field = Field(**field_dict)
 
         fields[input_model.name] = (field_type, pydantic_field)
@@ -257,9 +323,22 @@ def create_input_schema(inputs: list["InputTypes"]) -> type[BaseModel]:
 
 
 def create_input_schema_from_dict(inputs: list[dotdict], param_key: str | None = None) -> type[BaseModel]:
+    """Create the arguments schema of a flow tool from the inputs of the flow.
+
+    Inputs with the same definition get the same model.
+    """
     if not isinstance(inputs, list):
         msg = "inputs must be a list of Inputs"
         raise TypeError(msg)
+    key = (
+        "dict_inputs",
+        param_key,
+        *(_input_fingerprint(input_model, input_model.type) for input_model in inputs),
+    )
+    return _get_or_create_schema(key, lambda: _build_input_schema_from_dict(inputs, param_key))
+
+
+def _build_input_schema_from_dict(inputs: list[dotdict], param_key: str | None = None) -> type[BaseModel]:
     fields = {}
     for input_model in inputs:
         # Create a Pydantic Field for each input field
@@ -283,7 +362,9 @@ def create_input_schema_from_dict(inputs: list[dotdict], param_key: str | None =
             "description": input_model.info or "",
         }
         if input_model.required is False:
-            field_dict["default"] = input_model.value  # type: ignore[assignment]
+            # The model can be reused by other components, so it does not keep the value of this input
+            value = input_model.value
+            field_dict["default"] = copy.deepcopy(value) if isinstance(value, dict | list) else value  # type: ignore[assignment]
         pydantic_field = Field(**field_dict)
 
         fields[input_model.name] = (field_type, pydantic_field)
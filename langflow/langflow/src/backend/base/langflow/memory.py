@@ -1,8 +1,14 @@
 import asyncio
+import bisect
 import json
+import threading
 from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any
 from uuid import UUID
 
+from cachetools import LRUCache
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from loguru import logger
@@ -12,7 +18,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
 from langflow.services.database.models.message.model import MessageRead, MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_db_service, session_scope
 from langflow.utils.async_helpers import run_until_complete
 
 
@@ -42,6 +48,136 @@ def _get_variable_query(
     return stmt
 
 
+def _timestamp_key(message: dict[str, Any]) -> str:
+    # Dumped messages have their timestamp serialized as "YYYY-MM-DD HH:MM:SS UTC", which sorts chronologically
+    return str(message["timestamp"])
+
+
+@dataclass
+class _SessionTail:
+    messages: list[dict[str, Any]]
+    """The most recent messages of the session that are not errors, by timestamp and then in insertion order."""
+    complete: bool
+    """Whether the messages are all the messages of the session."""
+
+
+class MessageTailCache:
+    """Keeps the most recent messages of recently used sessions.
+
+    Agents and Message History components read the last few messages of a session on every turn. The cache
+    serves those reads without querying the database. It is kept up to date by the functions of this module and
+    by the endpoints that change messages, so it can only be enabled when a single Langflow process uses the
+    database (see `message_tail_cache_max_sessions`).
+    """
+
+    def __init__(self, max_sessions: int = 100, max_messages: int = 100) -> None:
+        self.enabled = max_sessions > 0 and max_messages > 0
+        self.max_messages = max_messages
+        self._tails: LRUCache[str, _SessionTail] = LRUCache(maxsize=max(max_sessions, 1))
+        self._lock = threading.Lock()
+        # Counts the changes, so that a tail loaded while messages were being changed is not kept
+        self._changes = 0
+
+    def get_window(
+        self,
+        session_id: str,
+        sender: str | None = None,
+        sender_name: str | None = None,
+        order: str | None = "DESC",
+        limit: int | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Returns the messages `aget_messages` would return, or None if the cached tail can't tell."""
+        with self._lock:
+            tail = self._tails.get(session_id)
+            if tail is None:
+                return None
+            messages = [
+                message
+                for message in tail.messages
+                if (not sender or message["sender"] == sender)
+                and (not sender_name or message["sender_name"] == sender_name)
+            ]
+            complete = tail.complete
+        if order == "DESC":
+            # The newest messages are all in the tail, the window is complete if enough of them match
+            if not complete and (not limit or len(messages) < limit):
+                return None
+            # Like the database, keep messages with the same timestamp in insertion order
+            return sorted(messages, key=_timestamp_key, reverse=True)[:limit]
+        return messages[:limit] if complete else None
+
+    def changes(self) -> int:
+        with self._lock:
+            return self._changes
+
+    def set_tail(self, session_id: str, messages: list[dict[str, Any]], changes: int) -> None:
+        """Caches the newest messages of a session unless messages changed since `changes`."""
+        messages = sorted(messages, key=_timestamp_key)
+        with self._lock:
+            if changes == self._changes:
+                self._tails[session_id] = _SessionTail(messages, complete=len(messages) < self.max_messages)
+
+    def add(self, messages: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self._changes += 1
+            for message in messages:
+                tail = self._tails.get(message["session_id"])
+                if tail is None or message.get("error"):
+                    continue
+                timestamp = _timestamp_key(message)
+                if not tail.complete and tail.messages and timestamp < _timestamp_key(tail.messages[0]):
+                    # Older than the cached window
+                    continue
+                tail.messages.insert(bisect.bisect_right(tail.messages, timestamp, key=_timestamp_key), message)
+                if len(tail.messages) > self.max_messages:
+                    del tail.messages[0]
+                    tail.complete = False
+
+    def update(self, messages: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self._changes += 1
+            for message in messages:
+                tail = self._tails.get(message["session_id"])
+                cached_ids = [cached["id"] for cached in tail.messages] if tail is not None else []
+                if tail is not None and message["id"] in cached_ids and not message.get("error"):
+                    tail.messages[cached_ids.index(message["id"])] = message
+                else:
+                    # The message may have moved to another session or become an error
+                    self._invalidate_message(message["id"])
+                    self._tails.pop(message["session_id"], None)
+
+    def remove(self, message_ids: Sequence[str | UUID]) -> None:
+        with self._lock:
+            self._changes += 1
+            for message_id in message_ids:
+                self._invalidate_message(message_id)
+
+    def invalidate(self, session_id: str | None = None) -> None:
+        """Drops the messages of a session, or of all sessions if no session id is given."""
+        with self._lock:
+            self._changes += 1
+            if session_id is None:
+                self._tails.clear()
+            else:
+                self._tails.pop(session_id, None)
+
+    def _invalidate_message(self, message_id: str | UUID) -> None:
+        message_id = UUID(message_id) if isinstance(message_id, str) else message_id
+        for session_id, tail in list(self._tails.items()):
+            if any(message["id"] == message_id for message in tail.messages):
+                del self._tails[session_id]
+
+
+@lru_cache(maxsize=1)
+def get_message_tail_cache() -> MessageTailCache:
+    from langflow.services.deps import get_settings_service
+
+    settings = get_settings_service().settings
+    # Other workers can change messages without updating this process' cache
+    max_sessions = settings.message_tail_cache_max_sessions if settings.workers <= 1 else 0
+    return MessageTailCache(max_sessions=max_sessions, max_messages=settings.message_tail_cache_max_messages)
+
+
 def get_messages(
     sender: str | None = None,
     sender_name: str | None = None,
@@ -93,6 +229,20 @@ async def aget_messages(
     Returns:
         List[Data]: A list of Data objects representing the retrieved messages.
     """
+    tail_cache = get_message_tail_cache()
+    if tail_cache.enabled and session_id and not flow_id and order_by == "timestamp":
+        session_id = str(session_id)
+        window = tail_cache.get_window(session_id, sender, sender_name, order, limit)
+        if window is None:
+            changes = tail_cache.changes()
+            async with session_scope() as session:
+                stmt = _get_variable_query(session_id=session_id, limit=tail_cache.max_messages)
+                tail = [message.model_dump() for message in await session.exec(stmt)]
+            tail_cache.set_tail(session_id, tail, changes)
+            window = tail_cache.get_window(session_id, sender, sender_name, order, limit)
+        if window is not None:
+            return [await Message.create(**message) for message in window]
+
     async with session_scope() as session:
         stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
         messages = await session.exec(stmt)
@@ -119,8 +269,13 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
 
     try:
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
-        async with session_scope() as session:
-            messages_models = await aadd_messagetables(messages_models, session)
+        db_service = get_db_service()
+        if db_service.writer is not None:
+            await db_service.writer.write(partial(_write_messagetables, messages_models))
+            messages_models = _read_messagetables(messages_models)
+        else:
+            async with session_scope() as session:
+                messages_models = await aadd_messagetables(messages_models, session)
         return [await Message.create(**message.model_dump()) for message in messages_models]
     except Exception as e:
         logger.exception(e)
@@ -148,7 +303,9 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
                 error_message = f"Message with id {message.id} not found"
                 logger.warning(error_message)
                 raise ValueError(error_message)
-        return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+        messages_read = [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+    get_message_tail_cache().update([message.model_dump() for message in messages_read])
+    return messages_read
 
 
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
@@ -172,7 +329,19 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
     except Exception as e:
         logger.exception(e)
         raise
+    return _read_messagetables(messages)
+
+
+async def _write_messagetables(messages: list[MessageTable], session: AsyncSession) -> None:
+    """Adds the messages to a session that is committed by the caller, as a write of the SQLite writer."""
+    for message in messages:
+        session.add(message)
+    await session.flush()
+    for message in messages:
+        await session.refresh(message)
+
 
+def _read_messagetables(messages: list[MessageTable]) -> list[MessageRead]:
     new_messages = []
     for msg in messages:
         msg.properties = json.loads(msg.properties) if isinstance(msg.properties, str) else msg.properties  # type: ignore[arg-type]
@@ -180,7 +349,9 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         msg.category = msg.category or ""
         new_messages.append(msg)
 
-    return [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
+    messages_read = [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
+    get_message_tail_cache().add([message.model_dump() for message in messages_read])
+    return messages_read
 
 
 def delete_messages(session_id: str) -> None:
@@ -207,6 +378,7 @@ async def adelete_messages(session_id: str) -> None:
             .execution_options(synchronize_session="fetch")
         )
         await session.exec(stmt)
+    get_message_tail_cache().invalidate(session_id)
 
 
 async def delete_message(id_: str) -> None:
@@ -220,6 +392,7 @@ async def delete_message(id_: str) -> None:
         if message:
             await session.delete(message)
             await session.commit()
+    get_message_tail_cache().remove([id_])
 
 
 def store_message(
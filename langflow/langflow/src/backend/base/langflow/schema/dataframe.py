@@ -1,12 +1,30 @@
-from typing import cast
+from importlib.util import find_spec
+from typing import Literal, cast
 
+import numpy as np
 import pandas as pd
 from langchain_core.documents import Document
 from pandas import DataFrame as pandas_DataFrame
+from pandas.api.extensions import ExtensionDtype
+from pandas.core.dtypes.cast import maybe_box_native
 
 from langflow.schema.data import Data
 from langflow.schema.message import Message
 
+_PYARROW_AVAILABLE = find_spec("pyarrow") is not None
+
+
+def _to_arrow_backed(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Converts the columns to Arrow arrays, in one pass over each column instead of inferring a dtype per value."""
+    import pyarrow as pa
+
+    try:
+        table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Columns mixing types have no Arrow type, pandas keeps them as objects
+        return dataframe.convert_dtypes(dtype_backend="pyarrow")
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
 
 class DataFrame(pandas_DataFrame):
     """A pandas DataFrame subclass specialized for handling collections of Data objects.
@@ -88,13 +106,63 @@ class DataFrame(pandas_DataFrame):
 
     def to_data_list(self) -> list[Data]:
         """Converts the DataFrame back to a list of Data objects."""
-        list_of_dicts = self.to_dict(orient="records")
         # suggested change: [Data(**row) for row in list_of_dicts]
-        return [Data(data=row) for row in list_of_dicts]
+        return [Data(data=row) for row in self._to_records()]
+
+    @classmethod
+    def from_data_list(
+        cls,
+        data: list[Data] | list[dict],
+        text_key: str = "text",
+        default_value: str = "",
+        dtype_backend: Literal["numpy_nullable", "pyarrow"] | None = None,
+    ) -> "DataFrame":
+        """Builds a DataFrame from a list of Data objects or dictionaries, one row per item.
+
+        Args:
+            data: The Data objects or dictionaries to build the rows from.
+            text_key: The column holding the text of the rows.
+            default_value: The text of the rows without a text column.
+            dtype_backend: With "pyarrow", the columns are backed by Arrow arrays, so that string operations
+                run in pyarrow compute. They keep the NumPy backend if pyarrow is not installed. With
+                "numpy_nullable", the columns get nullable dtypes, like in `pandas.DataFrame.convert_dtypes`.
+        """
+        rows = pd.DataFrame([item.data if isinstance(item, Data) else item for item in data])
+        if dtype_backend == "pyarrow" and _PYARROW_AVAILABLE:
+            rows = _to_arrow_backed(rows)
+        elif dtype_backend == "numpy_nullable":
+            rows = rows.convert_dtypes(dtype_backend=dtype_backend)
+        return cls(rows, text_key=text_key, default_value=default_value)
+
+    def row_buffer(self) -> "DataFrameRowBuffer":
+        """Returns a buffer to append rows to this DataFrame, building the result once instead of once per row."""
+        return DataFrameRowBuffer(self)
+
+    def _to_records(self) -> list[dict]:
+        """Same as `to_dict(orient="records")`, converting the values column by column instead of cell by cell."""
+        if not self.columns.is_unique:
+            return self.to_dict(orient="records")
+        if len(self.columns) == 0:
+            return [{} for _ in range(len(self))]
+        keys = self.columns.tolist()
+        columns = []
+        for index in range(len(keys)):
+            column = self.iloc[:, index]
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufc":
+                columns.append(column.tolist())
+            elif isinstance(column.dtype, pd.ArrowDtype):
+                columns.append(column.array.__arrow_array__().to_pylist())
+            elif column.dtype == np.dtype(object) or isinstance(column.dtype, ExtensionDtype):
+                columns.append([maybe_box_native(value) for value in column])
+            else:
+                columns.append(list(column))
+        return [dict(zip(keys, values, strict=True)) for values in zip(*columns, strict=True)]
 
     def add_row(self, data: dict | Data) -> "DataFrame":
         """Adds a single row to the dataset.
 
+        This copies the whole dataset, use `row_buffer` to add rows one by one.
+
         Args:
             data: Either a Data object or a dictionary to add as a new row
 
@@ -148,7 +216,7 @@ class DataFrame(pandas_DataFrame):
         Returns:
             list[Document]: The converted list of Documents.
         """
-        list_of_dicts = self.to_dict(orient="records")
+        list_of_dicts = self._to_records()
         documents = []
         for row in list_of_dicts:
             data_copy = row.copy()
@@ -186,7 +254,7 @@ class DataFrame(pandas_DataFrame):
         Returns:
             Data: A Data object containing the DataFrame records under 'results' key.
         """
-        dict_list = self.to_dict(orient="records")
+        dict_list = self._to_records()
         return Data(data={"results": dict_list})
 
     def to_message(self) -> Message:
@@ -204,3 +272,41 @@ class DataFrame(pandas_DataFrame):
         processed_df = processed_df.map(lambda x: str(x).replace("\n", "<br/>") if isinstance(x, str) else x)
         # Convert to markdown and wrap in a Message
         return Message(text=processed_df.to_markdown(index=False))
+
+
+class DataFrameRowBuffer:
+    """Collects rows to add to a DataFrame, building the new DataFrame only when it is read.
+
+    `DataFrame.add_row` concatenates the whole DataFrame for every row, so adding rows one at a time takes
+    quadratic time. The buffer keeps the rows in a list and concatenates them once, when `to_dataframe` is
+    called after new rows were appended.
+
+    Example:
+        >>> buffer = DataFrame([{"name": "John"}]).row_buffer()
+        >>> for name in ["Jane", "Bob"]:
+        ...     buffer.append({"name": name})
+        >>> dataset = buffer.to_dataframe()
+    """
+
+    def __init__(self, dataframe: DataFrame | None = None) -> None:
+        self._dataframe = dataframe if dataframe is not None else DataFrame()
+        self._rows: list[dict] = []
+
+    def append(self, data: dict | Data) -> None:
+        self._rows.append(data.data if isinstance(data, Data) else data)
+
+    def extend(self, data: list[dict | Data]) -> None:
+        for item in data:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return len(self._dataframe) + len(self._rows)
+
+    def to_dataframe(self) -> DataFrame:
+        if self._rows:
+            if self._dataframe.empty and len(self._dataframe.columns) == 0:
+                self._dataframe = self._dataframe._constructor(self._rows)
+            else:
+                self._dataframe = self._dataframe.add_rows(self._rows)
+            self._rows = []
+        return self._dataframe
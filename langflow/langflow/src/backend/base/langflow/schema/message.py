@@ -6,17 +6,19 @@ import re
 import traceback
 from collections.abc import AsyncIterator, Iterator
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 from uuid import UUID
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from langchain_core.load import load
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.prompts.chat import BaseChatPromptTemplate, ChatPromptTemplate
-from langchain_core.prompts.prompt import PromptTemplate
 from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_serializer, field_validator
 
+from langflow.base.prompts.formatter import get_prompt_formatter
 from langflow.base.prompts.utils import dict_values_to_string
 from langflow.schema.content_block import ContentBlock
 from langflow.schema.content_types import ErrorContent
@@ -240,9 +242,8 @@ class Message(Data):
         return cls(prompt=prompt_json)
 
     def format_text(self):
-        prompt_template = PromptTemplate.from_template(self.template)
         variables_with_str_values = dict_values_to_string(self.variables)
-        formatted_prompt = prompt_template.format(**variables_with_str_values)
+        formatted_prompt = get_prompt_formatter(self.template).format(**variables_with_str_values)
         self.text = formatted_prompt
         return formatted_prompt
 
@@ -257,25 +258,23 @@ class Message(Data):
     def from_template(cls, template: str, **variables):
         instance = cls(template=template, variables=variables)
         text = instance.format_text()
-        message = HumanMessage(content=text)
+        content: str | list = text
         contents = []
         for value in variables.values():
             if isinstance(value, cls) and value.files:
                 content_dicts = value.get_file_content_dicts()
                 contents.extend(content_dicts)
         if contents:
-            message = HumanMessage(content=[{"type": "text", "text": text}, *contents])
+            content = [{"type": "text", "text": text}, *contents]
 
-        prompt_template = ChatPromptTemplate.from_messages([message])
-
-        instance.prompt = jsonable_encoder(prompt_template.to_json())
-        instance.messages = instance.prompt.get("kwargs", {}).get("messages", [])
+        instance.prompt = _serialize_human_prompt(content)
+        instance.messages = instance.prompt["kwargs"]["messages"]
         return instance
 
     @classmethod
     async def create(cls, **kwargs):
         """If files are present, create the message in a separate thread as is_image_file is blocking."""
-        if "files" in kwargs:
+        if kwargs.get("files"):
             return await asyncio.to_thread(cls, **kwargs)
         return cls(**kwargs)
 
@@ -288,6 +287,22 @@ class Message(Data):
         return DataFrame(data=[self])
 
 
+@lru_cache(maxsize=1)
+def _human_prompt_skeleton() -> bytes:
+    return orjson.dumps(jsonable_encoder(ChatPromptTemplate.from_messages([HumanMessage(content="")]).to_json()))
+
+
+def _serialize_human_prompt(content: str | list) -> dict:
+    """Returns `jsonable_encoder(ChatPromptTemplate.from_messages([HumanMessage(content)]).to_json())`.
+
+    Only the content of the message depends on the prompt, so it is set in a copy of the serialized prompt
+    instead of building and serializing the LangChain objects for every prompt.
+    """
+    prompt = orjson.loads(_human_prompt_skeleton())
+    prompt["kwargs"]["messages"][0]["content"] = content if isinstance(content, str) else jsonable_encoder(content)
+    return prompt
+
+
 class DefaultModel(BaseModel):
     class Config:
         from_attributes = True
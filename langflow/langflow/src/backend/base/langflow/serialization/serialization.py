@@ -1,4 +1,4 @@
-from collections.abc import AsyncIterator, Generator, Iterator
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
 from datetime import datetime, timezone
 from decimal import Decimal
 from functools import lru_cache
@@ -138,14 +138,30 @@ def _truncate_value(value: Any, max_length: int | None, max_items: int | None) -
     return value
 
 
+def _serialize_column(column: pd.Series, max_length: int | None, max_items: int | None) -> list:
+    """Serialize a DataFrame column at once when its dtype allows it, falling back to per-value serialization."""
+    if column.dtype.kind in "biuf":
+        # tolist() already converts numpy scalars to Python ones
+        return column.tolist()
+    if column.dtype.kind == "O" and pd.api.types.infer_dtype(column, skipna=False) == "string":
+        if max_length is not None:
+            too_long = column.str.len() > max_length
+            if too_long.any():
+                column = column.where(~too_long, column.str.slice(0, max_length) + "...")
+        return column.tolist()
+    return [serialize(value, max_length, max_items) for value in column.tolist()]
+
+
 def _serialize_dataframe(obj: pd.DataFrame, max_length: int | None, max_items: int | None) -> list[dict]:
-    """Serialize pandas DataFrame to a dictionary format."""
+    """Serialize pandas DataFrame to a list of records, processing one column at a time."""
     if max_items is not None and len(obj) > max_items:
         obj = obj.head(max_items)
 
-    data = obj.to_dict(orient="records")
-
-    return serialize(data, max_length, max_items)
+    if obj.shape[1] == 0:
+        return [{} for _ in range(len(obj))]
+    columns = [_serialize_column(obj.iloc[:, index], max_length, max_items) for index in range(obj.shape[1])]
+    keys = list(obj.columns)
+    return [dict(zip(keys, row, strict=True)) for row in zip(*columns, strict=True)]
 
 
 def _serialize_series(obj: pd.Series, max_length: int | None, max_items: int | None) -> dict:
@@ -186,46 +202,70 @@ def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | Non
     return UNSERIALIZABLE_SENTINEL
 
 
-def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | None) -> Any | _UnserializableSentinel:
-    """Dispatch object to appropriate serializer."""
-    # Handle primitive types first
-    if obj is None:
-        return obj
-    primitive = _serialize_primitive(obj, max_length, max_items)
-    if primitive is not UNSERIALIZABLE_SENTINEL:
-        return primitive
-
+def _get_type_serializer(obj: Any) -> Callable[[Any, int | None, int | None], Any] | None:
+    """Return the serializer for objects whose serialization only depends on their type."""
+    if isinstance(obj, int | float | bool | complex):
+        return _serialize_primitive
     match obj:
         case str():
-            return _serialize_str(obj, max_length, max_items)
+            return _serialize_str
         case bytes():
-            return _serialize_bytes(obj, max_length, max_items)
+            return _serialize_bytes
         case datetime():
-            return _serialize_datetime(obj, max_length, max_items)
+            return _serialize_datetime
         case Decimal():
-            return _serialize_decimal(obj, max_length, max_items)
+            return _serialize_decimal
         case UUID():
-            return _serialize_uuid(obj, max_length, max_items)
+            return _serialize_uuid
         case Document():
-            return _serialize_document(obj, max_length, max_items)
+            return _serialize_document
         case AsyncIterator() | Generator() | Iterator():
-            return _serialize_iterator(obj, max_length, max_items)
+            return _serialize_iterator
         case BaseModel():
-            return _serialize_pydantic(obj, max_length, max_items)
+            return _serialize_pydantic
         case BaseModelV1():
-            return _serialize_pydantic_v1(obj, max_length, max_items)
+            return _serialize_pydantic_v1
         case dict():
-            return _serialize_dict(obj, max_length, max_items)
+            return _serialize_dict
         case pd.DataFrame():
-            return _serialize_dataframe(obj, max_length, max_items)
+            return _serialize_dataframe
         case pd.Series():
-            return _serialize_series(obj, max_length, max_items)
+            return _serialize_series
         case list() | tuple():
-            return _serialize_list_tuple(obj, max_length, max_items)
+            return _serialize_list_tuple
         case object() if _is_numpy_type(obj):
-            return _serialize_numpy_type(obj, max_length, max_items)
+            return _serialize_numpy_type
         case object() if not isinstance(obj, type):  # Match any instance that's not a class
-            return _serialize_instance(obj, max_length, max_items)
+            return _serialize_instance
+    return None
+
+
+# Serializers resolved by type, so that the type checks above run once per type instead of once per object.
+_TYPE_SERIALIZERS: dict[type, Callable[[Any, int | None, int | None], Any]] = {}
+_MAX_CACHED_TYPES = 1024
+
+
+def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | None) -> Any | _UnserializableSentinel:
+    """Dispatch object to appropriate serializer."""
+    if obj is None:
+        return obj
+    obj_type = type(obj)
+    serializer = _TYPE_SERIALIZERS.get(obj_type)
+    if serializer is None:
+        serializer = _get_type_serializer(obj)
+        if serializer is None:
+            return _serialize_class_like(obj)
+        # Proxies (e.g. generic aliases) can report a different __class__ than their type
+        if obj.__class__ is obj_type and not issubclass(obj_type, type):
+            if len(_TYPE_SERIALIZERS) >= _MAX_CACHED_TYPES:
+                _TYPE_SERIALIZERS.clear()
+            _TYPE_SERIALIZERS[obj_type] = serializer
+    return serializer(obj, max_length, max_items)
+
+
+def _serialize_class_like(obj: Any) -> Any | _UnserializableSentinel:
+    """Serialize classes, enums, type variables and generic aliases."""
+    match obj:
         case object() if hasattr(obj, "_name_"):  # Enum case
             return f"{obj.__class__.__name__}.{obj._name_}"
         case object() if hasattr(obj, "__name__") and hasattr(obj, "__bound__"):  # TypeVar case
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.tracing.profiler import profile_span
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine
+    from uuid import UUID
+
+    from langflow.services.settings.service import SettingsService
+
+# Seconds clients are asked to wait before retrying a rejected build
+RETRY_AFTER_SECONDS = 5
+
+
+class BuildQueueFullError(Exception):
+    """Exception raised when a build is rejected because too many builds are already waiting."""
+
+    def __init__(self, message: str, retry_after: int = RETRY_AFTER_SECONDS) -> None:
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class _TicketState(str, Enum):
+    WAITING = "waiting"
+    RUNNING = "running"
+    RELEASED = "released"
+
+
+class BuildTicket:
+    """A build admitted by the scheduler, either waiting for a build slot or holding one.
+
+    The slot is taken with `wait` and given back with `release`, which is safe to call
+    more than once and also takes the build out of the queue if it was still waiting.
+    """
+
+    def __init__(self, scheduler: BuildSchedulerService, user_id: str) -> None:
+        self.user_id = user_id
+        self._scheduler = scheduler
+        self._state = _TicketState.WAITING
+        self._granted: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    @property
+    def running(self) -> bool:
+        return self._state == _TicketState.RUNNING
+
+    def _grant(self) -> None:
+        self._state = _TicketState.RUNNING
+        if not self._granted.done():
+            self._granted.set_result(None)
+
+    async def wait(self) -> None:
+        """Wait until the build is allowed to run."""
+        try:
+            await asyncio.shield(self._granted)
+        except asyncio.CancelledError:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Give back the build slot, or leave the queue if the build was still waiting."""
+        self._scheduler._release(self)
+
+
+class BuildSchedulerService(Service):
+    """Admission control and fair scheduling of flow builds.
+
+    Builds are started right away while the worker and the user are under their concurrency
+    quotas. Otherwise they wait in a per-user queue, and users take turns (round robin) whenever
+    a slot is released, so a single user queuing many builds can't starve the others. Builds that
+    would exceed the queue quotas are rejected with `BuildQueueFullError`.
+
+    The service also limits how many components are built at the same time across all builds,
+    which bounds the number of concurrent LLM calls of the worker.
+    """
+
+    name = "build_scheduler_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        settings = settings_service.settings
+        self.max_concurrent_builds = settings.max_concurrent_builds
+        self.max_concurrent_builds_per_user = settings.max_concurrent_builds_per_user
+        self.max_queued_builds = settings.max_queued_builds
+        self.max_queued_builds_per_user = settings.max_queued_builds_per_user
+        self._vertex_semaphore = (
+            asyncio.Semaphore(settings.max_concurrent_vertex_builds)
+            if settings.max_concurrent_vertex_builds > 0
+            else None
+        )
+        self._running: dict[str, int] = {}
+        self._total_running = 0
+        self._waiting: dict[str, deque[BuildTicket]] = {}
+        self._total_waiting = 0
+        # Users with waiting builds, in the order they get their next turn
+        self._turns: deque[str] = deque()
+
+    def _has_capacity(self, user_id: str) -> bool:
+        if self.max_concurrent_builds and self._total_running >= self.max_concurrent_builds:
+            return False
+        return not (
+            self.max_concurrent_builds_per_user and self._running.get(user_id, 0) >= self.max_concurrent_builds_per_user
+        )
+
+    def submit(self, user_id: str | UUID) -> BuildTicket:
+        """Admit a build of the user, starting it right away when possible.
+
+        Raises:
+            BuildQueueFullError: If the build would have to wait and the queue of the user,
+                or of the worker, is full.
+        """
+        user_id = str(user_id)
+        ticket = BuildTicket(self, user_id)
+        if self._has_capacity(user_id):
+            self._start(ticket)
+            return ticket
+
+        waiting = self._waiting.get(user_id)
+        if self.max_queued_builds_per_user and waiting and len(waiting) >= self.max_queued_builds_per_user:
+            msg = "Too many builds are waiting to run for this user. Please retry later."
+            raise BuildQueueFullError(msg)
+        if self.max_queued_builds and self._total_waiting >= self.max_queued_builds:
+            msg = "Too many builds are waiting to run. Please retry later."
+            raise BuildQueueFullError(msg)
+
+        if waiting is None:
+            waiting = self._waiting[user_id] = deque()
+            self._turns.append(user_id)
+        waiting.append(ticket)
+        self._total_waiting += 1
+        logger.debug(f"Build of user {user_id} queued, {self._total_waiting} builds waiting")
+        return ticket
+
+    def _start(self, ticket: BuildTicket) -> None:
+        self._running[ticket.user_id] = self._running.get(ticket.user_id, 0) + 1
+        self._total_running += 1
+        ticket._grant()
+
+    def _release(self, ticket: BuildTicket) -> None:
+        if ticket._state == _TicketState.RUNNING:
+            remaining = self._running[ticket.user_id] - 1
+            if remaining:
+                self._running[ticket.user_id] = remaining
+            else:
+                del self._running[ticket.user_id]
+            self._total_running -= 1
+            ticket._state = _TicketState.RELEASED
+            self._dispatch()
+        elif ticket._state == _TicketState.WAITING:
+            ticket._state = _TicketState.RELEASED
+            ticket._granted.cancel()
+            waiting = self._waiting.get(ticket.user_id)
+            if waiting is not None and ticket in waiting:
+                waiting.remove(ticket)
+                self._total_waiting -= 1
+                if not waiting:
+                    del self._waiting[ticket.user_id]
+                    self._turns.remove(ticket.user_id)
+
+    def _dispatch(self) -> None:
+        """Start waiting builds, one per user in turn, while there is capacity."""
+        while self._turns:
+            if self.max_concurrent_builds and self._total_running >= self.max_concurrent_builds:
+                return
+            # Users at their own quota keep their place in line
+            user_id = next((user_id for user_id in self._turns if self._has_capacity(user_id)), None)
+            if user_id is None:
+                return
+            self._turns.remove(user_id)
+            waiting = self._waiting[user_id]
+            ticket = waiting.popleft()
+            self._total_waiting -= 1
+            if waiting:
+                self._turns.append(user_id)
+            else:
+                del self._waiting[user_id]
+            self._start(ticket)
+
+    async def run(self, ticket: BuildTicket, coro: Coroutine) -> None:
+        """Run the build coroutine once the ticket is granted a slot, and release the slot afterwards."""
+        try:
+            await ticket.wait()
+        except BaseException:
+            coro.close()
+            raise
+        try:
+            await coro
+        finally:
+            ticket.release()
+
+    @asynccontextmanager
+    async def vertex_slot(self) -> AsyncIterator[None]:
+        """Hold one of the slots for building a component, if their number is limited."""
+        if self._vertex_semaphore is None:
+            yield
+            return
+        async with profile_span("wait for a build slot", "scheduling"):
+            await self._vertex_semaphore.acquire()
+        try:
+            yield
+        finally:
+            self._vertex_semaphore.release()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "running": self._total_running,
+            "waiting": self._total_waiting,
+            "users_running": len(self._running),
+            "users_waiting": len(self._waiting),
+        }
+
+    async def teardown(self) -> None:
+        for waiting in list(self._waiting.values()):
+            for ticket in list(waiting):
+                ticket.release()
@@ -134,6 +134,28 @@ class AsyncBaseCacheService(Service, Generic[AsyncLockType]):
             lock: A lock to use for the operation.
         """
 
+    async def get_many(self, keys, lock: AsyncLockType | None = None) -> list:
+        """Retrieve several items from the cache.
+
+        Args:
+            keys: The keys of the items to retrieve.
+            lock: A lock to use for the operation.
+
+        Returns:
+            The values associated with the keys, in the same order, with CACHE_MISS for the keys not found.
+        """
+        return [await self.get(key, lock) for key in keys]
+
+    async def set_many(self, items, lock: AsyncLockType | None = None) -> None:
+        """Add several items to the cache.
+
+        Args:
+            items: A mapping of the keys to the values to cache.
+            lock: A lock to use for the operation.
+        """
+        for key, value in dict(items).items():
+            await self.set(key, value, lock)
+
     @abc.abstractmethod
     async def upsert(self, key, value, lock: AsyncLockType | None = None):
         """Add an item to the cache if it doesn't exist, or update it if it does.
@@ -0,0 +1,157 @@
+"""Encoding of the values stored in external caches.
+
+Each encoded value starts with a tag byte naming the codec that encoded it, so plain data can be
+stored in a compact format while anything else falls back to dill.
+"""
+
+from __future__ import annotations
+
+import abc
+import contextlib
+import math
+import pickle
+from typing import Any
+
+import dill
+import orjson
+
+# Values written before the codecs existed are raw pickles, which start with the PROTO opcode
+_PICKLE_PROTO = 0x80
+
+# Maximum nesting checked when looking for plain data, deeper values are pickled
+_MAX_DEPTH = 32
+_INT_BOUNDS = (-(2**63), 2**64 - 1)
+
+
+def _is_plain(value: Any, *, allow_bytes: bool, depth: int = 0) -> bool:
+    """Whether the value round-trips through JSON-like formats unchanged.
+
+    Tuples, sets, subclasses of the builtin types and non-string keys would come back as something else.
+    """
+    if depth > _MAX_DEPTH:
+        return False
+    value_type = type(value)
+    if value is None or value_type in {str, bool}:
+        return True
+    if value_type is float:
+        # NaN and infinity are not valid JSON
+        return math.isfinite(value)
+    if value_type is int:
+        return _INT_BOUNDS[0] <= value <= _INT_BOUNDS[1]
+    if value_type is bytes:
+        return allow_bytes
+    if value_type is list:
+        return all(_is_plain(item, allow_bytes=allow_bytes, depth=depth + 1) for item in value)
+    if value_type is dict:
+        return all(
+            type(key) is str and _is_plain(item, allow_bytes=allow_bytes, depth=depth + 1)
+            for key, item in value.items()
+        )
+    return False
+
+
+class CacheCodec(abc.ABC):
+    """Encodes the values it supports into bytes and back."""
+
+    tag: bytes
+
+    @abc.abstractmethod
+    def can_encode(self, value: Any) -> bool:
+        """Whether the value round-trips through this codec."""
+
+    @abc.abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Encode the value, without the tag."""
+
+    @abc.abstractmethod
+    def decode(self, data: bytes | memoryview) -> Any:
+        """Decode a value encoded by `encode`."""
+
+
+class OrjsonCodec(CacheCodec):
+    """JSON data (dicts with string keys, lists, strings, numbers, booleans and None)."""
+
+    tag = b"\x01"
+
+    def can_encode(self, value: Any) -> bool:
+        return _is_plain(value, allow_bytes=False)
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(CacheCodec):
+    """JSON data that also contains bytes. Only available if msgpack is installed."""
+
+    tag = b"\x02"
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self._msgpack = msgpack
+
+    def can_encode(self, value: Any) -> bool:
+        return _is_plain(value, allow_bytes=True)
+
+    def encode(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=True)
+
+
+class DillCodec(CacheCodec):
+    """Any value dill can pickle, used when no other codec supports the value."""
+
+    tag = b"\x00"
+
+    def can_encode(self, value: Any) -> bool:  # noqa: ARG002
+        return True
+
+    def encode(self, value: Any) -> bytes:
+        return dill.dumps(value, recurse=True)
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        return dill.loads(data)
+
+
+def default_codecs() -> list[CacheCodec]:
+    codecs: list[CacheCodec] = [OrjsonCodec()]
+    with contextlib.suppress(ImportError):
+        codecs.append(MsgpackCodec())
+    codecs.append(DillCodec())
+    return codecs
+
+
+class CacheSerializer:
+    """Encodes values with the first codec supporting them, prefixed with the tag of the codec.
+
+    Args:
+        codecs: The codecs to try, in order. The last one should support any value.
+    """
+
+    def __init__(self, codecs: list[CacheCodec] | None = None) -> None:
+        self.codecs = codecs if codecs is not None else default_codecs()
+        self._codecs_by_tag = {codec.tag[0]: codec for codec in self.codecs}
+
+    def dumps(self, value: Any) -> bytes:
+        for codec in self.codecs:
+            if codec.can_encode(value):
+                try:
+                    return codec.tag + codec.encode(value)
+                except (TypeError, ValueError, orjson.JSONEncodeError):
+                    continue
+        msg = f"No cache codec can encode values of type {type(value).__name__}"
+        raise pickle.PicklingError(msg)
+
+    def loads(self, data: bytes) -> Any:
+        if data[0] == _PICKLE_PROTO:
+            return dill.loads(data)
+        codec = self._codecs_by_tag.get(data[0])
+        if codec is None:
+            msg = f"Unknown cache codec tag: {data[0]}"
+            raise ValueError(msg)
+        return codec.decode(memoryview(data)[1:])
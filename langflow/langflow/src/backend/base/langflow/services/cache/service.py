@@ -5,7 +5,6 @@ import time
 from collections import OrderedDict
 from typing import Generic, Union
 
-import dill
 from loguru import logger
 from typing_extensions import override
 
@@ -16,6 +15,7 @@ from langflow.services.cache.base import (
     ExternalAsyncBaseCacheService,
     LockType,
 )
+from langflow.services.cache.serialization import CacheCodec, CacheSerializer
 from langflow.services.cache.utils import CACHE_MISS
 
 
@@ -196,7 +196,15 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60) -> None:
+    def __init__(
+        self,
+        host="localhost",
+        port=6379,
+        db=0,
+        url=None,
+        expiration_time=60 * 60,
+        codecs: list[CacheCodec] | None = None,
+    ) -> None:
         """Initialize a new RedisCache instance.
 
         Args:
@@ -206,6 +214,8 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             url (str, optional): Redis URL.
             expiration_time (int, optional): Time in seconds after which a
                 cached item expires. Default is 1 hour.
+            codecs (list[CacheCodec], optional): Codecs used to encode the values, tried in order.
+                Defaults to orjson for JSON data, msgpack for JSON data with bytes and dill for anything else.
         """
         # Redis is a main dependency, no need to import check
         from redis.asyncio import StrictRedis
@@ -219,6 +229,7 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         else:
             self._client = StrictRedis(host=host, port=port, db=db)
         self.expiration_time = expiration_time
+        self.serializer = CacheSerializer(codecs)
 
     async def is_connected(self) -> bool:
         """Check if the Redis client is connected."""
@@ -232,24 +243,49 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             return False
         return True
 
+    def _dumps(self, value) -> bytes:
+        try:
+            return self.serializer.dumps(value)
+        except pickle.PicklingError as exc:
+            msg = "RedisCache only accepts values that can be pickled. "
+            raise TypeError(msg) from exc
+
     @override
     async def get(self, key, lock=None):
         if key is None:
             return CACHE_MISS
         value = await self._client.get(str(key))
-        return dill.loads(value) if value else CACHE_MISS
+        return self.serializer.loads(value) if value else CACHE_MISS
 
     @override
     async def set(self, key, value, lock=None) -> None:
-        try:
-            if pickled := dill.dumps(value, recurse=True):
-                result = await self._client.setex(str(key), self.expiration_time, pickled)
-                if not result:
-                    msg = "RedisCache could not set the value."
-                    raise ValueError(msg)
-        except pickle.PicklingError as exc:
-            msg = "RedisCache only accepts values that can be pickled. "
-            raise TypeError(msg) from exc
+        result = await self._client.setex(str(key), self.expiration_time, self._dumps(value))
+        if not result:
+            msg = "RedisCache could not set the value."
+            raise ValueError(msg)
+
+    @override
+    async def get_many(self, keys, lock=None) -> list:
+        """Retrieve several items from the cache in a single round trip."""
+        keys = list(keys)
+        if not keys:
+            return []
+        values = await self._client.mget([str(key) for key in keys])
+        return [self.serializer.loads(value) if value else CACHE_MISS for value in values]
+
+    @override
+    async def set_many(self, items, lock=None) -> None:
+        """Add several items to the cache in a single round trip."""
+        encoded = [(str(key), self._dumps(value)) for key, value in dict(items).items()]
+        if not encoded:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in encoded:
+                pipe.setex(key, self.expiration_time, value)
+            results = await pipe.execute()
+        if not all(results):
+            msg = "RedisCache could not set the values."
+            raise ValueError(msg)
 
     @override
     async def upsert(self, key, value, lock=None) -> None:
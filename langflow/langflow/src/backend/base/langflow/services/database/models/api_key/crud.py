@@ -1,5 +1,6 @@
 import datetime
 import secrets
+from functools import partial
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -9,7 +10,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.api_key.model import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
 from langflow.services.database.models.user.model import User
-from langflow.services.deps import get_settings_service, session_scope
+from langflow.services.deps import get_db_service, get_settings_service, session_scope
 
 if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
@@ -56,6 +57,9 @@ async def check_key(session: AsyncSession, api_key: str) -> User | None:
     if api_key_object is not None:
         settings_service = get_settings_service()
         if settings_service.settings.disable_track_apikey_usage is not True:
+            # End the transaction of the lookup so the connection goes back to the pool before the usage is
+            # written, otherwise concurrent requests can hold every connection while waiting for another one
+            await session.commit()
             await update_total_uses(api_key_object.id)
         return api_key_object.user
     return None
@@ -63,12 +67,20 @@ async def check_key(session: AsyncSession, api_key: str) -> User | None:
 
 async def update_total_uses(api_key_id: UUID):
     """Update the total uses and last used at."""
+    db_service = get_db_service()
+    if db_service.writer is not None:
+        await db_service.writer.write(partial(_increment_total_uses, api_key_id))
+        return
     async with session_scope() as session:
-        new_api_key = await session.get(ApiKey, api_key_id)
-        if new_api_key is None:
-            msg = "API Key not found"
-            raise ValueError(msg)
-        new_api_key.total_uses += 1
-        new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-        session.add(new_api_key)
+        await _increment_total_uses(api_key_id, session)
         await session.commit()
+
+
+async def _increment_total_uses(api_key_id: UUID, session: AsyncSession) -> None:
+    new_api_key = await session.get(ApiKey, api_key_id)
+    if new_api_key is None:
+        msg = "API Key not found"
+        raise ValueError(msg)
+    new_api_key.total_uses += 1
+    new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
+    session.add(new_api_key)
@@ -26,7 +26,9 @@ async def get_transactions_by_flow_id(
     return list(transactions)
 
 
-async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> TransactionTable | None:
+async def log_transaction(
+    db: AsyncSession, transaction: TransactionBase, *, commit: bool = True
+) -> TransactionTable | None:
     """Log a transaction and maintain a maximum number of transactions in the database.
 
     This function logs a new transaction into the database and ensures that the number of transactions
@@ -36,6 +38,8 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     Args:
         db: Database session
         transaction: Transaction data to log
+        commit: Whether to commit the transaction. Set to False when the caller commits it,
+            e.g. as part of a batch of writes.
 
     Returns:
         The created TransactionTable entry
@@ -66,10 +70,12 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
         # Add new entry and execute delete in same transaction
         db.add(table)
         await db.exec(delete_older)
-        await db.commit()
+        if commit:
+            await db.commit()
 
     except Exception:
-        await db.rollback()
+        if commit:
+            await db.rollback()
         raise
     return table
 
@@ -55,6 +55,7 @@ async def log_vertex_build(
     *,
     max_builds_to_keep: int | None = None,
     max_builds_per_vertex: int | None = None,
+    commit: bool = True,
 ) -> VertexBuildTable:
     """Log a vertex build and maintain build history within specified limits.
 
@@ -71,6 +72,8 @@ async def log_vertex_build(
             If None, uses system settings.
         max_builds_per_vertex (int | None, optional): Maximum number of builds to keep per vertex.
             If None, uses system settings.
+        commit (bool, optional): Whether to commit the transaction. Set to False when the caller
+            commits it, e.g. as part of a batch of writes.
 
     Returns:
         VertexBuildTable: The newly created vertex build record.
@@ -121,10 +124,12 @@ async def log_vertex_build(
         await db.exec(delete_global_older)
 
         # 4) Commit transaction
-        await db.commit()
+        if commit:
+            await db.commit()
 
     except Exception:
-        await db.rollback()
+        if commit:
+            await db.rollback()
         raise
 
     return table
@@ -29,6 +29,7 @@ from langflow.services.database import models
 from langflow.services.database.models.user.crud import get_user_by_username
 from langflow.services.database.session import NoopSession
 from langflow.services.database.utils import Result, TableResults
+from langflow.services.database.writer import SQLiteWriter
 from langflow.services.deps import get_settings_service
 from langflow.services.utils import teardown_superuser
 
@@ -61,6 +62,7 @@ class DatabaseService(Service):
             self.engine = self._create_engine_with_retry()
         else:
             self.engine = self._create_engine()
+        self.writer = self._create_writer()
 
         alembic_log_file = self.settings_service.settings.alembic_log_file
         # Check if the provided path is absolute, cross-platform.
@@ -80,6 +82,7 @@ class DatabaseService(Service):
             self.engine = self._create_engine_with_retry()
         else:
             self.engine = self._create_engine()
+        self.writer = self._create_writer()
 
     def _sanitize_database_url(self):
         """Create the engine for the database."""
@@ -145,6 +148,21 @@ class DatabaseService(Service):
         """Create the engine for the database with retry logic."""
         return self._create_engine()
 
+    def _create_writer(self) -> SQLiteWriter | None:
+        """Create the writer that batches the writes of running flows, if enabled for a SQLite database file."""
+        settings = self.settings_service.settings
+        if not settings.sqlite_write_batching or settings.use_noop_database:
+            return None
+        if not self.database_url.startswith("sqlite") or ":memory:" in self.database_url:
+            logger.warning("sqlite_write_batching is only used with a SQLite database file.")
+            return None
+        return SQLiteWriter(
+            self.database_url,
+            connect_args=self._get_connect_args(),
+            batch_interval=settings.sqlite_write_batch_interval,
+            max_batch_size=settings.sqlite_write_batch_max_size,
+        )
+
     def _get_connect_args(self):
         settings = self.settings_service.settings
 
@@ -480,4 +498,6 @@ class DatabaseService(Service):
                 await teardown_superuser(settings_service, session)
         except Exception:  # noqa: BLE001
             logger.exception("Error tearing down database")
+        if self.writer is not None:
+            await self.writer.stop()
         await self.engine.dispose()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+T = TypeVar("T")
+
+
+class _WriteIntent(NamedTuple):
+    write: Callable[[AsyncSession], Awaitable[Any]]
+    future: asyncio.Future
+
+
+class SQLiteWriter:
+    """Commits the writes sent from concurrent sessions in batches, from a single SQLite connection.
+
+    SQLite lets one connection write at a time, so concurrent builds committing their messages, vertex builds
+    and transactions each wait on the database lock, fail with "database is locked" once the busy timeout runs
+    out, and sync the WAL once per commit. Writes sent to this writer are queued and run by a single task,
+    which waits `batch_interval` seconds for more of them and runs them all in one transaction. Each write runs
+    in a savepoint, so a failing write only fails its own caller. Reads keep going through the connection pool
+    of the database service, which WAL mode lets run alongside the writer.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        *,
+        connect_args: dict | None = None,
+        batch_interval: float = 0.005,
+        max_batch_size: int = 256,
+    ) -> None:
+        self.engine = create_async_engine(database_url, connect_args=connect_args or {}, pool_size=1, max_overflow=0)
+        # Let SQLAlchemy control the transactions, so that the savepoints of the writes nest in the batch,
+        # and take the write lock when the batch starts instead of when its first write runs
+        event.listen(self.engine.sync_engine, "connect", self._on_connect)
+        event.listen(self.engine.sync_engine, "begin", self._on_begin)
+        self.batch_interval = batch_interval
+        self.max_batch_size = max(max_batch_size, 1)
+        self.batches = 0
+        self.writes = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[_WriteIntent | None] | None = None
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def _on_connect(dbapi_connection, _connection_record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @staticmethod
+    def _on_begin(connection) -> None:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    async def write(self, write: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Runs `write` in the next batch and returns its result once the batch is committed.
+
+        `write` gets the session of the batch and must not commit or roll it back.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._get_queue().put_nowait(_WriteIntent(write, future))
+        return await future
+
+    def _get_queue(self) -> asyncio.Queue[_WriteIntent | None]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[_WriteIntent | None]) -> None:
+        while True:
+            first = await queue.get()
+            if first is None:
+                return
+            batch = [first]
+            await asyncio.sleep(self.batch_interval)
+            stopping = False
+            while len(batch) < self.max_batch_size and not queue.empty():
+                intent = queue.get_nowait()
+                if intent is None:
+                    stopping = True
+                    break
+                batch.append(intent)
+            await self._commit(batch)
+            if stopping:
+                return
+
+    async def _commit(self, batch: list[_WriteIntent]) -> None:
+        # Writes whose callers went away are not run
+        batch = [intent for intent in batch if not intent.future.done()]
+        if not batch:
+            return
+        written: list[tuple[_WriteIntent, Any]] = []
+        try:
+            async with AsyncSession(self.engine, expire_on_commit=False) as session:
+                for intent in batch:
+                    try:
+                        async with session.begin_nested():
+                            result = await intent.write(session)
+                    except Exception as exc:  # noqa: BLE001
+                        _set_exception(intent.future, exc)
+                    else:
+                        written.append((intent, result))
+                await session.commit()
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Error committing a batch of {len(batch)} writes: {exc!s}")
+            for intent, _ in written:
+                _set_exception(intent.future, exc)
+            return
+        self.batches += 1
+        self.writes += len(written)
+        for intent, result in written:
+            if not intent.future.done():
+                intent.future.set_result(result)
+
+    async def stop(self) -> None:
+        """Commits the writes already sent and stops the writer."""
+        task = self._task
+        if task is not None and not task.done() and self._loop is asyncio.get_running_loop():
+            self._queue.put_nowait(None)  # type: ignore[union-attr]
+            await task
+        self._task = None
+        self._queue = None
+        await self.engine.dispose()
+
+
+def _set_exception(future: asyncio.Future, exc: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exc)
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from langflow.services.build_scheduler.service import BuildSchedulerService
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
@@ -26,6 +27,7 @@ if TYPE_CHECKING:
     from langflow.services.telemetry.service import TelemetryService
     from langflow.services.tracing.service import TracingService
     from langflow.services.variable.service import VariableService
+    from langflow.services.webhook_queue.service import WebhookQueueService
 
 
 def get_service(service_type: ServiceType, default=None):
@@ -247,3 +249,17 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_build_scheduler_service() -> BuildSchedulerService:
+    """Retrieves the BuildSchedulerService instance from the service manager."""
+    from langflow.services.build_scheduler.factory import BuildSchedulerServiceFactory
+
+    return get_service(ServiceType.BUILD_SCHEDULER_SERVICE, BuildSchedulerServiceFactory())
+
+
+def get_webhook_queue_service() -> WebhookQueueService:
+    """Retrieves the WebhookQueueService instance from the service manager."""
+    from langflow.services.webhook_queue.factory import WebhookQueueServiceFactory
+
+    return get_service(ServiceType.WEBHOOK_QUEUE_SERVICE, WebhookQueueServiceFactory())
@@ -1,15 +1,19 @@
+import copy
 import json
 import os
+import threading
 from pathlib import Path
+from typing import NamedTuple
 from uuid import UUID, uuid4
 
+import anyio
 from aiofile import async_open
+from cachetools import LRUCache
 from loguru import logger
 from sqlmodel import delete, select, text
 
 from langflow.api.utils import cascade_delete_flow
 from langflow.graph import Graph
-from langflow.graph.vertex.param_handler import ParameterHandler
 from langflow.load.utils import replace_tweaks_with_env
 from langflow.logging.logger import configure
 from langflow.processing.process import process_tweaks, run_graph
@@ -19,9 +23,53 @@ from langflow.services.auth.utils import (
 from langflow.services.cache.service import AsyncBaseCacheService
 from langflow.services.database.models import Flow, User, Variable
 from langflow.services.database.utils import initialize_database
-from langflow.services.deps import get_cache_service, get_storage_service, session_scope
+from langflow.services.deps import get_cache_service, session_scope
+from langflow.utils.constants import DIRECT_TYPES
 from langflow.utils.util import update_settings
 
+# Number of flow files whose prepared payload is kept by an embedded runner
+PREPARED_FLOWS_CACHE_SIZE = 32
+
+
+class _PreparedFlow(NamedTuple):
+    version: tuple[int, int]
+    flow_dict: dict
+    load_from_db_fields: dict[str, dict[str, str]]
+
+
+def get_load_from_db_fields(flow_dict: dict) -> dict[str, dict[str, str]]:
+    """Returns the values of the fields loaded from variables, by node id and field name.
+
+    These are the fields `ParameterHandler` would load from the database when building the graph.
+    """
+    load_from_db_fields: dict[str, dict[str, str]] = {}
+    for node in flow_dict.get("data", flow_dict).get("nodes", []):
+        template = node.get("data", {}).get("node", {}).get("template", {})
+        for field_name, field in template.items():
+            if (
+                not isinstance(field, dict)
+                or field_name == "_type"
+                or field.get("type") not in DIRECT_TYPES
+                or (not field.get("show") and field_name != "code")
+            ):
+                continue
+            if field.get("load_from_db") and field.get("value"):
+                load_from_db_fields.setdefault(node["id"], {})[field_name] = field["value"]
+    return load_from_db_fields
+
+
+def disable_load_from_db(obj: dict | list) -> None:
+    """Recursively sets every `load_from_db` flag to False."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key == "load_from_db" and value is True:
+                obj[key] = False
+            else:
+                disable_load_from_db(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            disable_load_from_db(item)
+
 
 class LangflowRunnerExperimental:
     """LangflowRunnerExperimental orchestrates flow execution without a dedicated server.
@@ -38,6 +86,11 @@ class LangflowRunnerExperimental:
         runner = LangflowRunnerExperimental()
         result = await runner.run(flow="path/to/flow.json", input_value="Hello", session_id=str(uuid.uuid4()))
 
+    With `embedded=True` the flows are not stored in the database. Flow files are read and prepared once, and
+    kept until they change on disk, so repeated runs of the same file only resolve the variables of the flow
+    from the environment and build its graph. The components may still store messages, and the graph its
+    transactions and vertex builds, unless disabled with `LANGFLOW_TRANSACTIONS_STORAGE_ENABLED=false` and
+    `LANGFLOW_VERTEX_BUILDS_STORAGE_ENABLED=false`.
     """
 
     def __init__(
@@ -48,8 +101,12 @@ class LangflowRunnerExperimental:
         log_file: str | None = None,
         disable_logs: bool = False,
         async_log_file: bool = True,
+        embedded: bool = False,
     ):
         self.should_initialize_db = should_initialize_db
+        self.embedded = embedded
+        self._prepared_flows: LRUCache[str, _PreparedFlow] = LRUCache(maxsize=PREPARED_FLOWS_CACHE_SIZE)
+        self._prepared_flows_lock = threading.Lock()
         log_file_path = Path(log_file) if log_file else None
         configure(log_level=log_level, log_file=log_file_path, disable=disable_logs, async_file=async_log_file)
 
@@ -76,12 +133,15 @@ class LangflowRunnerExperimental:
             if generate_user:
                 user = await self.generate_user()
                 user_id = str(user.id)
-            flow_dict = await self.prepare_flow_and_add_to_db(
-                flow=flow,
-                user_id=user_id,
-                session_id=session_id,
-                tweaks_values=tweaks_values,
-            )
+            if self.embedded:
+                flow_dict = await self.prepare_flow(flow=flow, tweaks_values=tweaks_values)
+            else:
+                flow_dict = await self.prepare_flow_and_add_to_db(
+                    flow=flow,
+                    user_id=user_id,
+                    session_id=session_id,
+                    tweaks_values=tweaks_values,
+                )
             return await self.run_flow(
                 input_value=input_value,
                 session_id=session_id,
@@ -110,7 +170,10 @@ class LangflowRunnerExperimental:
         try:
             result = await self.run_graph(input_value, input_type, output_type, session_id, graph, stream=stream)
         finally:
-            await self.clear_flow_state(flow_dict)
+            if self.embedded:
+                await self.clear_cache()
+            else:
+                await self.clear_flow_state(flow_dict)
         logger.info(f"Finish Handling {session_id=}")
         return result
 
@@ -132,34 +195,45 @@ class LangflowRunnerExperimental:
         await self.add_flow_to_db(flow_dict, user_id=user_id)
         return flow_dict
 
+    async def prepare_flow(
+        self, *, flow: Path | str | dict, custom_flow_id: str | None = None, tweaks_values: dict | None = None
+    ) -> dict:
+        """Prepares a flow to run without storing it, reusing the payload of flow files that did not change."""
+        if isinstance(flow, dict):
+            flow_dict = self.process_tweaks(flow, tweaks_values=tweaks_values)
+        else:
+            prepared = await self._get_prepared_flow(Path(flow))
+            flow_dict = copy.deepcopy(prepared.flow_dict)
+            if prepared.load_from_db_fields:
+                tweaks = copy.deepcopy(prepared.load_from_db_fields)
+                flow_dict = process_tweaks(flow_dict, replace_tweaks_with_env(tweaks, tweaks_values or os.environ))
+        if custom_flow_id:
+            flow_dict["id"] = custom_flow_id
+        return flow_dict
+
+    async def _get_prepared_flow(self, path: Path) -> _PreparedFlow:
+        stat = await anyio.Path(path).stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        key = str(path.resolve())
+        with self._prepared_flows_lock:
+            prepared = self._prepared_flows.get(key)
+        if prepared is not None and prepared.version == version:
+            return prepared
+
+        flow_dict = await self.get_flow_dict(path)
+        load_from_db_fields = get_load_from_db_fields(flow_dict)
+        disable_load_from_db(flow_dict)
+        prepared = _PreparedFlow(version, flow_dict, load_from_db_fields)
+        with self._prepared_flows_lock:
+            self._prepared_flows[key] = prepared
+        return prepared
+
     def process_tweaks(self, flow_dict: dict, tweaks_values: dict | None = None) -> dict:
-        tweaks: dict | None = None
-        tweaks_values = tweaks_values or os.environ.copy()
-        for vertex in Graph.from_payload(flow_dict).vertices:
-            param_handler = ParameterHandler(vertex, get_storage_service())
-            field_params, load_from_db_fields = param_handler.process_field_parameters()
-            for db_field in load_from_db_fields:
-                if field_params[db_field]:
-                    tweaks = tweaks or {}
-                    tweaks[vertex.id] = tweaks.get(vertex.id, {})
-                    tweaks[vertex.id][db_field] = field_params[db_field]
-        if tweaks is not None:
-            tweaks = replace_tweaks_with_env(tweaks=tweaks, env_vars=tweaks_values)
+        """Replaces the fields loaded from variables with the environment variables of the same name."""
+        if tweaks := get_load_from_db_fields(flow_dict):
+            tweaks = replace_tweaks_with_env(tweaks=tweaks, env_vars=tweaks_values or os.environ.copy())
             flow_dict = process_tweaks(flow_dict, tweaks)
-
-        # Recursively update load_from_db fields
-        def update_load_from_db(obj):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key == "load_from_db" and value is True:
-                        obj[key] = False
-                    else:
-                        update_load_from_db(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    update_load_from_db(item)
-
-        update_load_from_db(flow_dict)
+        disable_load_from_db(flow_dict)
         return flow_dict
 
     async def generate_user(self) -> User:
@@ -212,12 +286,16 @@ class LangflowRunnerExperimental:
         return graph
 
     @staticmethod
-    async def clear_flow_state(flow_dict: dict):
+    async def clear_cache():
         cache_service = get_cache_service()
         if isinstance(cache_service, AsyncBaseCacheService):
             await cache_service.clear()
         else:
             cache_service.clear()
+
+    @staticmethod
+    async def clear_flow_state(flow_dict: dict):
+        await LangflowRunnerExperimental.clear_cache()
         async with session_scope() as session:
             flow_id = flow_dict["id"]
             uuid_obj = flow_id if isinstance(flow_id, UUID) else UUID(str(flow_id))
@@ -234,7 +312,7 @@ class LangflowRunnerExperimental:
             await session.exec(delete(User).where(User.id == user_id))
 
     async def init_db_if_needed(self):
-        if not await self.database_exists_check() and self.should_initialize_db:
+        if self.should_initialize_db and not await self.database_exists_check():
             logger.info("Initializing database...")
             await initialize_database(fix_migration=True)
             self.should_initialize_db = False
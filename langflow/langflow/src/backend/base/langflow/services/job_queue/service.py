@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import partial
 
 from loguru import logger
 
@@ -27,10 +28,14 @@ class JobQueueService(Service):
       - Automatically perform periodic cleanup of inactive or completed job queues.
 
     The cleanup process follows a two-phase approach:
-      1. When a task is cancelled or fails, it is marked for cleanup by setting a timestamp
+      1. When a task finishes or fails, it is marked for cleanup by setting a timestamp
       2. The actual cleanup only occurs after CLEANUP_GRACE_PERIOD seconds have elapsed
          since the task was marked
 
+    Cancelled tasks (e.g. the build was cancelled or the client disconnected) have nobody
+    left to consume their events, so they are cleaned up as soon as they are done, which
+    releases the memory held by the job right away.
+
     Attributes:
         name (str): Unique identifier for the service.
         _queues (dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]]):
@@ -181,6 +186,7 @@ class JobQueueService(Service):
 
         # Initiate the new asynchronous task.
         task = asyncio.create_task(task_coro)
+        task.add_done_callback(partial(self._release_cancelled_job, job_id))
         self._queues[job_id] = (main_queue, event_manager, task, None)
         logger.debug(f"New task started for job_id {job_id}")
 
@@ -251,6 +257,27 @@ class JobQueueService(Service):
         self._queues.pop(job_id, None)
         logger.debug(f"Cleanup successful for job_id {job_id}: resources have been released.")
 
+    def _release_cancelled_job(self, job_id: str, task: asyncio.Task) -> None:
+        """Remove a job from the registry as soon as its task is cancelled.
+
+        Dropping the task and its queued events releases the graph and results they reference
+        without waiting for the grace period.
+        """
+        if not task.cancelled():
+            return
+        entry = self._queues.get(job_id)
+        # The job may have been cleaned up already, or restarted with a new task
+        if entry is None or entry[2] is not task:
+            return
+        main_queue = entry[0]
+        while not main_queue.empty():
+            try:
+                main_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        self._queues.pop(job_id, None)
+        logger.debug(f"Released resources of cancelled job_id {job_id}")
+
     async def _periodic_cleanup(self) -> None:
         """Execute a periodic task that cleans up completed or cancelled job queues.
 
@@ -272,7 +299,7 @@ class JobQueueService(Service):
                 logger.error(f"Exception encountered during periodic cleanup: {exc}")
 
     async def _cleanup_old_queues(self) -> None:
-        """Scan all registered job queues and clean up those with completed or failed tasks."""
+        """Scan all registered job queues and clean up those with completed, cancelled or failed tasks."""
         current_time = asyncio.get_running_loop().time()
 
         for job_id in list(self._queues.keys()):
@@ -281,11 +308,11 @@ class JobQueueService(Service):
                 logger.debug(
                     f"Queue {job_id} status - Done: {task.done()}, "
                     f"Cancelled: {task.cancelled()}, "
-                    f"Has exception: {task.exception() is not None if task.done() else 'N/A'}"
+                    f"Has exception: {task.exception() is not None if task.done() and not task.cancelled() else 'N/A'}"
                 )
 
                 # Check if task should be marked for cleanup
-                if task and (task.cancelled() or (task.done() and task.exception() is not None)):
+                if task.done():
                     if cleanup_time is None:
                         # Mark for cleanup by setting the timestamp
                         self._queues[job_id] = (
@@ -294,7 +321,7 @@ class JobQueueService(Service):
                             self._queues[job_id][2],
                             current_time,
                         )
-                        logger.debug(f"Job queue for job_id {job_id} marked for cleanup - Task cancelled or failed")
+                        logger.debug(f"Job queue for job_id {job_id} marked for cleanup - Task done")
                     elif current_time - cleanup_time >= self.CLEANUP_GRACE_PERIOD:
                         # Enough time has passed, perform the actual cleanup
                         logger.debug(f"Cleaning up job_id {job_id} after grace period")
@@ -20,3 +20,5 @@ class ServiceType(str, Enum):
     TRACING_SERVICE = "tracing_service"
     TELEMETRY_SERVICE = "telemetry_service"
     JOB_QUEUE_SERVICE = "job_queue_service"
+    BUILD_SCHEDULER_SERVICE = "build_scheduler_service"
+    WEBHOOK_QUEUE_SERVICE = "webhook_queue_service"
@@ -99,6 +99,14 @@ class Settings(BaseSettings):
     # sqlite configuration
     sqlite_pragmas: dict | None = {"synchronous": "NORMAL", "journal_mode": "WAL"}
     """SQLite pragmas to use when connecting to the database."""
+    sqlite_write_batching: bool = False
+    """If True, the messages, vertex builds, transactions and API key usage written while running flows go through
+    a single SQLite writer that commits them in batches, instead of one transaction per write competing for the
+    database lock. Only used with a SQLite database file."""
+    sqlite_write_batch_interval: float = 0.005
+    """Seconds the SQLite writer waits for more writes before committing a batch."""
+    sqlite_write_batch_max_size: int = 256
+    """Maximum number of writes the SQLite writer commits in one transaction."""
 
     db_driver_connection_settings: dict | None = None
     """Database driver connection settings."""
@@ -179,6 +187,9 @@ class Settings(BaseSettings):
     """Whether to store environment variables as Global Variables in the database."""
     variables_to_get_from_environment: list[str] = VARIABLES_TO_GET_FROM_ENVIRONMENT
     """List of environment variables to get from the environment and store in the database."""
+    variable_cache_ttl: float = 10
+    """How long in seconds the decrypted values of Global Variables are cached. Variables updated on another
+    worker can be stale for that long. Set to 0 to disable the cache."""
     worker_timeout: int = 300
     """Timeout for the API calls in seconds."""
     frontend_timeout: int = 0
@@ -230,10 +241,68 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    component_pool_max_flows: int = 100
+    """The maximum number of flows whose initialized components are kept to speed up subsequent runs.
+    Set to 0 to create every component from scratch."""
+    component_template_cache_max_size: int = 64
+    """The maximum number of component codes whose frontend node is kept to speed up the updates sent while
+    editing a component. Set to 0 to build the node from the code on every update."""
+    subflow_graph_cache_max_flows: int = 100
+    """The maximum number of flows run by Run Flow, Sub Flow or flow tools whose data and graphs are kept
+    to speed up subsequent runs. Set to 0 to load and build the flow on every run."""
+    message_tail_cache_max_sessions: int = 0
+    """The maximum number of sessions whose most recent messages are kept in memory for chat history reads.
+    Disabled by default, as messages written by other instances sharing the database would not be seen. Only
+    enable it when a single Langflow instance uses the database, it is not used with several workers."""
+    message_tail_cache_max_messages: int = 100
+    """The number of most recent messages kept per session for chat history reads."""
+    max_concurrent_builds: int = 50
+    """The maximum number of flow builds running at the same time on a worker. Set to 0 for no limit."""
+    max_concurrent_builds_per_user: int = 4
+    """The maximum number of flow builds running at the same time for a single user. Set to 0 for no limit."""
+    max_queued_builds: int = 500
+    """The maximum number of flow builds waiting for a slot on a worker before new builds are rejected
+    with a 429 response. Set to 0 for no limit."""
+    max_queued_builds_per_user: int = 20
+    """The maximum number of flow builds a single user can have waiting for a slot before new builds are
+    rejected with a 429 response. Set to 0 for no limit."""
+    max_concurrent_vertex_builds: int = 0
+    """The maximum number of components (and so LLM calls) being built at the same time across all flow
+    builds of a worker. Set to 0 for no limit."""
+    webhook_queue_workers: int = 4
+    """The number of webhook runs each worker runs at the same time. Webhook runs are stored in a queue on
+    disk and survive restarts. Set to 0 to run webhooks as background tasks of the request instead."""
+    webhook_queue_path: str | None = None
+    """The path of the SQLite file of the webhook queue. Defaults to `webhook_queue.db` in the config directory."""
+    webhook_queue_max_runs_per_flow: int = 2
+    """The maximum number of webhook runs of a single flow running at the same time, across all workers.
+    Set to 0 for no limit."""
+    webhook_queue_max_pending: int = 10000
+    """The maximum number of webhook runs waiting or running before new webhook requests are rejected with
+    a 429 response. Set to 0 for no limit."""
+    webhook_queue_max_attempts: int = 3
+    """The number of times a failing webhook run is attempted before it is marked as failed."""
+    webhook_queue_retry_backoff: float = 2.0
+    """Seconds to wait before retrying a failed webhook run, doubled after every attempt."""
+    webhook_queue_retention: int = 24 * 60 * 60
+    """Time in seconds finished webhook runs are kept, during which requests with the same idempotency key
+    are not run again."""
+    image_cache_max_bytes: int = 64 * 1024 * 1024
+    """The maximum size in bytes of the base64 encoded images kept in memory for multimodal messages.
+    Set to 0 to encode the images on every use."""
+    image_max_edge: int = 0
+    """If set, images sent to models are downscaled so that their longest edge is at most this many pixels.
+    Set to 0 to send images in their original size."""
+    profile_runs: bool = False
+    """If set to True, the time spent in each step of the flow runs (scheduling, component builds, persistence,
+    events) is recorded and served by the /monitor/profile/{run_id} endpoint."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
     """The polling interval in milliseconds for synchronizing flows from the file system."""
+    fs_flows_watch: bool = True
+    """If set to True, file system notifications (requires `watchfiles`) are used to detect changes to flow files
+    instead of checking every file at each polling interval."""
     ssl_cert_file: str | None = None
     """Path to the SSL certificate file on the local system."""
     ssl_key_file: str | None = None
@@ -250,6 +319,11 @@ class Settings(BaseSettings):
     """If set to False, Langflow will not enable the MCP server."""
     mcp_server_enable_progress_notifications: bool = False
     """If set to False, Langflow will not send progress notifications in the MCP server."""
+    mcp_project_servers_max: int = 100
+    """Maximum number of project MCP servers kept in memory. Servers of projects without connected clients are
+    dropped, least recently used first, when a new one is needed."""
+    mcp_project_server_idle_timeout: int = 3600
+    """Time in seconds after which the MCP server of a project without connected clients is dropped."""
 
     # Public Flow Settings
     public_flow_cleanup_interval: int = Field(default=3600, gt=600)
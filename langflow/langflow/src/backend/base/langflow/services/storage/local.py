@@ -1,8 +1,12 @@
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from pathlib import Path
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService
 
 
 class LocalStorageService(StorageService):
@@ -11,6 +15,8 @@ class LocalStorageService(StorageService):
     def __init__(self, session_service, settings_service) -> None:
         """Initialize the local storage service with session and settings services."""
         super().__init__(session_service, settings_service)
+        # The file names of each flow directory, with the modification time of the directory they were read at
+        self._files_index: dict[str, tuple[int, list[str]]] = {}
         self.set_ready()
 
     def build_full_path(self, flow_id: str, file_name: str) -> str:
@@ -33,6 +39,7 @@ class LocalStorageService(StorageService):
         folder_path = self.data_dir / flow_id
         await folder_path.mkdir(parents=True, exist_ok=True)
         file_path = folder_path / file_name
+        self._files_index.pop(flow_id, None)
 
         try:
             async with async_open(str(file_path), "wb") as f:
@@ -42,6 +49,40 @@ class LocalStorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in flow {flow_id}")
             raise
 
+    async def save_file_stream(self, flow_id: str, file_name: str, stream: AsyncIterable[bytes]) -> int:
+        """Save a file in the local storage, writing it chunk by chunk.
+
+        The content is written to a temporary file that replaces the target once the
+        stream is exhausted, so a failed upload never leaves a truncated file behind.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            stream: An async iterable yielding the byte content of the file.
+
+        Returns:
+            The size of the saved file in bytes.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        partial_path = file_path.with_name(f".{file_path.name}.part")
+
+        size = 0
+        try:
+            async with async_open(str(partial_path), "wb") as f:
+                async for chunk in stream:
+                    await f.write(chunk)
+                    size += len(chunk)
+            await partial_path.replace(file_path)
+            self._files_index.pop(flow_id, None)
+            logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            await partial_path.unlink(missing_ok=True)
+            raise
+        return size
+
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from the local storage.
 
@@ -67,6 +108,24 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def get_file_stream(
+        self, flow_id: str, file_name: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Yield the content of a file from the local storage in chunks.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        async with async_open(str(file_path), "rb") as f:
+            async for chunk in f.iter_chunked(chunk_size):
+                yield chunk
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
@@ -96,6 +155,33 @@ class LocalStorageService(StorageService):
         logger.info(f"Listed {len(files)} files in flow {flow_id}.")
         return files
 
+    async def list_files_by_flow(self, flow_ids: Sequence[str]) -> dict[str, list[str]]:
+        """List the files of several flows, leaving out the flows that have none.
+
+        The files of a flow are only read again when the modification time of its directory changed, which
+        also catches files saved by other workers.
+        """
+        return await anyio.to_thread.run_sync(self._list_files_by_flow, [str(flow_id) for flow_id in flow_ids])
+
+    def _list_files_by_flow(self, flow_ids: list[str]) -> dict[str, list[str]]:
+        data_dir = Path(self.data_dir)
+        files_by_flow: dict[str, list[str]] = {}
+        for flow_id in flow_ids:
+            folder_path = data_dir / flow_id
+            try:
+                modified_at = folder_path.stat().st_mtime_ns
+                entry = self._files_index.get(flow_id)
+                if entry is None or entry[0] != modified_at:
+                    with os.scandir(folder_path) as entries:
+                        entry = (modified_at, sorted(item.name for item in entries if item.is_file()))
+                    self._files_index[flow_id] = entry
+            except (FileNotFoundError, NotADirectoryError):
+                self._files_index.pop(flow_id, None)
+                continue
+            if entry[1]:
+                files_by_flow[flow_id] = entry[1]
+        return files_by_flow
+
     async def delete_file(self, flow_id: str, file_name: str) -> None:
         """Delete a file from the local storage.
 
@@ -105,6 +191,7 @@ class LocalStorageService(StorageService):
         file_path = self.data_dir / flow_id / file_name
         if await file_path.exists():
             await file_path.unlink()
+            self._files_index.pop(flow_id, None)
             logger.info(f"File {file_name} deleted successfully from flow {flow_id}.")
         else:
             logger.warning(f"Attempted to delete non-existent file {file_name} in flow {flow_id}.")
@@ -1,8 +1,14 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService
+
+# S3 requires every part of a multipart upload but the last one to be at least 5 MiB
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
 
 
 class S3StorageService(StorageService):
@@ -36,6 +42,71 @@ class S3StorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in folder {folder}")
             raise
 
+    async def save_file_stream(self, flow_id: str, file_name: str, stream: AsyncIterable[bytes]) -> int:
+        """Save a file to the S3 bucket with a multipart upload, one part at a time.
+
+        Files smaller than a single part are uploaded with a plain `put_object`.
+
+        Args:
+            flow_id: The folder in the bucket to save the file.
+            file_name: The name of the file to be saved.
+            stream: An async iterable yielding the byte content of the file.
+
+        Returns:
+            The size of the saved file in bytes.
+        """
+        key = f"{flow_id}/{file_name}"
+        buffer = bytearray()
+        parts: list[dict] = []
+        upload_id = None
+        size = 0
+        try:
+            async for chunk in stream:
+                buffer += chunk
+                size += len(chunk)
+                if len(buffer) < MULTIPART_PART_SIZE:
+                    continue
+                if upload_id is None:
+                    upload = await asyncio.to_thread(
+                        self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key
+                    )
+                    upload_id = upload["UploadId"]
+                parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                buffer.clear()
+
+            if upload_id is None:
+                await asyncio.to_thread(self.s3_client.put_object, Bucket=self.bucket, Key=key, Body=bytes(buffer))
+            else:
+                if buffer:
+                    parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+            logger.info(f"File {file_name} saved successfully in folder {flow_id}.")
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in folder {flow_id}")
+            if upload_id is not None:
+                await asyncio.to_thread(
+                    self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+                )
+            raise
+        return size
+
+    async def _upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> dict:
+        response = await asyncio.to_thread(
+            self.s3_client.upload_part,
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
     async def get_file(self, folder: str, file_name: str):
         """Retrieve a file from the S3 bucket.
 
@@ -57,6 +128,30 @@ class S3StorageService(StorageService):
             logger.exception(f"Error retrieving file {file_name} from folder {folder}")
             raise
 
+    async def get_file_stream(
+        self, flow_id: str, file_name: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Yield the content of a file from the S3 bucket in chunks.
+
+        Raises:
+            Exception: If an error occurs during file retrieval.
+        """
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.get_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}"
+            )
+        except ClientError:
+            logger.exception(f"Error retrieving file {file_name} from folder {flow_id}")
+            raise
+
+        body = response["Body"]
+        try:
+            chunks = body.iter_chunks(chunk_size)
+            while chunk := await asyncio.to_thread(next, chunks, b""):
+                yield chunk
+        finally:
+            body.close()
+
     async def list_files(self, folder: str):
         """List all files in a specified folder of the S3 bucket.
 
@@ -101,4 +196,12 @@ class S3StorageService(StorageService):
         # No specific teardown actions required for S3 storage at the moment.
 
     async def get_file_size(self, flow_id: str, file_name: str):
-        raise NotImplementedError
+        """Get the size of a file in the S3 bucket without downloading it."""
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}"
+            )
+        except ClientError:
+            logger.exception(f"Error retrieving the size of file {file_name} from folder {flow_id}")
+            raise
+        return response["ContentLength"]
@@ -8,10 +8,16 @@ import anyio
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Sequence
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
 
+# Size of the chunks files are read and written with when streaming
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
 class StorageService(Service):
     name = "storage_service"
 
@@ -35,10 +41,49 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def save_file_stream(self, flow_id: str, file_name: str, stream: AsyncIterable[bytes]) -> int:
+        """Save a file from an async iterable of byte chunks and return its size.
+
+        The default implementation buffers the whole stream, storages that can write
+        incrementally should override it.
+        """
+        chunks = [chunk async for chunk in stream]
+        data = b"".join(chunks)
+        await self.save_file(flow_id=flow_id, file_name=file_name, data=data)
+        return len(data)
+
+    async def get_file_stream(
+        self, flow_id: str, file_name: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Yield the content of a file in chunks of at most `chunk_size` bytes.
+
+        The default implementation reads the whole file, storages that can read
+        incrementally should override it.
+        """
+        content = await self.get_file(flow_id=flow_id, file_name=file_name)
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
 
+    async def list_files_by_flow(self, flow_ids: Sequence[str]) -> dict[str, list[str]]:
+        """List the files of several flows, leaving out the flows that have none.
+
+        The default implementation lists the flows one by one, storages that can tell whether the files
+        of a flow changed should override it.
+        """
+        files_by_flow: dict[str, list[str]] = {}
+        for flow_id in flow_ids:
+            try:
+                files = await self.list_files(flow_id=str(flow_id))
+            except FileNotFoundError:
+                continue
+            if files:
+                files_by_flow[str(flow_id)] = sorted(files)
+        return files_by_flow
+
     @abstractmethod
     async def get_file_size(self, flow_id: str, file_name: str):
         raise NotImplementedError
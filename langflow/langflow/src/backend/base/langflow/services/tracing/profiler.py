@@ -0,0 +1,192 @@
+"""Opt-in profiler recording where the time of each flow run is spent.
+
+A profile is a tree of spans (scheduling wait, component builds, output methods, persistence, event
+emission) started by `Graph.initialize_run` when the `profile_runs` setting is enabled. Spans are
+attached to the span current in the context, so the tasks started during a run record their spans
+under the span that started them. Outside of a profiled run `profile_span` does nothing but read a
+context variable.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from functools import wraps
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from typing_extensions import Self
+
+# Number of profiles kept in memory, the oldest are discarded first
+MAX_PROFILES = 100
+# Spans recorded per run, beyond which they are only counted
+MAX_SPANS_PER_PROFILE = 20_000
+
+_current_span: ContextVar[Span | None] = ContextVar("langflow_profile_span", default=None)
+
+
+class Span:
+    __slots__ = ("category", "children", "end", "name", "profile", "start")
+
+    def __init__(self, name: str, category: str, profile: RunProfile) -> None:
+        self.name = name
+        self.category = category
+        self.profile = profile
+        self.start = time.perf_counter_ns()
+        self.end: int | None = None
+        self.children: list[Span] = []
+
+    def duration_ns(self, now: int) -> int:
+        return (self.end if self.end is not None else now) - self.start
+
+    def to_dict(self, origin: int, now: int) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "category": self.category,
+            "start_ms": (self.start - origin) / 1e6,
+            "duration_ms": self.duration_ns(now) / 1e6,
+            "children": [child.to_dict(origin, now) for child in self.children],
+        }
+
+
+class RunProfile:
+    """The spans recorded during a flow run."""
+
+    def __init__(self, run_id: str, user_id: str | None = None, name: str = "run") -> None:
+        self.run_id = run_id
+        self.user_id = user_id
+        self.span_count = 1
+        self.dropped_spans = 0
+        self.root = Span(name, "run", self)
+
+    @property
+    def finished(self) -> bool:
+        return self.root.end is not None
+
+    def finish(self) -> None:
+        if self.root.end is None:
+            self.root.end = time.perf_counter_ns()
+
+    def to_dict(self) -> dict[str, Any]:
+        now = time.perf_counter_ns()
+        return {
+            "run_id": self.run_id,
+            "finished": self.finished,
+            "duration_ms": self.root.duration_ns(now) / 1e6,
+            "dropped_spans": self.dropped_spans,
+            "root": self.root.to_dict(self.root.start, now),
+        }
+
+    def to_collapsed(self) -> str:
+        """Export the profile as collapsed stacks, one `frame;frame;frame microseconds` line per span.
+
+        The value of each line is the self time of the span, the time not covered by its children, so the
+        output can be fed to flamegraph tools. Children running concurrently can cover more than their
+        parent, in which case the parent has no self time.
+        """
+        now = time.perf_counter_ns()
+        lines: list[str] = []
+        stack: list[tuple[Span, str]] = [(self.root, _frame(self.root))]
+        while stack:
+            span, path = stack.pop()
+            children_time = sum(child.duration_ns(now) for child in span.children)
+            self_time_us = max(span.duration_ns(now) - children_time, 0) // 1000
+            if self_time_us:
+                lines.append(f"{path} {self_time_us}")
+            stack.extend((child, f"{path};{_frame(child)}") for child in reversed(span.children))
+        return "\n".join(lines) + "\n"
+
+
+def _frame(span: Span) -> str:
+    # Semicolons separate the frames and spaces the value
+    return f"{span.category}:{span.name}".replace(";", ",").replace(" ", "_")
+
+
+class profile_span:  # noqa: N801
+    """Record a span under the current span of a profiled run, as a sync or async context manager."""
+
+    __slots__ = ("_span", "_token", "category", "name")
+
+    def __init__(self, name: str, category: str) -> None:
+        self.name = name
+        self.category = category
+        self._span: Span | None = None
+        self._token = None
+
+    def __enter__(self) -> Self:
+        parent = _current_span.get()
+        if parent is None:
+            return self
+        profile = parent.profile
+        if profile.span_count >= MAX_SPANS_PER_PROFILE:
+            profile.dropped_spans += 1
+            return self
+        profile.span_count += 1
+        self._span = Span(self.name, self.category, profile)
+        parent.children.append(self._span)
+        self._token = _current_span.set(self._span)
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        if self._span is not None:
+            self._span.end = time.perf_counter_ns()
+            _current_span.reset(self._token)
+
+    async def __aenter__(self) -> Self:
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.__exit__(*exc_info)
+
+
+def bind_to_current_span(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Make a coroutine function record its spans under the current span, even if it runs in another context.
+
+    This is needed for background tasks, which don't run in the context they were scheduled from.
+    """
+    span = _current_span.get()
+    if span is None:
+        return func
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = _current_span.set(span)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _current_span.reset(token)
+
+    return wrapper
+
+
+class ProfileStore:
+    """The profiles of the most recent runs."""
+
+    def __init__(self, max_profiles: int = MAX_PROFILES) -> None:
+        self.max_profiles = max_profiles
+        self._profiles: OrderedDict[str, RunProfile] = OrderedDict()
+
+    def start(self, run_id: str, user_id: str | None = None, name: str = "run") -> RunProfile | None:
+        """Start profiling a run in the current context.
+
+        Returns None if the context is already profiling a run that is not finished, in which case the
+        spans of the new run (a subflow for instance) are recorded in that run.
+        """
+        current = _current_span.get()
+        if current is not None and not current.profile.finished:
+            return None
+        profile = RunProfile(run_id, user_id=user_id, name=name)
+        self._profiles[run_id] = profile
+        while len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+        _current_span.set(profile.root)
+        return profile
+
+    def get(self, run_id: str) -> RunProfile | None:
+        return self._profiles.get(run_id)
+
+
+profile_store = ProfileStore()
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from langflow.services.base import Service
+from langflow.services.tracing.worker import TraceWorker
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -75,9 +76,7 @@ class TraceContext:
         self.all_inputs: dict[str, dict] = defaultdict(dict)
         self.all_outputs: dict[str, dict] = defaultdict(dict)
 
-        self.traces_queue: asyncio.Queue = asyncio.Queue()
         self.running = False
-        self.worker_task: asyncio.Task | None = None
 
 
 class ComponentTraceContext:
@@ -120,25 +119,13 @@ class TracingService(Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
         self.deactivated = self.settings_service.settings.deactivate_tracing
-
-    async def _trace_worker(self, trace_context: TraceContext) -> None:
-        while trace_context.running or not trace_context.traces_queue.empty():
-            trace_func, args = await trace_context.traces_queue.get()
-            try:
-                trace_func(*args)
-            except Exception:  # noqa: BLE001
-                logger.exception("Error processing trace_func")
-            finally:
-                trace_context.traces_queue.task_done()
+        # Tracer callbacks of all the runs are called from the worker thread, in order
+        self.worker = TraceWorker()
 
     async def _start(self, trace_context: TraceContext) -> None:
         if trace_context.running or self.deactivated:
             return
-        try:
-            trace_context.running = True
-            trace_context.worker_task = asyncio.create_task(self._trace_worker(trace_context))
-        except Exception:  # noqa: BLE001
-            logger.exception("Error starting tracing service")
+        trace_context.running = True
 
     def _initialize_langsmith_tracer(self, trace_context: TraceContext) -> None:
         langsmith_tracer = _get_langsmith_tracer()
@@ -233,13 +220,7 @@ class TracingService(Service):
     async def _stop(self, trace_context: TraceContext) -> None:
         try:
             trace_context.running = False
-            # check the qeue is empty
-            if not trace_context.traces_queue.empty():
-                await trace_context.traces_queue.join()
-            if trace_context.worker_task:
-                trace_context.worker_task.cancel()
-                trace_context.worker_task = None
-
+            await self.worker.flush()
         except Exception:  # noqa: BLE001
             logger.exception("Error stopping tracing service")
 
@@ -260,8 +241,8 @@ class TracingService(Service):
     async def end_tracers(self, outputs: dict, error: Exception | None = None) -> None:
         """End the trace for a graph run.
 
-        - stop worker for current trace_context
-        - call end for all the tracers
+        - call end for all the tracers, after the pending component traces
+        - wait for the worker to run them
         """
         if self.deactivated:
             return
@@ -269,8 +250,8 @@ class TracingService(Service):
         if trace_context is None:
             msg = "called end_tracers but no trace context found"
             raise RuntimeError(msg)
+        self.worker.submit(self._end_all_tracers, trace_context, outputs, error)
         await self._stop(trace_context)
-        self._end_all_tracers(trace_context, outputs, error)
 
     @staticmethod
     def _cleanup_inputs(inputs: dict[str, Any]):
@@ -285,9 +266,7 @@ class TracingService(Service):
         component_trace_context: ComponentTraceContext,
         trace_context: TraceContext,
     ) -> None:
-        inputs = self._cleanup_inputs(component_trace_context.inputs)
-        component_trace_context.inputs = inputs
-        component_trace_context.inputs_metadata = component_trace_context.inputs_metadata or {}
+        inputs = component_trace_context.inputs
         for tracer in trace_context.tracers.values():
             if not tracer.ready:
                 continue
@@ -307,6 +286,8 @@ class TracingService(Service):
         self,
         component_trace_context: ComponentTraceContext,
         trace_context: TraceContext,
+        outputs: dict[str, Any],
+        logs: list[Log | dict[Any, Any]],
         error: Exception | None = None,
     ) -> None:
         for tracer in trace_context.tracers.values():
@@ -315,13 +296,30 @@ class TracingService(Service):
                     tracer.end_trace(
                         trace_id=component_trace_context.trace_id,
                         trace_name=component_trace_context.trace_name,
-                        outputs=trace_context.all_outputs[component_trace_context.trace_name],
+                        outputs=outputs,
                         error=error,
-                        logs=component_trace_context.logs[component_trace_context.trace_name],
+                        logs=logs,
                     )
                 except Exception:  # noqa: BLE001
                     logger.exception(f"Error ending trace {component_trace_context.trace_name}")
 
+    def _submit_end_component_traces(
+        self,
+        component_trace_context: ComponentTraceContext,
+        trace_context: TraceContext,
+        error: Exception | None,
+    ) -> None:
+        # The worker thread gets a snapshot, the flow keeps updating the outputs and logs of other components
+        trace_name = component_trace_context.trace_name
+        self.worker.submit(
+            self._end_component_traces,
+            component_trace_context,
+            trace_context,
+            dict(trace_context.all_outputs[trace_name]),
+            list(component_trace_context.logs[trace_name]),
+            error,
+        )
+
     @asynccontextmanager
     async def trace_component(
         self,
@@ -353,18 +351,18 @@ class TracingService(Service):
             msg = "called trace_component but no trace context found"
             raise RuntimeError(msg)
         trace_context.all_inputs[trace_name] |= inputs or {}
-        await trace_context.traces_queue.put((self._start_component_traces, (component_trace_context, trace_context)))
+        component_trace_context.inputs = self._cleanup_inputs(component_trace_context.inputs)
+        self.worker.submit(self._start_component_traces, component_trace_context, trace_context)
         try:
             yield self
         except Exception as e:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, e))
-            )
+            self._submit_end_component_traces(component_trace_context, trace_context, e)
             raise
         else:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, None))
-            )
+            self._submit_end_component_traces(component_trace_context, trace_context, None)
+
+    async def teardown(self) -> None:
+        await asyncio.to_thread(self.worker.close)
 
     @property
     def project_name(self):
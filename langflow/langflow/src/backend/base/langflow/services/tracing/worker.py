@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class TraceWorker:
+    """Runs tracer callbacks on a dedicated thread, away from the event loop.
+
+    Callbacks are queued in order and the thread drains them in batches, so the cost of the
+    tracer SDKs (serialization, network calls) is not paid by the components being traced.
+    The queue is bounded: when it is full the oldest callbacks are dropped and counted,
+    rather than growing without limit or slowing the flows down.
+    """
+
+    def __init__(self, max_queue_size: int = 10_000, max_batch_size: int = 256) -> None:
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self._queue: deque[tuple[int, contextvars.Context, Callable[..., Any], tuple[Any, ...]]] = deque()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        # Sequence number of the last submitted callback, and of the last one done with
+        self._submitted = 0
+        self._completed = 0
+        self._flush_waiters: list[tuple[int, asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self.processed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> None:
+        """Queue a tracer callback, run in a copy of the current context."""
+        context = contextvars.copy_context()
+        with self._condition:
+            if self._closed:
+                self.dropped += 1
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="langflow-trace-worker", daemon=True)
+                self._thread.start()
+            if len(self._queue) >= self.max_queue_size:
+                self._queue.popleft()
+                self.dropped += 1
+            self._submitted += 1
+            self._queue.append((self._submitted, context, func, args))
+            self._condition.notify()
+
+    async def flush(self) -> None:
+        """Wait until every callback submitted so far has been run (or dropped)."""
+        with self._condition:
+            target = self._submitted
+            if self._completed >= target or self._thread is None:
+                return
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._flush_waiters.append((target, loop, future))
+        await future
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.max_batch_size))]
+
+            failed = 0
+            for _, context, func, args in batch:
+                try:
+                    context.run(func, *args)
+                except Exception:  # noqa: BLE001
+                    failed += 1
+                    logger.exception("Error processing trace_func")
+
+            with self._condition:
+                self.processed += len(batch)
+                self.failed += failed
+                self.batches += 1
+                # Dropped callbacks are older than the ones that follow them in the queue
+                self._completed = batch[-1][0]
+                ready = [waiter for waiter in self._flush_waiters if waiter[0] <= self._completed]
+                self._flush_waiters = [waiter for waiter in self._flush_waiters if waiter[0] > self._completed]
+            for _, loop, future in ready:
+                try:
+                    loop.call_soon_threadsafe(_resolve, future)
+                except RuntimeError:
+                    # The loop waiting for the flush is already closed
+                    continue
+
+    def get_stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                "queued": len(self._queue),
+                "processed": self.processed,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "batches": self.batches,
+            }
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Run the callbacks still queued and stop the thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
@@ -136,9 +136,12 @@ async def teardown_services() -> None:
     async with get_db_service().with_session() as session:
         await teardown_superuser(get_settings_service(), session)
 
+    from langflow.memory import get_message_tail_cache
     from langflow.services.manager import service_manager
 
     await service_manager.teardown()
+    # The cached messages belong to the database of the services
+    get_message_tail_cache.cache_clear()
 
 
 def initialize_settings_service() -> None:
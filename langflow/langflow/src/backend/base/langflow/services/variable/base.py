@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Sequence
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,27 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def get_variables(self, user_id: UUID | str, names: Sequence[str], session: AsyncSession) -> dict[str, str]:
+        """Async get the values of several variables.
+
+        Variables that are not found are left out of the result, instead of raising an error.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+
+        Returns:
+            A dictionary with the values of the variables found, by name.
+        """
+        values = {}
+        for name in dict.fromkeys(names):
+            try:
+                values[name] = await self.get_variable(user_id=user_id, name=name, field="", session=session)
+            except ValueError:
+                continue
+        return values
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
@@ -15,6 +15,7 @@ from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 from langflow.services.variable.kubernetes_secrets import KubernetesSecretManager, encode_user_id
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from uuid import UUID
 
     from sqlmodel import Session
@@ -90,6 +91,18 @@ class KubernetesSecretService(VariableService, Service):
             raise TypeError(msg)
         return value
 
+    @override
+    async def get_variables(self, user_id: UUID | str, names: Sequence[str], session: AsyncSession) -> dict[str, str]:
+        variables = await asyncio.to_thread(self.kubernetes_secrets.get_secret, name=encode_user_id(user_id))
+        if not variables:
+            return {}
+        values = {}
+        for name in names:
+            value = variables.get(name, variables.get(CREDENTIAL_TYPE + "_" + name))
+            if value is not None:
+                values[name] = value
+        return values
+
     @override
     async def list_variables(
         self,
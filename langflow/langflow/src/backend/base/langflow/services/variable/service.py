@@ -4,8 +4,9 @@ import os
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
 from loguru import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
@@ -23,9 +24,36 @@ if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
 
 
+# Maximum number of decrypted variables kept in memory
+VARIABLE_CACHE_SIZE = 10_000
+
+
 class DatabaseVariableService(VariableService, Service):
+    """Variables stored encrypted in the database.
+
+    Decrypted values are cached for `variable_cache_ttl` seconds, so resolving the credentials of
+    a flow doesn't query the database and decrypt them again for every component and every run.
+    Updating or deleting a variable through the service invalidates it right away.
+    """
+
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        ttl = settings_service.settings.variable_cache_ttl
+        # (user id, name) -> (type, decrypted value)
+        self._cache: TTLCache[tuple[str, str], tuple[str | None, str]] | None = (
+            TTLCache(maxsize=VARIABLE_CACHE_SIZE, ttl=ttl) if ttl > 0 else None
+        )
+
+    def _cache_variable(self, variable: Variable) -> str:
+        value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        if self._cache is not None:
+            self._cache[str(variable.user_id), variable.name] = (variable.type, value)
+        return value
+
+    def _invalidate(self, user_id: UUID | str, *names: str) -> None:
+        if self._cache is not None:
+            for name in names:
+                self._cache.pop((str(user_id), name), None)
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -60,24 +88,52 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
+        cached = self._cache.get((str(user_id), name)) if self._cache is not None else None
+        if cached is not None:
+            variable_type, value = cached
+        else:
+            stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
+            variable = (await session.exec(stmt)).first()
 
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
+            if not variable or not variable.value:
+                msg = f"{name} variable not found."
+                raise ValueError(msg)
+            variable_type = variable.type
+            value = None
 
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+        if variable_type == CREDENTIAL_TYPE and field == "session_id":
             msg = (
                 f"variable {name} of type 'Credential' cannot be used in a Session ID field "
                 "because its purpose is to prevent the exposure of values."
             )
             raise TypeError(msg)
 
-        # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        if value is None:
+            # we decrypt the value
+            value = self._cache_variable(variable)
+        return value
+
+    async def get_variables(self, user_id: UUID | str, names: Sequence[str], session: AsyncSession) -> dict[str, str]:
+        values: dict[str, str] = {}
+        missing = []
+        for name in dict.fromkeys(names):
+            cached = self._cache.get((str(user_id), name)) if self._cache is not None else None
+            if cached is not None:
+                values[name] = cached[1]
+            else:
+                missing.append(name)
+        if not missing:
+            return values
+
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+        for variable in (await session.exec(stmt)).all():
+            if not variable.value:
+                continue
+            try:
+                values[variable.name] = self._cache_variable(variable)
+            except Exception as e:  # noqa: BLE001
+                logger.debug(f"Decryption failed for variable '{variable.name}': {e}")
+        return values
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -119,6 +175,7 @@ class DatabaseVariableService(VariableService, Service):
         encrypted = auth_utils.encrypt_api_key(value, settings_service=self.settings_service)
         variable.value = encrypted
         session.add(variable)
+        self._invalidate(user_id, name)
         await session.commit()
         await session.refresh(variable)
         return variable
@@ -132,6 +189,7 @@ class DatabaseVariableService(VariableService, Service):
     ):
         query = select(Variable).where(Variable.id == variable_id, Variable.user_id == user_id)
         db_variable = (await session.exec(query)).one()
+        previous_name = db_variable.name
         db_variable.updated_at = datetime.now(timezone.utc)
 
         variable.value = variable.value or ""
@@ -143,6 +201,7 @@ class DatabaseVariableService(VariableService, Service):
             setattr(db_variable, key, value)
 
         session.add(db_variable)
+        self._invalidate(user_id, previous_name, db_variable.name)
         await session.commit()
         await session.refresh(db_variable)
         return db_variable
@@ -160,6 +219,7 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{name} variable not found."
             raise ValueError(msg)
         await session.delete(variable)
+        self._invalidate(user_id, name)
         await session.commit()
 
     @override
@@ -170,6 +230,7 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
         await session.delete(variable)
+        self._invalidate(user_id, variable.name)
         await session.commit()
 
     async def create_variable(
@@ -190,6 +251,7 @@ class DatabaseVariableService(VariableService, Service):
         )
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
+        self._invalidate(user_id, name)
         await session.commit()
         await session.refresh(variable)
         return variable
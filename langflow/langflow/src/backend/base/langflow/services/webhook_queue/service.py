@@ -0,0 +1,428 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+from loguru import logger
+
+from langflow.services.base import Service
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from langflow.services.settings.service import SettingsService
+
+# Seconds clients are asked to wait before retrying a rejected webhook
+RETRY_AFTER_SECONDS = 5
+# Seconds a worker owns the runs it took without renewing them, after which they are run again
+LEASE_SECONDS = 30
+# Seconds idle workers wait before looking for runs queued by other workers or due for a retry
+POLL_INTERVAL_SECONDS = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhook_run (
+    id TEXT PRIMARY KEY,
+    flow_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    body TEXT NOT NULL,
+    idempotency_key TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    finished_at REAL,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    error TEXT,
+    UNIQUE (flow_id, idempotency_key)
+);
+CREATE INDEX IF NOT EXISTS ix_webhook_run_status ON webhook_run (status, available_at);
+CREATE INDEX IF NOT EXISTS ix_webhook_run_worker ON webhook_run (worker_id, status);
+"""
+
+
+class WebhookQueueFullError(Exception):
+    """Exception raised when a webhook is rejected because too many webhook runs are pending."""
+
+    def __init__(self, message: str, retry_after: int = RETRY_AFTER_SECONDS) -> None:
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class WebhookRunStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class WebhookRun:
+    id: str
+    flow_id: str
+    user_id: str
+    body: str
+    status: WebhookRunStatus
+    attempts: int
+    error: str | None = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> WebhookRun:
+        return cls(
+            id=row["id"],
+            flow_id=row["flow_id"],
+            user_id=row["user_id"],
+            body=row["body"],
+            status=WebhookRunStatus(row["status"]),
+            attempts=row["attempts"],
+            error=row["error"],
+        )
+
+
+class WebhookRunStore:
+    """The webhook runs, stored in a SQLite file shared by the workers of the server.
+
+    Every change is made in an immediate transaction, so workers of other processes can take runs
+    from the same file without running one twice.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def enqueue(
+        self, flow_id: str, user_id: str, body: str, idempotency_key: str | None = None, max_pending: int = 0
+    ) -> tuple[WebhookRun, bool]:
+        """Stores a new run, or returns the run stored with the same idempotency key for the flow.
+
+        Returns the run and whether it was created.
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            if idempotency_key is not None:
+                row = connection.execute(
+                    "SELECT * FROM webhook_run WHERE flow_id = ? AND idempotency_key = ?", (flow_id, idempotency_key)
+                ).fetchone()
+                if row is not None:
+                    return WebhookRun.from_row(row), False
+            if max_pending:
+                (pending,) = connection.execute(
+                    "SELECT COUNT(*) FROM webhook_run WHERE status IN (?, ?)",
+                    (WebhookRunStatus.QUEUED.value, WebhookRunStatus.RUNNING.value),
+                ).fetchone()
+                if pending >= max_pending:
+                    msg = "Too many webhook runs are pending. Please retry later."
+                    raise WebhookQueueFullError(msg)
+            run = WebhookRun(
+                id=str(uuid4()),
+                flow_id=flow_id,
+                user_id=user_id,
+                body=body,
+                status=WebhookRunStatus.QUEUED,
+                attempts=0,
+            )
+            connection.execute(
+                "INSERT INTO webhook_run (id, flow_id, user_id, body, idempotency_key, status, available_at,"
+                " created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (run.id, flow_id, user_id, body, idempotency_key, run.status.value, now, now),
+            )
+        return run, True
+
+    def claim(
+        self, worker_id: str, *, max_runs_per_flow: int = 0, max_attempts: int = 1, lease_seconds: float = LEASE_SECONDS
+    ) -> WebhookRun | None:
+        """Takes the oldest run that is due, skipping flows that already have `max_runs_per_flow` runs running.
+
+        Runs whose lease expired, because their worker stopped without finishing them, are queued again first.
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE webhook_run SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END,"
+                " finished_at = CASE WHEN attempts >= ? THEN ? END, worker_id = NULL, lease_expires_at = NULL,"
+                " error = 'The worker running the webhook stopped' WHERE status = ? AND lease_expires_at <= ?",
+                (
+                    max_attempts,
+                    WebhookRunStatus.FAILED.value,
+                    WebhookRunStatus.QUEUED.value,
+                    max_attempts,
+                    now,
+                    WebhookRunStatus.RUNNING.value,
+                    now,
+                ),
+            )
+            query = "SELECT * FROM webhook_run WHERE status = ? AND available_at <= ?"
+            params: list = [WebhookRunStatus.QUEUED.value, now]
+            if max_runs_per_flow:
+                query += (
+                    " AND flow_id NOT IN (SELECT flow_id FROM webhook_run WHERE status = ?"
+                    " GROUP BY flow_id HAVING COUNT(*) >= ?)"
+                )
+                params += [WebhookRunStatus.RUNNING.value, max_runs_per_flow]
+            row = connection.execute(f"{query} ORDER BY available_at LIMIT 1", params).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE webhook_run SET status = ?, attempts = attempts + 1, worker_id = ?, lease_expires_at = ?"
+                " WHERE id = ?",
+                (WebhookRunStatus.RUNNING.value, worker_id, now + lease_seconds, row["id"]),
+            )
+        run = WebhookRun.from_row(row)
+        run.status = WebhookRunStatus.RUNNING
+        run.attempts += 1
+        return run
+
+    def renew(self, worker_id: str, lease_seconds: float = LEASE_SECONDS) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE webhook_run SET lease_expires_at = ? WHERE worker_id = ? AND status = ?",
+                (time.time() + lease_seconds, worker_id, WebhookRunStatus.RUNNING.value),
+            )
+
+    def complete(self, run_id: str) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE webhook_run SET status = ?, finished_at = ?, worker_id = NULL, lease_expires_at = NULL,"
+                " error = NULL WHERE id = ?",
+                (WebhookRunStatus.SUCCEEDED.value, time.time(), run_id),
+            )
+
+    def fail(self, run_id: str, error: str, retry_at: float | None = None) -> None:
+        """Queues the run again at `retry_at`, or marks it as failed if there is no retry."""
+        with self._transaction() as connection:
+            if retry_at is None:
+                connection.execute(
+                    "UPDATE webhook_run SET status = ?, finished_at = ?, worker_id = NULL, lease_expires_at = NULL,"
+                    " error = ? WHERE id = ?",
+                    (WebhookRunStatus.FAILED.value, time.time(), error, run_id),
+                )
+            else:
+                connection.execute(
+                    "UPDATE webhook_run SET status = ?, available_at = ?, worker_id = NULL, lease_expires_at = NULL,"
+                    " error = ? WHERE id = ?",
+                    (WebhookRunStatus.QUEUED.value, retry_at, error, run_id),
+                )
+
+    def release(self, worker_id: str) -> None:
+        """Queues again the runs the worker did not finish, without counting the interrupted attempt."""
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE webhook_run SET status = ?, attempts = attempts - 1, worker_id = NULL, lease_expires_at = NULL"
+                " WHERE worker_id = ? AND status = ?",
+                (WebhookRunStatus.QUEUED.value, worker_id, WebhookRunStatus.RUNNING.value),
+            )
+
+    def purge(self, finished_before: float) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "DELETE FROM webhook_run WHERE status IN (?, ?) AND finished_at < ?",
+                (WebhookRunStatus.SUCCEEDED.value, WebhookRunStatus.FAILED.value, finished_before),
+            )
+
+    def get(self, run_id: str) -> WebhookRun | None:
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM webhook_run WHERE id = ?", (run_id,)).fetchone()
+        return WebhookRun.from_row(row) if row is not None else None
+
+    def count_by_status(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._connection.execute("SELECT status, COUNT(*) FROM webhook_run GROUP BY status").fetchall()
+        return {status.value: 0 for status in WebhookRunStatus} | {row[0]: row[1] for row in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+async def run_webhook(run: WebhookRun) -> None:
+    """Runs the flow of a webhook run with the body of its request as the data of its Webhook components."""
+    from langflow.api.v1.endpoints import simple_run_flow
+    from langflow.api.v1.schemas import SimplifiedAPIRequest
+    from langflow.services.database.models.flow.model import Flow
+    from langflow.services.database.models.flow.utils import get_all_webhook_components_in_flow
+    from langflow.services.database.models.user.model import User
+    from langflow.services.deps import session_scope
+
+    async with session_scope() as session:
+        flow = await session.get(Flow, UUID(run.flow_id))
+        user = await session.get(User, UUID(run.user_id))
+    if flow is None:
+        msg = f"Flow {run.flow_id} not found"
+        raise ValueError(msg)
+
+    tweaks = {component["id"]: {"data": run.body} for component in get_all_webhook_components_in_flow(flow.data)}
+    input_request = SimplifiedAPIRequest(
+        input_value="",
+        input_type="chat",
+        output_type="chat",
+        tweaks=tweaks,
+        session_id=None,
+    )
+    await simple_run_flow(flow=flow, input_request=input_request, api_key_user=user)
+
+
+class WebhookQueueService(Service):
+    """Durable queue of the flow runs triggered by webhooks.
+
+    Webhook requests are stored in a SQLite file and answered right away. A fixed number of workers
+    per process take the runs from the file and run them, so a burst of webhooks can't take over the
+    event loop serving the rest of the API, and runs survive restarts. Runs of a single flow are
+    limited across all processes, failing runs are retried with an exponential backoff, and requests
+    sent with an `Idempotency-Key` header are only run once per flow.
+
+    Workers own the runs they take for `LEASE_SECONDS` and renew them while running. Runs of workers
+    that stop without finishing them are queued again once their lease expires.
+    """
+
+    name = "webhook_queue_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        settings = settings_service.settings
+        self.workers = settings.webhook_queue_workers
+        self.max_runs_per_flow = settings.webhook_queue_max_runs_per_flow
+        self.max_pending = settings.webhook_queue_max_pending
+        self.max_attempts = max(settings.webhook_queue_max_attempts, 1)
+        self.retry_backoff = settings.webhook_queue_retry_backoff
+        self.retention = settings.webhook_queue_retention
+        self.lease_seconds: float = LEASE_SECONDS
+        self.poll_interval: float = POLL_INTERVAL_SECONDS
+        self.path = Path(settings.webhook_queue_path or Path(settings.config_dir) / "webhook_queue.db")
+        self._store: WebhookRunStore | None = None
+        self._worker_id = f"{os.getpid()}-{uuid4().hex[:8]}"
+        self._wakeup: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    @property
+    def store(self) -> WebhookRunStore:
+        if self._store is None:
+            self._store = WebhookRunStore(self.path)
+        return self._store
+
+    def is_started(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        if not self.enabled or self.is_started():
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._maintain()))
+        logger.debug(f"Started {self.workers} webhook workers on {self.path}")
+
+    async def enqueue(
+        self, flow_id: str | UUID, user_id: str | UUID, body: str, idempotency_key: str | None = None
+    ) -> tuple[WebhookRun, bool]:
+        """Stores a webhook run for the workers.
+
+        Returns the run and whether it was created, which is not the case when a run of the flow
+        was already stored with the same idempotency key.
+
+        Raises:
+            WebhookQueueFullError: If `webhook_queue_max_pending` runs are already waiting or running.
+        """
+        run, created = await asyncio.to_thread(
+            self.store.enqueue, str(flow_id), str(user_id), body, idempotency_key, self.max_pending
+        )
+        if created and self._wakeup is not None:
+            self._wakeup.set()
+        return run, created
+
+    async def get_run(self, run_id: str) -> WebhookRun | None:
+        return await asyncio.to_thread(self.store.get, run_id)
+
+    async def _work(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                run = await asyncio.to_thread(
+                    self.store.claim,
+                    self._worker_id,
+                    max_runs_per_flow=self.max_runs_per_flow,
+                    max_attempts=self.max_attempts,
+                    lease_seconds=self.lease_seconds,
+                )
+                if run is not None:
+                    await self._execute(run)
+            except sqlite3.Error:
+                # The database can stay locked by other processes, the worker must keep going
+                logger.exception("Error accessing the webhook queue")
+                await asyncio.sleep(self.poll_interval)
+                continue
+            if run is None:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                continue
+            # Finishing a run can make a run of the same flow available to the other workers
+            self._wakeup.set()
+
+    async def _execute(self, run: WebhookRun) -> None:
+        try:
+            await run_webhook(run)
+        except Exception as exc:  # noqa: BLE001
+            if run.attempts >= self.max_attempts:
+                logger.exception(f"Webhook run {run.id} of flow {run.flow_id} failed after {run.attempts} attempts")
+                await asyncio.to_thread(self.store.fail, run.id, str(exc))
+            else:
+                delay = self.retry_backoff * 2 ** (run.attempts - 1)
+                logger.warning(f"Webhook run {run.id} of flow {run.flow_id} failed, retrying in {delay:.1f}s: {exc}")
+                await asyncio.to_thread(self.store.fail, run.id, str(exc), time.time() + delay)
+        else:
+            await asyncio.to_thread(self.store.complete, run.id)
+
+    async def _maintain(self) -> None:
+        """Renews the leases of the running runs and drops the runs finished before the retention period."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await asyncio.to_thread(self.store.renew, self._worker_id, self.lease_seconds)
+                await asyncio.to_thread(self.store.purge, time.time() - self.retention)
+            except sqlite3.Error:
+                logger.exception("Error maintaining the webhook queue")
+
+    async def stop(self) -> None:
+        """Stops the workers and queues again the runs they were running."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if tasks:
+            await asyncio.to_thread(self.store.release, self._worker_id)
+
+    def get_stats(self) -> dict[str, int]:
+        return self.store.count_by_status()
+
+    async def teardown(self) -> None:
+        await self.stop()
+        if self._store is not None:
+            self._store.close()
+            self._store = None
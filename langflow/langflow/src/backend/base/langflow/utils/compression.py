@@ -1,5 +1,7 @@
 import gzip
 import json
+import zipfile
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from typing import Any
 
 from fastapi import Response
@@ -17,3 +19,47 @@ def compress_response(data: Any) -> Response:
         media_type="application/json",
         headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
     )
+
+
+class _ZipChunkBuffer:
+    """A write-only file object that collects what `zipfile` writes until it is drained."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_zip(entries: Iterable[tuple[str, bytes | AsyncIterable[bytes]]]) -> AsyncIterator[bytes]:
+    """Generate a ZIP archive chunk by chunk.
+
+    Each entry is a file name and its content, given either as bytes or as an async
+    iterable of byte chunks. Contents are consumed one entry at a time and the archive
+    is never held in memory as a whole, so it can be sent as a streaming response.
+    """
+    buffer = _ZipChunkBuffer()
+    with zipfile.ZipFile(buffer, "w") as zip_file:  # type: ignore[arg-type]
+        for file_name, content in entries:
+            # The size is not known up front, zip64 keeps entries larger than 2 GiB valid
+            with zip_file.open(file_name, "w", force_zip64=True) as entry:
+                if isinstance(content, bytes):
+                    entry.write(content)
+                else:
+                    async for chunk in content:
+                        entry.write(chunk)
+                        if data := buffer.drain():
+                            yield data
+            if data := buffer.drain():
+                yield data
+    if data := buffer.drain():
+        yield data
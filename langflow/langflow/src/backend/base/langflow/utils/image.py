@@ -1,8 +1,12 @@
 import base64
+import io
 import mimetypes
-from functools import lru_cache
+import threading
 from pathlib import Path
 
+from cachetools import LRUCache
+from PIL import Image as PILImage
+
 
 def convert_image_to_base64(image_path: str | Path) -> str:
     """Convert an image file to a base64 encoded string.
@@ -70,10 +74,111 @@ def create_data_url(image_path: str | Path, mime_type: str | None = None) -> str
     return f"data:{mime_type};base64,{base64_data}"
 
 
-@lru_cache(maxsize=50)
+def _read_image(image_path: Path, max_edge: int) -> bytes:
+    """Read an image file, downscaling it if its longest edge is larger than `max_edge` pixels."""
+    try:
+        image_bytes = image_path.read_bytes()
+    except OSError as e:
+        msg = f"Error reading image file: {e}"
+        raise OSError(msg) from e
+    if not max_edge:
+        return image_bytes
+
+    try:
+        with PILImage.open(io.BytesIO(image_bytes)) as image:
+            if max(image.size) <= max_edge or not image.format:
+                return image_bytes
+            image_format = image.format
+            image.thumbnail((max_edge, max_edge))
+            buffer = io.BytesIO()
+            image.save(buffer, format=image_format)
+    except (OSError, ValueError):
+        # Not an image Pillow can resize, send it as it is
+        return image_bytes
+    return buffer.getvalue()
+
+
+class ImageCache:
+    """Base64 encoded images for multimodal inputs, kept in memory across messages.
+
+    Entries are keyed by the path of the file along with its modification time and size,
+    so edited files are read again, and the cache is bounded by the total size of the
+    encoded images rather than by their number.
+    """
+
+    def __init__(self, max_bytes: int, max_edge: int = 0) -> None:
+        self.max_bytes = max_bytes
+        self.max_edge = max_edge
+        self._cache: LRUCache[tuple, str] | None = LRUCache(maxsize=max_bytes, getsizeof=len) if max_bytes else None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_data_url(self, image_path: str | Path, mime_type: str) -> str:
+        """Return the data URL of the image, reading and encoding the file only if it changed."""
+        if not image_path:
+            msg = "Image path cannot be empty"
+            raise ValueError(msg)
+        image_path = Path(image_path)
+        try:
+            stat = image_path.stat()
+        except FileNotFoundError as e:
+            msg = f"Image file not found: {image_path}"
+            raise FileNotFoundError(msg) from e
+        if not image_path.is_file():
+            msg = f"Path is not a file: {image_path}"
+            raise ValueError(msg)
+
+        key = (str(image_path), mime_type, stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None:
+            with self._lock:
+                data_url = self._cache.get(key)
+                if data_url is not None:
+                    self.hits += 1
+                    return data_url
+
+        base64_data = base64.b64encode(_read_image(image_path, self.max_edge)).decode("utf-8")
+        data_url = f"data:{mime_type};base64,{base64_data}"
+        with self._lock:
+            self.misses += 1
+            if self._cache is not None and len(data_url) <= self.max_bytes:
+                self._cache[key] = data_url
+        return data_url
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._cache) if self._cache is not None else 0,
+                "bytes": int(self._cache.currsize) if self._cache is not None else 0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._cache is not None:
+                self._cache.clear()
+
+
+_image_cache: ImageCache | None = None
+
+
+def get_image_cache() -> ImageCache:
+    """Return the image cache of the process, sized from the settings."""
+    global _image_cache  # noqa: PLW0603
+    if _image_cache is None:
+        from langflow.services.deps import get_settings_service
+
+        settings = get_settings_service().settings
+        _image_cache = ImageCache(max_bytes=settings.image_cache_max_bytes, max_edge=settings.image_max_edge)
+    return _image_cache
+
+
 def create_image_content_dict(image_path: str | Path, mime_type: str | None = None) -> dict:
     """Create a content dictionary for multimodal inputs from an image file.
 
+    The encoded image is cached until the file changes, see `ImageCache`.
+
     Args:
         image_path (str | Path): Path to the image file.
         mime_type (Optional[str], optional): MIME type of the image.
@@ -94,9 +199,9 @@ def create_image_content_dict(image_path: str | Path, mime_type: str | None = No
             raise ValueError(msg)
 
     try:
-        base64_data = convert_image_to_base64(image_path)
+        data_url = get_image_cache().get_data_url(image_path, mime_type)
     except (OSError, FileNotFoundError, ValueError) as e:
         msg = f"Failed to create image content dict: {e}"
         raise type(e)(msg) from e
 
-    return {"type": "image", "source_type": "url", "url": f"data:{mime_type};base64,{base64_data}"}
+    return {"type": "image", "source_type": "url", "url": data_url}
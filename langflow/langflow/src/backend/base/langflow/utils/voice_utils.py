@@ -1,9 +1,11 @@
 import asyncio
 import base64
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Protocol
 
 import numpy as np
-from scipy.signal import resample
+from scipy.signal import firwin, resample, upfirdn
 
 from langflow.logging import logger
 
@@ -14,6 +16,16 @@ BYTES_PER_SAMPLE = 2
 
 BYTES_PER_24K_FRAME = int(SAMPLE_RATE_24K * FRAME_DURATION_MS / 1000) * BYTES_PER_SAMPLE
 BYTES_PER_16K_FRAME = int(VAD_SAMPLE_RATE_16K * FRAME_DURATION_MS / 1000) * BYTES_PER_SAMPLE
+SAMPLES_PER_24K_FRAME = BYTES_PER_24K_FRAME // BYTES_PER_SAMPLE
+
+# 24kHz to 16kHz is upsampling by 2, then downsampling by 3
+RESAMPLE_UP = 2
+RESAMPLE_DOWN = 3
+RESAMPLE_FILTER_TAPS = 48
+# Maximum number of frames resampled and checked for speech at once
+VAD_MAX_BATCH_FRAMES = 50
+# Minimum size of the audio chunks sent to the client, 100ms of 24kHz audio
+MIN_AUDIO_CHUNK_BYTES = 5 * BYTES_PER_24K_FRAME
 
 
 def resample_24k_to_16k(frame_24k_bytes):
@@ -75,6 +87,141 @@ def resample_24k_to_16k(frame_24k_bytes):
 #
 
 
+class StreamingResampler:
+    """Polyphase 24kHz to 16kHz resampler for a stream of audio, keeping the filter state across calls.
+
+    Unlike `resample_24k_to_16k`, frames are not resampled in isolation, so there are no artifacts at
+    the frame boundaries, and any number of frames can be resampled in a single call.
+    """
+
+    def __init__(self, num_taps: int = RESAMPLE_FILTER_TAPS) -> None:
+        # Low-pass at the Nyquist frequency of the output, on the upsampled signal (gain compensates the zeros)
+        self._filter = firwin(num_taps, 1 / RESAMPLE_DOWN) * RESAMPLE_UP
+        # Input samples kept from the previous call to fill the filter, in whole resampling periods
+        history = -(-(num_taps - 1) // RESAMPLE_UP)
+        self._history_size = -(-history // RESAMPLE_DOWN) * RESAMPLE_DOWN
+        self._history = np.zeros(self._history_size, dtype=np.float32)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample int16 samples at 24kHz, returning the int16 samples at 16kHz.
+
+        The number of samples must be a multiple of 3, which is the case of whole 20ms frames.
+        """
+        if len(samples) % RESAMPLE_DOWN:
+            msg = f"Expected a multiple of {RESAMPLE_DOWN} samples, got {len(samples)}"
+            raise ValueError(msg)
+        signal = np.concatenate((self._history, samples.astype(np.float32)))
+        self._history = signal[-self._history_size :]
+        resampled = upfirdn(self._filter, signal, RESAMPLE_UP, RESAMPLE_DOWN)
+        start = self._history_size * RESAMPLE_UP // RESAMPLE_DOWN
+        resampled = resampled[start : start + len(samples) * RESAMPLE_UP // RESAMPLE_DOWN]
+        return np.clip(np.rint(resampled), -32768, 32767).astype(np.int16)
+
+
+class AudioRingBuffer:
+    """Accumulates 16-bit PCM audio received in chunks of any size and hands it out in whole frames.
+
+    The samples are kept in a preallocated ring, growing only when more audio is pending than it can
+    hold, so consuming audio from the front is O(1) instead of shifting the rest of a `bytearray`.
+    """
+
+    def __init__(self, capacity: int = VAD_MAX_BATCH_FRAMES * SAMPLES_PER_24K_FRAME) -> None:
+        self._buffer = np.zeros(capacity, dtype=np.int16)
+        self._start = 0
+        self._size = 0
+        # Odd byte of a chunk, waiting for the other half of its sample
+        self._partial = b""
+
+    def __len__(self) -> int:
+        """Number of samples pending."""
+        return self._size
+
+    def write(self, data: bytes) -> None:
+        if self._partial:
+            data = self._partial + data
+            self._partial = b""
+        if len(data) % BYTES_PER_SAMPLE:
+            self._partial = data[-1:]
+            data = data[:-1]
+        samples = np.frombuffer(data, dtype=np.int16)
+        if self._size + len(samples) > len(self._buffer):
+            self._grow(self._size + len(samples))
+
+        capacity = len(self._buffer)
+        end = (self._start + self._size) % capacity
+        first = min(len(samples), capacity - end)
+        self._buffer[end : end + first] = samples[:first]
+        self._buffer[: len(samples) - first] = samples[first:]
+        self._size += len(samples)
+
+    def _grow(self, size: int) -> None:
+        buffer = np.zeros(max(size, 2 * len(self._buffer)), dtype=np.int16)
+        buffer[: self._size] = self._peek(self._size)
+        self._buffer = buffer
+        self._start = 0
+
+    def _peek(self, count: int) -> np.ndarray:
+        end = self._start + count
+        if end <= len(self._buffer):
+            return self._buffer[self._start : end]
+        return np.concatenate((self._buffer[self._start :], self._buffer[: end - len(self._buffer)]))
+
+    def read_frames(self, frame_size: int, max_frames: int) -> np.ndarray:
+        """Remove and return the whole frames pending, at most `max_frames` of them, as a copy."""
+        count = min(self._size // frame_size, max_frames) * frame_size
+        samples = self._peek(count).copy()
+        self._start = (self._start + count) % len(self._buffer)
+        self._size -= count
+        return samples
+
+
+class VoiceActivityDetector(Protocol):
+    def is_speech(self, buf: bytes, sample_rate: int, length: int | None = None) -> bool: ...
+
+
+class VADPipeline:
+    """Checks a stream of 24kHz audio for speech, 20ms frame by 20ms frame.
+
+    Audio is accumulated in an `AudioRingBuffer`, and all the whole frames pending are resampled
+    to 16kHz with a single call to the `StreamingResampler` before running the VAD on each of them.
+    """
+
+    def __init__(self, vad: VoiceActivityDetector, max_batch_frames: int = VAD_MAX_BATCH_FRAMES) -> None:
+        self.vad = vad
+        self.max_batch_frames = max_batch_frames
+        self.buffer = AudioRingBuffer()
+        self.resampler = StreamingResampler()
+
+    def process(self, chunk_24k: bytes) -> list[bool]:
+        """Add a chunk of audio, returning whether each of the frames completed by it contains speech."""
+        self.buffer.write(chunk_24k)
+        results: list[bool] = []
+        while len(self.buffer) >= SAMPLES_PER_24K_FRAME:
+            samples_24k = self.buffer.read_frames(SAMPLES_PER_24K_FRAME, self.max_batch_frames)
+            audio_16k = self.resampler.process(samples_24k).tobytes()
+            results.extend(
+                self.vad.is_speech(audio_16k[offset : offset + BYTES_PER_16K_FRAME], VAD_SAMPLE_RATE_16K)
+                for offset in range(0, len(audio_16k), BYTES_PER_16K_FRAME)
+            )
+        return results
+
+
+def coalesce_audio_chunks(chunks: Iterable[bytes], min_bytes: int = MIN_AUDIO_CHUNK_BYTES) -> Iterator[bytes]:
+    """Join small chunks of 16-bit PCM audio into chunks of at least `min_bytes`, split on whole samples.
+
+    This way each chunk sent to the client is base64 encoded and serialized once for a useful amount of audio.
+    """
+    pending = bytearray()
+    for chunk in chunks:
+        pending += chunk
+        if len(pending) >= min_bytes:
+            size = len(pending) - len(pending) % BYTES_PER_SAMPLE
+            yield bytes(pending[:size])
+            pending = pending[size:]
+    if pending:
+        yield bytes(pending)
+
+
 async def write_audio_to_file(audio_base64: str, filename: str = "output_audio.raw") -> None:
     """Decode the base64-encoded audio and write (append) it to a file asynchronously."""
     try:
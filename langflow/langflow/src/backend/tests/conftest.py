@@ -396,6 +396,7 @@ async def client_fixture(
             db_dir = tempfile.mkdtemp()
             db_path = Path(db_dir) / "test.db"
             monkeypatch.setenv("LANGFLOW_DATABASE_URL", f"sqlite:///{db_path}")
+            monkeypatch.setenv("LANGFLOW_WEBHOOK_QUEUE_PATH", str(Path(db_dir) / "webhook_queue.db"))
             monkeypatch.setenv("LANGFLOW_AUTO_LOGIN", "false")
             if "load_flows" in request.keywords:
                 shutil.copyfile(
@@ -0,0 +1,29 @@
+import asyncio
+
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema import Data
+
+
+class SlowUpdateComponent(Component):
+    display_name = "Slow Update Component"
+    description = "Writes the value of the last update of a field into its info, after a delay."
+    name = "SlowUpdateComponent"
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text", real_time_refresh=True),
+        MessageTextInput(name="other_text", display_name="Other Text", real_time_refresh=True),
+    ]
+
+    outputs = [
+        Output(display_name="Output", name="output", method="build_output"),
+    ]
+
+    async def update_build_config(self, build_config, field_value, field_name=None):
+        if field_name in {"text", "other_text"}:
+            await asyncio.sleep(0.3)
+            build_config[field_name]["info"] = field_value
+        return build_config
+
+    def build_output(self) -> Data:
+        return Data(value=self.text)
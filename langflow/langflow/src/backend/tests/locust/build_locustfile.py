@@ -0,0 +1,140 @@
+import json
+import os
+import time
+from http import HTTPStatus
+
+from locust import FastHttpUser, between, constant, events, task
+
+
+@events.quitting.add_listener
+def _(environment, **_kwargs):
+    """Fail the run if the builds of regular users fail or get rejected."""
+    build_stats = environment.stats.get("/api/v1/build/[flow_id]/flow (regular)", "POST")
+    if build_stats.num_requests and build_stats.fail_ratio > 0.01:
+        environment.process_exit_code = 1
+    environment.runner.quit()
+
+
+class BaseBuildUser(FastHttpUser):
+    """Builds a flow through the Playground build endpoints and waits for the end of the build.
+
+    Environment Variables:
+      - LANGFLOW_HOST: Base URL for the Langflow server (default: http://localhost:7860)
+      - FLOW_ID: UUID of the flow to build (Required)
+      - API_KEY: API key of the regular users, sent as header 'x-api-key' (Required)
+      - NOISY_API_KEY: API key of another user, spamming builds (Required)
+      - REQUEST_TIMEOUT: Timeout for each request in seconds (default: 30.0)
+      - BUILD_TIMEOUT: Time to wait for a build to end in seconds (default: 120.0)
+    """
+
+    abstract = True
+    connection_timeout = float(os.getenv("REQUEST_TIMEOUT", "30.0"))
+    network_timeout = float(os.getenv("REQUEST_TIMEOUT", "30.0"))
+    host = os.getenv("LANGFLOW_HOST", "http://localhost:7860")
+    flow_id = os.getenv("FLOW_ID")
+    build_timeout = float(os.getenv("BUILD_TIMEOUT", "120.0"))
+    label = "regular"
+
+    def api_key(self) -> str | None:
+        return os.getenv("API_KEY")
+
+    def on_start(self):
+        """Setup and validate required configurations."""
+        if not self.api_key():
+            msg = "API_KEY environment variable is required for load testing"
+            raise ValueError(msg)
+        if not self.flow_id:
+            msg = "FLOW_ID environment variable is required for load testing"
+            raise ValueError(msg)
+
+    def start_build(self) -> str | None:
+        """Starts a build and returns its job id, or None if the build was rejected or failed."""
+        headers = {"x-api-key": self.api_key(), "Content-Type": "application/json"}
+        payload = {"inputs": {"input_value": "Hello from the load test"}}
+        with self.client.post(
+            f"/api/v1/build/{self.flow_id}/flow",
+            json=payload,
+            headers=headers,
+            name=f"/api/v1/build/[flow_id]/flow ({self.label})",
+            catch_response=True,
+        ) as response:
+            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                self.on_rejected(response)
+                return None
+            if response.status_code != HTTPStatus.OK:
+                response.failure(f"Unexpected status code: {response.status_code}, Response: {response.text[:200]}")
+                return None
+            return response.json()["job_id"]
+
+    def on_rejected(self, response) -> None:
+        response.failure("Build rejected with 429")
+
+    def wait_for_build(self, job_id: str) -> None:
+        """Polls the build events until the end event, recording the total build time."""
+        headers = {"x-api-key": self.api_key()}
+        start_time = time.time()
+        while time.time() - start_time < self.build_timeout:
+            response = self.client.get(
+                f"/api/v1/build/{job_id}/events?event_delivery=polling",
+                headers=headers,
+                name=f"/api/v1/build/[job_id]/events ({self.label})",
+            )
+            if response.status_code != HTTPStatus.OK:
+                break
+            events = [json.loads(line) for line in response.text.splitlines() if line.strip()]
+            if any(event.get("event") in {"end", "error"} for event in events):
+                self.environment.events.request.fire(
+                    request_type="BUILD",
+                    name=f"complete build ({self.label})",
+                    response_time=(time.time() - start_time) * 1000,
+                    response_length=0,
+                    exception=None,
+                )
+                return
+        self.environment.events.request.fire(
+            request_type="BUILD",
+            name=f"complete build ({self.label})",
+            response_time=(time.time() - start_time) * 1000,
+            response_length=0,
+            exception=TimeoutError(f"Build {job_id} did not end in {self.build_timeout}s"),
+        )
+
+    @task
+    def build_flow(self):
+        job_id = self.start_build()
+        if job_id:
+            self.wait_for_build(job_id)
+
+
+class PlaygroundUser(BaseBuildUser):
+    """A regular user, building a flow now and then. Its builds should never be starved."""
+
+    weight = 5
+    wait_time = between(2, 5)
+
+
+class NoisyPlaygroundUser(BaseBuildUser):
+    """A single user spamming builds without waiting for them to end.
+
+    Rejections with 429 are expected for this user once its queue quota is reached.
+    """
+
+    fixed_count = 1
+    wait_time = constant(0.05)
+    label = "noisy"
+
+    def api_key(self) -> str | None:
+        return os.getenv("NOISY_API_KEY")
+
+    def on_start(self):
+        if not self.api_key():
+            msg = "NOISY_API_KEY environment variable is required for load testing"
+            raise ValueError(msg)
+        super().on_start()
+
+    def on_rejected(self, response) -> None:
+        response.success()
+
+    @task
+    def build_flow(self):
+        self.start_build()
@@ -0,0 +1,92 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from langflow.memory import aadd_messagetables, aget_messages, get_message_tail_cache
+from langflow.services.database.models.message.model import MessageTable
+from langflow.services.deps import get_settings_service, session_scope
+
+SESSION_MESSAGES = 20_000
+TURNS = 20
+WINDOW = 10
+
+
+async def _fill_session(session_id: str) -> None:
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    messages = [
+        MessageTable(
+            text=f"Message {index}",
+            sender="User" if index % 2 == 0 else "Machine",
+            sender_name="User" if index % 2 == 0 else "AI",
+            session_id=session_id,
+            timestamp=start + timedelta(seconds=index),
+            category="message",
+        )
+        for index in range(SESSION_MESSAGES)
+    ]
+    async with session_scope() as session:
+        for message in messages:
+            session.add(message)
+
+
+async def _turn_latency(fetch) -> float:
+    start = time.perf_counter()
+    for _ in range(TURNS):
+        history = await fetch()
+        assert len(history) == WINDOW
+    return (time.perf_counter() - start) / TURNS
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("client")
+@pytest.mark.timeout(600)
+async def test_chat_history_fetch_per_turn(monkeypatch):
+    """Reading the last messages of a long session should not depend on how long the session is."""
+    session_id = "long_session"
+    await _fill_session(session_id)
+    monkeypatch.setattr(get_settings_service().settings, "message_tail_cache_max_sessions", 100)
+    get_message_tail_cache.cache_clear()
+    tail_cache = get_message_tail_cache()
+
+    async def previous_fetch():
+        # The Message History component used to load up to 10000 messages and slice the window in Python
+        messages = await aget_messages(session_id=session_id, limit=10000, order="DESC")
+        return messages[:WINDOW]
+
+    async def windowed_fetch():
+        return await aget_messages(session_id=session_id, limit=WINDOW, order="DESC")
+
+    async def add_turn(index: int) -> None:
+        message = MessageTable(
+            text=f"Turn {index}",
+            sender="User",
+            sender_name="User",
+            session_id=session_id,
+            timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=index),
+            category="message",
+        )
+        async with session_scope() as session:
+            await aadd_messagetables([message], session)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(tail_cache, "enabled", False)
+        previous = await _turn_latency(previous_fetch)
+        sql_window = await _turn_latency(windowed_fetch)
+
+    await windowed_fetch()
+    start = time.perf_counter()
+    for index in range(TURNS):
+        await add_turn(index)
+        history = await windowed_fetch()
+        assert history[0].text == f"Turn {index}"
+    cached_with_writes = (time.perf_counter() - start) / TURNS
+    cached = await _turn_latency(windowed_fetch)
+    get_message_tail_cache.cache_clear()
+
+    print(  # noqa: T201
+        f"history fetch per turn over {SESSION_MESSAGES} messages: "
+        f"limit=10000 {previous * 1000:.2f}ms, SQL window {sql_window * 1000:.2f}ms, "
+        f"tail cache {cached * 1000:.2f}ms, tail cache with a stored message per turn {cached_with_writes * 1000:.2f}ms"
+    )
+    assert sql_window < previous
+    assert cached < sql_window
@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from langflow.interface.component_manifest import abuild_component_manifest
+
+# Loads the built-in components in a fresh interpreter, the way the server does at startup, and reports
+# how long it took, the peak resident memory and how many component modules were imported.
+STARTUP_SCRIPT = """
+import asyncio, json, resource, sys, time
+from pathlib import Path
+
+
+def max_rss_mb():
+    # ru_maxrss is kept across exec on Linux, so it would include the memory of the test process
+    status = Path("/proc/self/status")
+    if status.exists():
+        line = next(line for line in status.read_text().splitlines() if line.startswith("VmHWM:"))
+        return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 / 1024
+
+start = time.perf_counter()
+from langflow.interface import component_manifest
+from langflow.interface.components import import_langflow_components
+
+component_manifest.MANIFEST_PATH = Path(sys.argv[1])
+result = asyncio.run(import_langflow_components())
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "max_rss_mb": max_rss_mb(),
+    "components": sum(len(components) for components in result["components"].values()),
+    "modules": sum(name.startswith("langflow.components.") for name in sys.modules),
+}))
+"""
+
+
+def _cold_start(manifest_path) -> dict:
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", STARTUP_SCRIPT, str(manifest_path)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.benchmark
+@pytest.mark.no_blockbuster
+@pytest.mark.timeout(600)
+async def test_cold_start_with_the_component_manifest(tmp_path):
+    """Loading the components from the manifest should be faster and lighter than importing them."""
+    manifest_path = await abuild_component_manifest(tmp_path / "component_manifest.json")
+
+    scan = _cold_start(tmp_path / "missing.json")
+    manifest = _cold_start(manifest_path)
+
+    print(  # noqa: T201
+        f"scan: {scan['seconds']:.2f}s, {scan['max_rss_mb']:.0f}MB, {scan['modules']} modules imported\n"
+        f"manifest: {manifest['seconds']:.2f}s, {manifest['max_rss_mb']:.0f}MB, {manifest['modules']} modules imported"
+    )
+    # Building some templates depends on the network, so a scan can miss a few of them
+    assert manifest["components"] >= scan["components"] - 2
+    assert manifest["modules"] < scan["modules"]
+    assert manifest["seconds"] < scan["seconds"]
+    assert manifest["max_rss_mb"] < scan["max_rss_mb"]
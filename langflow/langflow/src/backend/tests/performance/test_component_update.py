@@ -0,0 +1,90 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from langflow.api.v1 import endpoints
+from langflow.api.v1.schemas import UpdateCustomComponentRequest
+from langflow.custom import Component
+from langflow.custom.component_updates import get_component_template_cache
+from langflow.custom.utils import build_custom_component_template
+
+KEYSTROKES = 20
+TYPING_INTERVAL = 0.05
+
+
+async def _type_into_field(
+    client, headers, code: str, component_node: dict, node_id: str | None
+) -> tuple[float, float]:
+    """Sends an update per keystroke, like the editor does.
+
+    Returns the time until the last update is answered after the last keystroke, and the CPU time spent.
+    """
+    text = "".join(chr(ord("a") + index % 26) for index in range(KEYSTROKES))
+
+    async def update(value: str):
+        request = UpdateCustomComponentRequest(
+            code=code,
+            frontend_node=component_node,
+            field="text",
+            field_value=value,
+            template=component_node["template"],
+            node_id=node_id,
+        )
+        response = await client.post("api/v1/custom_component/update", json=request.model_dump(), headers=headers)
+        assert response.status_code == 200
+        return response.json()
+
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    requests = []
+    for index in range(1, KEYSTROKES + 1):
+        requests.append(asyncio.create_task(update(text[:index])))
+        await asyncio.sleep(TYPING_INTERVAL)
+    results = await asyncio.gather(*requests)
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    assert results[-1]["template"]["text"]["info"] == text
+    return elapsed - KEYSTROKES * TYPING_INTERVAL, cpu
+
+
+@pytest.mark.benchmark
+async def test_updates_sent_while_typing(client, logged_in_headers, monkeypatch):
+    """Only the last of a burst of updates of a field should be run to the end."""
+    path = Path(__file__).parents[1] / "data" / "slow_update_component.py"
+    code = path.read_text(encoding="utf-8")
+    component_node, _ = build_custom_component_template(Component(_code=code))
+    cache = get_component_template_cache()
+    completed_updates = 0
+    update_component_build_config = endpoints.update_component_build_config
+
+    async def counting_update(*args, **kwargs):
+        nonlocal completed_updates
+        await update_component_build_config(*args, **kwargs)
+        completed_updates += 1
+
+    monkeypatch.setattr(endpoints, "update_component_build_config", counting_update)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(cache, "enabled", False)
+        uncoalesced, uncoalesced_cpu = await _type_into_field(
+            client, logged_in_headers, code, component_node, node_id=None
+        )
+    uncoalesced_updates = completed_updates
+
+    cache.invalidate()
+    completed_updates = 0
+    coalesced, coalesced_cpu = await _type_into_field(
+        client, logged_in_headers, code, component_node, node_id="SlowUpdate-abc12"
+    )
+
+    print(  # noqa: T201
+        f"{KEYSTROKES} updates sent {TYPING_INTERVAL * 1000:.0f}ms apart: "
+        f"{uncoalesced_updates} run to the end, {uncoalesced_cpu * 1000:.0f}ms CPU, last answered "
+        f"{uncoalesced * 1000:.0f}ms after the last keystroke without coalescing; "
+        f"{completed_updates} run to the end, {coalesced_cpu * 1000:.0f}ms CPU, last answered "
+        f"{coalesced * 1000:.0f}ms after the last keystroke with coalescing"
+    )
+    assert uncoalesced_updates == KEYSTROKES
+    assert completed_updates < KEYSTROKES // 2
+    assert coalesced_cpu < uncoalesced_cpu
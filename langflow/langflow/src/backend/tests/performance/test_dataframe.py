@@ -0,0 +1,85 @@
+import time
+
+import pytest
+from langflow.components.processing.data_to_dataframe import DataToDataFrameComponent
+from langflow.components.processing.dataframe_operations import DataFrameOperationsComponent
+from langflow.schema.data import Data
+from langflow.schema.dataframe import DataFrame
+
+APPENDED_ROWS = 100_000
+ADD_ROW_CALLS = 2_000
+ROWS = 100_000
+COLUMNS = 10
+
+
+def _row(index: int) -> dict:
+    return {"name": f"item {index}", "number": index, "score": index / 7, **{f"field_{i}": f"v{i}" for i in range(7)}}
+
+
+@pytest.mark.benchmark
+def test_append_rows():
+    """Appending rows one by one should take linear time."""
+    start = time.perf_counter()
+    dataframe = DataFrame()
+    for index in range(ADD_ROW_CALLS):
+        dataframe = dataframe.add_row(_row(index))
+    add_row = (time.perf_counter() - start) / ADD_ROW_CALLS
+
+    start = time.perf_counter()
+    buffer = DataFrame().row_buffer()
+    for index in range(APPENDED_ROWS):
+        buffer.append(_row(index))
+    dataframe = buffer.to_dataframe()
+    buffered = (time.perf_counter() - start) / APPENDED_ROWS
+
+    print(  # noqa: T201
+        f"add_row: {add_row * 1e6:.0f}us per row over {ADD_ROW_CALLS} rows; "
+        f"row buffer: {buffered * 1e6:.1f}us per row over {APPENDED_ROWS} rows"
+    )
+    assert len(dataframe) == APPENDED_ROWS
+    assert dataframe["number"].tolist() == list(range(APPENDED_ROWS))
+    assert buffered < add_row / 10
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("dtype_backend", [None, "pyarrow"])
+def test_round_trip_through_processing_components(dtype_backend):
+    """A million cells should go from Data objects through the DataFrame components and back."""
+    if dtype_backend == "pyarrow":
+        pytest.importorskip("pyarrow")
+    data_list = [Data(data=_row(index)) for index in range(ROWS)]
+
+    start = time.perf_counter()
+    dataframe = DataToDataFrameComponent(data_list=data_list).build_dataframe()
+    if dtype_backend is not None:
+        dataframe = DataFrame.from_data_list(dataframe.to_data_list(), dtype_backend=dtype_backend)
+    built = time.perf_counter() - start
+
+    component = DataFrameOperationsComponent(
+        df=dataframe,
+        operation=[{"name": "Filter"}],
+        column_name="name",
+        filter_operator="contains",
+        filter_value="99",
+    )
+    start = time.perf_counter()
+    filtered = component.perform_operation()
+    operated = time.perf_counter() - start
+
+    start = time.perf_counter()
+    records = dataframe.to_dict(orient="records")
+    records_data = [Data(data=row) for row in records]
+    through_records = time.perf_counter() - start
+    start = time.perf_counter()
+    round_trip = dataframe.to_data_list()
+    columnar = time.perf_counter() - start
+
+    print(  # noqa: T201
+        f"{ROWS * COLUMNS} cells ({dtype_backend or 'numpy'}): built in {built:.2f}s, "
+        f"filtered to {len(filtered)} rows in {operated:.3f}s, back to Data objects in {columnar:.2f}s "
+        f"({through_records:.2f}s through to_dict records)"
+    )
+    assert dataframe.shape == (ROWS, COLUMNS)
+    assert len(filtered) == sum("99" in f"item {index}" for index in range(ROWS))
+    assert [item.data for item in round_trip[:100]] == [item.data for item in records_data[:100]]
+    assert columnar < through_records
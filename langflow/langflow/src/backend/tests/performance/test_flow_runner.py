@@ -0,0 +1,74 @@
+import json
+import time
+from uuid import uuid4
+
+import pytest
+from langflow.components.input_output import ChatInput, ChatOutput
+from langflow.graph import Graph
+from langflow.services.deps import get_db_service
+from langflow.services.flow.flow_runner import LangflowRunnerExperimental
+from sqlalchemy import event
+
+RUNS = 20
+
+
+def _flow_file(tmp_path):
+    chat_input = ChatInput(_id="ChatInput-bench", should_store_message=False)
+    chat_output = ChatOutput(_id="ChatOutput-bench", should_store_message=False)
+    chat_output.set(input_value=chat_input.message_response)
+    flow_dict = Graph(chat_input, chat_output).dump(name="bench_flow")
+    flow_dict["id"] = str(uuid4())
+    chat_output_node = next(node for node in flow_dict["data"]["nodes"] if node["id"] == "ChatOutput-bench")
+    sender_name = chat_output_node["data"]["node"]["template"]["sender_name"]
+    sender_name["load_from_db"] = True
+    sender_name["value"] = "BENCH_SENDER_NAME"
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(json.dumps(flow_dict), encoding="utf-8")
+    return flow_path
+
+
+async def _run_repeatedly(flow_runner: LangflowRunnerExperimental, flow_path) -> tuple[float, int]:
+    statements = 0
+
+    def count_statement(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    engine = get_db_service().engine.sync_engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        start = time.perf_counter()
+        for index in range(RUNS):
+            result = await flow_runner.run(
+                session_id=str(uuid4()),
+                flow=flow_path,
+                input_value=f"Hello {index}",
+                tweaks_values={"BENCH_SENDER_NAME": "Bot"},
+            )
+            message = result[0].outputs[0].results["message"]
+            assert (message.text, message.sender_name) == (f"Hello {index}", "Bot")
+        elapsed = (time.perf_counter() - start) / RUNS
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+    return elapsed, statements // RUNS
+
+
+@pytest.mark.benchmark
+async def test_repeated_runs_of_a_flow_file(tmp_path):
+    """Runs of an unchanged flow file should not store the flow or prepare it again."""
+    flow_path = _flow_file(tmp_path)
+    flow_runner = LangflowRunnerExperimental()
+    embedded_runner = LangflowRunnerExperimental(embedded=True)
+    # Warm up the database and the component classes
+    for runner in (flow_runner, embedded_runner):
+        await runner.run(session_id=str(uuid4()), flow=flow_path, input_value="warm up")
+
+    default, default_statements = await _run_repeatedly(flow_runner, flow_path)
+    embedded, embedded_statements = await _run_repeatedly(embedded_runner, flow_path)
+
+    print(  # noqa: T201
+        f"{RUNS} runs of the same flow file: {default * 1000:.1f}ms and {default_statements} SQL statements per run "
+        f"by default, {embedded * 1000:.1f}ms and {embedded_statements} SQL statements per run embedded"
+    )
+    assert embedded_statements < default_statements
+    assert embedded < default
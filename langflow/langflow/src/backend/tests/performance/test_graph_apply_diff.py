@@ -0,0 +1,54 @@
+import copy
+import time
+
+import orjson
+import pytest
+from langflow.graph import Graph
+
+from tests.performance.test_graph_engine import generate_payload
+
+SIZE = 300
+RUNS = 10
+FLOW_ID = "a0f1c6e4-5d0c-4b53-9a63-3e9c6a1f8b71"
+
+
+def _edit(payload: dict, value: str) -> dict:
+    """Change one field of the component in the middle of the flow, like an edit in the Playground."""
+    payload = copy.deepcopy(payload)
+    node = payload["nodes"][SIZE // 2]
+    node["data"]["node"]["template"]["input_value"]["value"] = value
+    return payload
+
+
+def _time_full_rebuild(payload: dict) -> float:
+    start = time.perf_counter()
+    graph = Graph.from_payload(payload, flow_id=FLOW_ID)
+    graph.sort_vertices()
+    return time.perf_counter() - start
+
+
+def _time_apply_diff(graph: Graph, payload: dict) -> float:
+    start = time.perf_counter()
+    diff = graph.apply_diff(payload)
+    graph.sort_vertices()
+    elapsed = time.perf_counter() - start
+    assert len(diff.changed) == 1
+    return elapsed
+
+
+@pytest.mark.benchmark
+def test_apply_diff_of_a_single_field_edit():
+    """Patching a 300 components flow after a single field edit should be much faster than rebuilding it."""
+    payload = orjson.loads(generate_payload("chain", SIZE))
+    graph = Graph.from_payload(copy.deepcopy(payload), flow_id=FLOW_ID)
+    graph.sort_vertices()
+    edits = [_edit(payload, f"edit {index}") for index in range(RUNS)]
+
+    full_rebuild = min(_time_full_rebuild(copy.deepcopy(edit)) for edit in edits)
+    apply_diff = min(_time_apply_diff(graph, edit) for edit in edits)
+
+    print(  # noqa: T201
+        f"{SIZE} components: full rebuild {full_rebuild * 1000:.2f}ms, apply_diff {apply_diff * 1000:.2f}ms "
+        f"({full_rebuild / apply_diff:.1f}x faster)"
+    )
+    assert apply_diff * 5 < full_rebuild
@@ -0,0 +1,225 @@
+"""Benchmarks of the graph engine on synthetic flows of no-op components.
+
+The timings are divided by the time of a fixed Python workload, to be comparable across machines, and checked
+against `baselines/graph_engine.json`. A test fails when it is slower than its baseline by more than
+LANGFLOW_BENCHMARK_THRESHOLD (0.5 by default, i.e. 50%). Run with LANGFLOW_BENCHMARK_UPDATE=1 to record new
+baselines, and set LANGFLOW_BENCHMARK_SIZES (e.g. "10,100") to only run some of the flow sizes.
+"""
+
+import asyncio
+import gc
+import json
+import os
+import sys
+import time
+from collections import deque
+from functools import cache
+from pathlib import Path
+
+import orjson
+import pytest
+from langflow.custom.eval import eval_custom_component_code
+from langflow.graph import Graph
+
+BASELINES_PATH = Path(__file__).parent / "baselines" / "graph_engine.json"
+THRESHOLD = float(os.getenv("LANGFLOW_BENCHMARK_THRESHOLD", "0.5"))
+UPDATE_BASELINES = os.getenv("LANGFLOW_BENCHMARK_UPDATE", "").lower() in {"1", "true"}
+SIZES = [int(size) for size in os.getenv("LANGFLOW_BENCHMARK_SIZES", "10,100,1000,5000").split(",")]
+SHAPES = ["chain", "fan_out", "diamond", "cyclic"]
+OPERATIONS = ["from_payload", "sort_vertices", "prepare", "get_next_runnable_vertices", "process"]
+
+# Operations are repeated until they ran for this long, and the fastest run is kept
+MIN_MEASURE_SECONDS = 0.5
+MAX_REPEATS = 20
+# The largest flows take minutes to load and run
+BENCHMARK_TIMEOUT = 900
+
+NOOP_COMPONENT_CODE = """from langflow.custom import Component
+from langflow.io import HandleInput, Output
+from langflow.schema.message import Message
+
+
+class NoopComponent(Component):
+    display_name = "Noop"
+    inputs = [HandleInput(name="input_value", display_name="Input", input_types=["Message"], is_list=True)]
+    outputs = [Output(display_name="Output", name="output", method="build_output")]
+
+    def build_output(self) -> Message:
+        return Message(text="")
+"""
+
+
+@cache
+def _node_template() -> bytes:
+    graph = Graph()
+    graph.add_component(eval_custom_component_code(NOOP_COMPONENT_CODE)(_code=NOOP_COMPONENT_CODE))
+    return orjson.dumps(graph.dump()["data"]["nodes"][0])
+
+
+def _node(index: int) -> dict:
+    node = orjson.loads(_node_template())
+    node["id"] = node["data"]["id"] = f"Noop-{index}"
+    return node
+
+
+def _edge(source_index: int, target_index: int) -> dict:
+    source, target = f"Noop-{source_index}", f"Noop-{target_index}"
+    return {
+        "id": f"edge-{source}-{target}",
+        "source": source,
+        "target": target,
+        "data": {
+            "sourceHandle": {"dataType": "NoopComponent", "id": source, "name": "output", "output_types": ["Message"]},
+            "targetHandle": {"fieldName": "input_value", "id": target, "inputTypes": ["Message"], "type": "other"},
+        },
+    }
+
+
+@cache
+def generate_payload(shape: str, size: int) -> bytes:
+    """A flow of `size` no-op components, serialized as Graph.from_payload mutates the payload it loads.
+
+    - chain: each component feeds the next one.
+    - fan_out: the first component feeds all the others.
+    - diamond: the first component feeds all the others but the last one, which they all feed.
+    - cyclic: a chain whose last component feeds the second one.
+    """
+    if shape == "chain":
+        edges = [_edge(index, index + 1) for index in range(size - 1)]
+    elif shape == "fan_out":
+        edges = [_edge(0, index) for index in range(1, size)]
+    elif shape == "diamond":
+        middle = range(1, size - 1)
+        edges = [_edge(0, index) for index in middle] + [_edge(index, size - 1) for index in middle]
+    elif shape == "cyclic":
+        edges = [_edge(index, index + 1) for index in range(size - 1)] + [_edge(size - 1, 1)]
+    else:
+        msg = f"Unknown flow shape: {shape}"
+        raise ValueError(msg)
+    return orjson.dumps({"nodes": [_node(index) for index in range(size)], "edges": edges})
+
+
+def _load(payload: bytes) -> Graph:
+    return Graph.from_payload(orjson.loads(payload))
+
+
+async def _time_from_payload(payload: bytes) -> float:
+    data = orjson.loads(payload)
+    start = time.perf_counter()
+    Graph.from_payload(data)
+    return time.perf_counter() - start
+
+
+async def _time_sort_vertices(payload: bytes) -> float:
+    graph = _load(payload)
+    start = time.perf_counter()
+    graph.sort_vertices()
+    return time.perf_counter() - start
+
+
+async def _time_prepare(payload: bytes) -> float:
+    graph = _load(payload)
+    start = time.perf_counter()
+    graph.prepare()
+    return time.perf_counter() - start
+
+
+async def _time_get_next_runnable_vertices(payload: bytes) -> float:
+    """Walk the whole flow the way it is scheduled during a run, without building the components."""
+    graph = _load(payload)
+    to_visit = deque(graph.sort_vertices())
+    lock = asyncio.Lock()
+    start = time.perf_counter()
+    while to_visit:
+        vertex = graph.get_vertex(to_visit.popleft())
+        to_visit.extend(await graph.get_next_runnable_vertices(lock, vertex, cache=False))
+    return time.perf_counter() - start
+
+
+async def _time_process(payload: bytes) -> float:
+    graph = _load(payload)
+    start = time.perf_counter()
+    await graph.process(fallback_to_env_vars=False)
+    return time.perf_counter() - start
+
+
+TIMERS = {
+    "from_payload": _time_from_payload,
+    "sort_vertices": _time_sort_vertices,
+    "prepare": _time_prepare,
+    "get_next_runnable_vertices": _time_get_next_runnable_vertices,
+    "process": _time_process,
+}
+
+
+def _known_cliff(operation: str, shape: str, size: int) -> pytest.MarkDecorator | None:
+    """The scaling limits of the graph engine, reported as expected failures until they are fixed."""
+    if operation == "from_payload":
+        return None
+    if shape in {"chain", "cyclic"} and size >= sys.getrecursionlimit():
+        return pytest.mark.xfail(raises=RecursionError, reason="Successors are collected recursively")
+    if shape == "diamond" and size >= 5000:
+        return pytest.mark.xfail(run=False, reason="Sorting wide flows grows with the cube of their width")
+    return None
+
+
+def _cases():
+    for size in SIZES:
+        for shape in SHAPES:
+            for operation in OPERATIONS:
+                # No-op components never stop looping
+                if shape == "cyclic" and operation == "process":
+                    continue
+                cliff = _known_cliff(operation, shape, size)
+                yield pytest.param(
+                    operation, shape, size, marks=[cliff] if cliff else [], id=f"{operation}-{shape}-{size}"
+                )
+
+
+def _calibrate() -> float:
+    """The time of a fixed workload, which the timings are expressed in."""
+
+    def workload():
+        start = time.perf_counter()
+        sorted(str(index * 7919 % 100_003) for index in range(200_000))
+        return time.perf_counter() - start
+
+    return min(workload() for _ in range(5))
+
+
+@pytest.fixture(scope="module")
+def calibration() -> float:
+    return _calibrate()
+
+
+@pytest.fixture(scope="module")
+def baselines():
+    baselines = json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    yield baselines
+    if UPDATE_BASELINES:
+        BASELINES_PATH.write_text(json.dumps(dict(sorted(baselines.items())), indent=2) + "\n")
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(BENCHMARK_TIMEOUT)
+@pytest.mark.parametrize(("operation", "shape", "size"), list(_cases()))
+async def test_graph_engine(operation, shape, size, calibration, baselines):
+    payload = generate_payload(shape, size)
+    timings: list[float] = []
+    while len(timings) < MAX_REPEATS and sum(timings) < MIN_MEASURE_SECONDS:
+        # The graphs of the previous runs are freed first, so that their collection isn't timed
+        gc.collect()
+        timings.append(await TIMERS[operation](payload))
+    relative_time = min(timings) / calibration
+
+    key = f"{operation}[{shape}-{size}]"
+    baseline = baselines.get(key)
+    print(  # noqa: T201
+        f"{key}: {min(timings) * 1000:.3f}ms, {relative_time:.4f} (baseline: {baseline}) over {len(timings)} runs"
+    )
+    if UPDATE_BASELINES:
+        baselines[key] = round(relative_time, 4)
+    elif baseline is not None:
+        assert relative_time <= baseline * (1 + THRESHOLD), (
+            f"{key} regressed by {relative_time / baseline - 1:.0%}, more than {THRESHOLD:.0%} over its baseline"
+        )
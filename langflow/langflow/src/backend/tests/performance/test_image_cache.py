@@ -0,0 +1,51 @@
+import os
+import time
+
+import pytest
+from langflow.utils.image import ImageCache
+from PIL import Image as PILImage
+
+TURNS = 50
+
+
+def _replay_chat(cache: ImageCache, images: list) -> float:
+    """Replay a chat where every turn adds an image and sends the whole history to the model."""
+    start = time.perf_counter()
+    for turn in range(1, len(images) + 1):
+        for image in images[:turn]:
+            cache.get_data_url(image, "image/png")
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_image_chat_replay(tmp_path):
+    """Benchmark the disk reads and encoding time of a 50 turns chat with an image per turn."""
+    images = []
+    for turn in range(TURNS):
+        image_path = tmp_path / f"turn_{turn}.png"
+        PILImage.frombytes("RGB", (256, 256), os.urandom(256 * 256 * 3)).save(image_path, format="PNG")
+        images.append(image_path)
+
+    uncached = ImageCache(max_bytes=0)
+    uncached_time = _replay_chat(uncached, images)
+    cached = ImageCache(max_bytes=64 * 1024 * 1024)
+    cached_time = _replay_chat(cached, images)
+    downscaled = ImageCache(max_bytes=64 * 1024 * 1024, max_edge=128)
+    downscaled_time = _replay_chat(downscaled, images)
+
+    for name, cache, elapsed in [
+        ("uncached", uncached, uncached_time),
+        ("cached", cached, cached_time),
+        ("cached, downscaled", downscaled, downscaled_time),
+    ]:
+        stats = cache.get_stats()
+        print(  # noqa: T201
+            f"{name}: {stats['misses']} disk reads, {elapsed * 1000:.1f}ms, {stats['bytes'] / 1024:.0f}KiB cached"
+        )
+
+    requests = TURNS * (TURNS + 1) // 2
+    assert uncached.get_stats()["misses"] == requests
+    assert cached.get_stats()["misses"] == TURNS
+    assert cached.get_stats()["hits"] == requests - TURNS
+    assert cached_time < uncached_time
+    assert downscaled.get_stats()["bytes"] < cached.get_stats()["bytes"]
@@ -0,0 +1,63 @@
+import gc
+import tracemalloc
+from uuid import uuid4
+
+import pytest
+from langflow.api.v1.mcp_projects import (
+    get_project_mcp_server,
+    get_project_sse,
+    project_mcp_servers,
+    project_sse_transports,
+)
+from langflow.services.database.models.folder import Folder
+from langflow.services.deps import get_settings_service, session_scope
+
+PROJECTS = 5_000
+MAX_SERVERS = 50
+
+
+@pytest.fixture
+def project_servers_settings(monkeypatch):
+    settings = get_settings_service().settings
+    monkeypatch.setattr(settings, "mcp_project_servers_max", MAX_SERVERS)
+    monkeypatch.setattr(settings, "mcp_project_server_idle_timeout", 3600)
+    project_sse_transports.clear()
+    project_mcp_servers.clear()
+    yield settings
+    project_sse_transports.clear()
+    project_mcp_servers.clear()
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(600)
+@pytest.mark.usefixtures("project_servers_settings")
+async def test_project_servers_stay_capped_with_many_projects(active_user):
+    """Memory stays flat when clients connect to thousands of projects."""
+    project_ids = [uuid4() for _ in range(PROJECTS)]
+    async with session_scope() as session:
+        session.add_all(
+            Folder(id=project_id, name=f"Project {index}", user_id=active_user.id)
+            for index, project_id in enumerate(project_ids)
+        )
+
+    def connect(project_ids) -> int:
+        tracemalloc.start()
+        try:
+            for project_id in project_ids:
+                get_project_sse(project_id)
+                get_project_mcp_server(project_id)
+            gc.collect()
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    connect(project_ids[:MAX_SERVERS])
+    memory_with_few_projects = connect(project_ids[MAX_SERVERS : 2 * MAX_SERVERS])
+    memory_with_many_projects = connect(project_ids[2 * MAX_SERVERS :])
+
+    print(  # noqa: T201
+        f"memory held by project MCP servers: {memory_with_few_projects / 1024:.0f}KiB after {MAX_SERVERS} "
+        f"projects, {memory_with_many_projects / 1024:.0f}KiB after {PROJECTS - 2 * MAX_SERVERS} more"
+    )
+    assert len(project_sse_transports) == len(project_mcp_servers) == MAX_SERVERS
+    assert memory_with_many_projects < memory_with_few_projects * 1.5
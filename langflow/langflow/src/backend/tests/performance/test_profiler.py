@@ -0,0 +1,66 @@
+import asyncio
+import contextvars
+import time
+
+import pytest
+from langflow.components.input_output import ChatInput, ChatOutput
+from langflow.graph import Graph
+from langflow.services.deps import get_settings_service
+from langflow.services.tracing.profiler import ProfileStore, profile_span, profile_store
+
+RUNS = 50
+SPANS = 10_000
+
+
+def _graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input", should_store_message=False)
+    chat_output = ChatOutput(_id="chat_output", should_store_message=False)
+    chat_output.set(input_value=chat_input.message_response)
+    return Graph(chat_input, chat_output)
+
+
+async def _run(graph: Graph) -> float:
+    start = time.perf_counter()
+    # Each run starts from a fresh context, like a request would
+    await contextvars.Context().run(asyncio.create_task, graph.arun(inputs=[{"input_value": "hello"}]))
+    return time.perf_counter() - start
+
+
+def _span_cost() -> float:
+    """The time it takes to record a span, measured on many spans as a run is too short to measure it."""
+
+    def record_spans():
+        ProfileStore().start("benchmark")
+        start = time.perf_counter()
+        for _ in range(SPANS):
+            with profile_span("build", "component"):
+                pass
+        return (time.perf_counter() - start) / SPANS
+
+    return min(contextvars.Context().run(record_spans) for _ in range(5))
+
+
+@pytest.mark.benchmark
+async def test_profiler_overhead(monkeypatch):
+    """Estimate the cost of the profiler on a flow run, which should be less than 2%.
+
+    The difference between runs with and without the profiler is below the noise of the run times, so the
+    overhead is computed from the number of spans a run records and the cost of a span instead.
+    """
+    settings = get_settings_service().settings
+    # Warm up the component and graph code paths
+    await _run(_graph())
+    run_time = min([await _run(_graph()) for _ in range(RUNS)])
+
+    monkeypatch.setattr(settings, "profile_runs", True)
+    graph = _graph()
+    profiled_run_time = await _run(graph)
+    span_count = profile_store.get(graph.run_id).span_count
+
+    span_cost = _span_cost()
+    overhead = span_count * span_cost / run_time
+    print(  # noqa: T201
+        f"run: {run_time * 1000:.2f}ms ({profiled_run_time * 1000:.2f}ms profiled), {span_count} spans of "
+        f"{span_cost * 1e6:.2f}us, overhead: {overhead:.2%}"
+    )
+    assert overhead < 0.02
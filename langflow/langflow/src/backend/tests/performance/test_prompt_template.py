@@ -0,0 +1,55 @@
+import time
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from langchain_core.messages import HumanMessage
+from langchain_core.prompts.chat import ChatPromptTemplate
+from langchain_core.prompts.prompt import PromptTemplate
+from langflow.base.prompts.api_utils import validate_prompt
+from langflow.base.prompts.utils import dict_values_to_string
+from langflow.schema.message import Message
+
+RENDERS = 10_000
+VARIABLES = 20
+
+
+def _template() -> str:
+    paragraph = "You are a helpful assistant answering questions about the documents below, citing them. "
+    template = "\n".join(f"{paragraph}Section {index}: {{var_{index}}}" for index in range(VARIABLES))
+    return template + "\nAnswer in a few sentences." * ((2048 - len(template)) // 26 + 1)
+
+
+def _from_template_parsing_every_time(template: str, **variables) -> Message:
+    """How `Message.from_template` used to render a prompt, parsing and serializing it with LangChain each time."""
+    message = Message(template=template, variables=variables)
+    message.text = PromptTemplate.from_template(template).format(**dict_values_to_string(variables))
+    message.prompt = jsonable_encoder(ChatPromptTemplate.from_messages([HumanMessage(content=message.text)]).to_json())
+    message.messages = message.prompt["kwargs"]["messages"]
+    return message
+
+
+def _render(from_template, template: str, variables: dict) -> float:
+    start = time.perf_counter()
+    for index in range(RENDERS):
+        from_template(template, **{**variables, "var_0": f"value {index}"})
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_render_prompt_template():
+    """Rendering the same prompt template should not parse it and build LangChain objects every time."""
+    template = _template()
+    variables = {name: f"value of {name}" for name in validate_prompt(template)}
+    assert len(template) >= 2048
+
+    expected = _from_template_parsing_every_time(template, **variables)
+    rendered = Message.from_template(template, **variables)
+    assert (rendered.text, rendered.prompt) == (expected.text, expected.prompt)
+
+    parsing = _render(_from_template_parsing_every_time, template, variables)
+    parsed_once = _render(Message.from_template, template, variables)
+    print(  # noqa: T201
+        f"{RENDERS} renders of a {len(template)} chars template with {len(variables)} variables: "
+        f"{parsing / RENDERS * 1e6:.0f}us each parsing it every time, {parsed_once / RENDERS * 1e6:.0f}us parsed once"
+    )
+    assert parsed_once < parsing / 2
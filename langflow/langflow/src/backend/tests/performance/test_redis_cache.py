@@ -0,0 +1,101 @@
+import time
+
+import dill
+import pytest
+from langflow.services.cache.serialization import CacheSerializer
+from langflow.services.cache.service import RedisCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+ITERATIONS = 200
+KEYS = 50
+
+
+def _build_result(index: int) -> dict:
+    """A cached vertex build result, as dumped by the build endpoints."""
+    text = f"The answer to question {index} is 42. " * 20
+    return {
+        "id": f"ChatOutput-{index}",
+        "valid": True,
+        "params": "- Files: []\n",
+        "data": {
+            "results": {"message": {"text": text, "sender": "Machine", "files": []}},
+            "outputs": {"message": {"message": text.upper(), "type": "text"}},
+            "logs": {"message": []},
+            "messages": [{"message": text, "sender": "Machine", "sender_name": "AI", "stream_url": None}],
+            "timedelta": 0.0123,
+            "duration": "12 ms",
+            "used_frozen_result": False,
+        },
+        "timestamp": "2025-01-01T00:00:00Z",
+        "next_vertices_ids": [f"Vertex-{i}" for i in range(5)],
+        "inactivated_vertices": [],
+        "top_level_vertices": [f"Vertex-{i}" for i in range(5)],
+    }
+
+
+def _time(func, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func(*args)
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+@pytest.mark.benchmark
+async def test_redis_cache_codecs_and_batching():
+    """Benchmark the size and encoding time of build results, and the round trips of the batch API."""
+    value = _build_result(0)
+    serializer = CacheSerializer()
+    pickled = dill.dumps(value, recurse=True)
+    encoded = serializer.dumps(value)
+
+    dill_encode = _time(dill.dumps, value)
+    dill_decode = _time(dill.loads, pickled)
+    codec_encode = _time(serializer.dumps, value)
+    codec_decode = _time(serializer.loads, encoded)
+    print(  # noqa: T201
+        f"dill: {len(pickled)} bytes, encode {dill_encode * 1e6:.1f}us, decode {dill_decode * 1e6:.1f}us\n"
+        f"codec: {len(encoded)} bytes, encode {codec_encode * 1e6:.1f}us, decode {codec_decode * 1e6:.1f}us"
+    )
+    # Sizes are similar, the difference is the time spent encoding
+    assert len(encoded) < len(pickled) * 1.5
+    assert codec_encode < dill_encode
+
+    cache = RedisCache(expiration_time=60)
+    cache._client = fakeredis.aioredis.FakeRedis()
+    round_trips = 0
+    execute_command = cache._client.execute_command
+
+    async def count_round_trips(*args, **kwargs):
+        nonlocal round_trips
+        round_trips += 1
+        return await execute_command(*args, **kwargs)
+
+    cache._client.execute_command = count_round_trips
+    items = {f"build-{i}": _build_result(i) for i in range(KEYS)}
+    try:
+        start = time.perf_counter()
+        for key, item in items.items():
+            await cache.set(key, item)
+        for key in items:
+            await cache.get(key)
+        one_by_one = time.perf_counter() - start
+        one_by_one_round_trips = round_trips
+
+        round_trips = 0
+        start = time.perf_counter()
+        await cache.set_many(items)
+        values = await cache.get_many(list(items))
+        batched = time.perf_counter() - start
+        # The pipeline of set_many doesn't go through execute_command
+        batched_round_trips = round_trips + 1
+    finally:
+        await cache._client.aclose()
+
+    print(  # noqa: T201
+        f"{KEYS} keys one by one: {one_by_one_round_trips} round trips, {one_by_one * 1000:.1f}ms\n"
+        f"{KEYS} keys batched: {batched_round_trips} round trips, {batched * 1000:.1f}ms"
+    )
+    assert values == list(items.values())
+    assert batched_round_trips == 2
+    assert one_by_one_round_trips == 2 * KEYS
@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import pytest
+from langflow.services.database.models.message.model import MessageTable
+from langflow.services.database.models.transactions.model import TransactionTable
+from langflow.services.deps import get_db_service, get_settings_service
+from loguru import logger
+from sqlalchemy import event, func
+from sqlmodel import select
+
+RUNS = 200
+
+
+async def _count(model) -> int:
+    async with get_db_service().with_session() as session:
+        return (await session.exec(select(func.count()).select_from(model))).one()
+
+
+async def _run_concurrently(client, flow_id: str, headers: dict) -> dict:
+    db_service = get_db_service()
+    engines = [db_service.engine.sync_engine]
+    if db_service.writer is not None:
+        engines.append(db_service.writer.engine.sync_engine)
+    commits = 0
+    lock_errors = 0
+
+    def count_commit(*_args) -> None:
+        nonlocal commits
+        commits += 1
+
+    def count_lock_error(message) -> None:
+        nonlocal lock_errors
+        lock_errors += "database is locked" in str(message)
+
+    sink = logger.add(count_lock_error, level="ERROR")
+    for engine in engines:
+        event.listen(engine, "commit", count_commit)
+    messages, transactions = await _count(MessageTable), await _count(TransactionTable)
+    try:
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *(
+                client.post(f"api/v1/run/{flow_id}", headers=headers, json={"input_value": f"Hello {index}"})
+                for index in range(RUNS)
+            )
+        )
+        elapsed = time.perf_counter() - start
+        # Transactions are logged in the background of the runs
+        await asyncio.sleep(1)
+    finally:
+        for engine in engines:
+            event.remove(engine, "commit", count_commit)
+        logger.remove(sink)
+    failed = [response.text for response in responses if response.status_code != 200]
+    lock_errors += sum("database is locked" in text for text in failed)
+    return {
+        "runs_per_second": RUNS / elapsed,
+        "commits": commits,
+        "lock_errors": lock_errors,
+        "failed": len(failed),
+        "messages": await _count(MessageTable) - messages,
+        "transactions": await _count(TransactionTable) - transactions,
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(600)
+async def test_concurrent_flow_runs(client, simple_api_test, created_api_key):
+    """Concurrent runs should not hit the database lock, and batching their writes should take fewer commits."""
+    flow_id = simple_api_test["id"]
+    headers = {"x-api-key": created_api_key.api_key}
+    db_service = get_db_service()
+    settings = get_settings_service().settings
+    assert db_service.writer is None
+
+    # Warm up the flow and the connection pool
+    await _run_concurrently(client, flow_id, headers)
+    direct = await _run_concurrently(client, flow_id, headers)
+
+    settings.sqlite_write_batching = True
+    db_service.writer = db_service._create_writer()
+    try:
+        batched = await _run_concurrently(client, flow_id, headers)
+        print(  # noqa: T201
+            f"{RUNS} concurrent runs: {direct['runs_per_second']:.1f} runs/s, {direct['commits']} commits and "
+            f"{direct['lock_errors']} lock errors without the writer; {batched['runs_per_second']:.1f} runs/s, "
+            f"{batched['commits']} commits ({db_service.writer.batches} batches of {db_service.writer.writes} writes) "
+            f"and {batched['lock_errors']} lock errors with it"
+        )
+    finally:
+        await db_service.writer.stop()
+        db_service.writer = None
+        settings.sqlite_write_batching = False
+
+    for result in (direct, batched):
+        assert result["failed"] == 0
+        assert result["messages"] == direct["messages"]
+        assert result["transactions"] == direct["transactions"]
+    assert batched["lock_errors"] == 0
+    assert batched["commits"] < direct["commits"]
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from langflow.base.tools.component_tool import ComponentToolkit
+from langflow.custom import Component
+from langflow.io import BoolInput, DropdownInput, IntInput, MessageTextInput, Output
+from langflow.io import schema as io_schema
+
+TOOLS = 40
+RUNS = 20
+
+
+def _tool_component(index: int) -> Component:
+    class SearchComponent(Component):
+        display_name = f"Search {index}"
+        description = f"Searches the source number {index}."
+        inputs = [
+            MessageTextInput(name=f"query_{index}", info="The search query.", tool_mode=True),
+            IntInput(name="max_results", info="How many results to return.", value=5, tool_mode=True),
+            DropdownInput(name="sort", options=["relevance", "date"], value="relevance", tool_mode=True),
+            BoolInput(name="safe_search", value=True, tool_mode=True),
+        ]
+        outputs = [Output(display_name="Results", name="results", method="search")]
+
+        def search(self) -> str:
+            return ""
+
+    return SearchComponent()
+
+
+def _build_agent_tools(components: list[Component]) -> list:
+    # Agents build the tools of their tool components on every run
+    return [tool for component in components for tool in ComponentToolkit(component).get_tools()]
+
+
+@pytest.mark.benchmark
+def test_building_the_tools_of_an_agent(monkeypatch):
+    """Rebuilding the tools of an agent should reuse the argument schemas of its tools."""
+    created_models = 0
+    create_model = io_schema.create_model
+
+    def counting_create_model(*args, **kwargs):
+        nonlocal created_models
+        created_models += 1
+        return create_model(*args, **kwargs)
+
+    monkeypatch.setattr(io_schema, "create_model", counting_create_model)
+    components = [_tool_component(index) for index in range(TOOLS)]
+
+    io_schema.clear_schema_cache()
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        io_schema.clear_schema_cache()
+        tools = _build_agent_tools(components)
+    uncached = (time.perf_counter() - start) / RUNS
+    uncached_models = created_models
+
+    io_schema.clear_schema_cache()
+    created_models = 0
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        tools = _build_agent_tools(components)
+    cached = (time.perf_counter() - start) / RUNS
+
+    print(  # noqa: T201
+        f"{TOOLS} tools per run: {uncached * 1000:.1f}ms and {uncached_models // RUNS} models without reuse, "
+        f"{cached * 1000:.1f}ms and {created_models} models in {RUNS} runs with reuse"
+    )
+    assert len(tools) == TOOLS
+    assert created_models == TOOLS
+    assert cached < uncached
@@ -0,0 +1,98 @@
+import asyncio
+import statistics
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langflow.services.settings.base import Settings
+from langflow.services.settings.service import SettingsService
+from langflow.services.tracing.base import BaseTracer
+from langflow.services.tracing.service import TracingService
+
+TRACER_NAMES = ["langsmith", "langwatch", "langfuse", "arize_phoenix", "opik"]
+
+
+def _slow_tracer(cost: float) -> type[BaseTracer]:
+    """A fake tracer blocking for `cost` seconds on every callback, like a slow tracer SDK would."""
+
+    class SlowTracer(BaseTracer):
+        def __init__(self, *_args, **_kwargs) -> None:
+            pass
+
+        @property
+        def ready(self) -> bool:
+            return True
+
+        def add_trace(self, *_args, **_kwargs) -> None:
+            time.sleep(cost)
+
+        def end_trace(self, *_args, **_kwargs) -> None:
+            time.sleep(cost)
+
+        def end(self, *_args, **_kwargs) -> None:
+            time.sleep(cost)
+
+        def get_langchain_callback(self):
+            return None
+
+    return SlowTracer
+
+
+async def _vertex_latencies(tracer_cost: float, vertices: int = 60, concurrency: int = 6) -> list[float]:
+    settings = Settings()
+    settings.deactivate_tracing = False
+    tracing_service = TracingService(SettingsService(settings, MagicMock()))
+    tracer = _slow_tracer(tracer_cost)
+    patches = [
+        patch(f"langflow.services.tracing.service._get_{name}_tracer", return_value=tracer) for name in TRACER_NAMES
+    ]
+    for tracer_patch in patches:
+        tracer_patch.start()
+
+    latencies: list[float] = []
+
+    async def build_vertex(index: int) -> None:
+        component = MagicMock()
+        component._vertex.id = f"vertex-{index}"
+        start = time.perf_counter()
+        async with tracing_service.trace_component(component, f"Component-{index}", {"input_value": index}):
+            # The work of the component itself
+            await asyncio.sleep(0.002)
+        latencies.append(time.perf_counter() - start)
+
+    try:
+        await tracing_service.start_tracers(uuid.uuid4(), "benchmark", "user", "session", "benchmark")
+        for start in range(0, vertices, concurrency):
+            await asyncio.gather(*(build_vertex(i) for i in range(start, start + concurrency)))
+        await tracing_service.end_tracers({})
+    finally:
+        for tracer_patch in patches:
+            tracer_patch.stop()
+        await tracing_service.teardown()
+    return latencies
+
+
+def _p99(latencies: list[float]) -> float:
+    return statistics.quantiles(latencies, n=100)[98]
+
+
+@pytest.mark.benchmark
+async def test_vertex_latency_is_independent_of_tracer_cost():
+    """Benchmark the latency of traced components as the tracers get slower.
+
+    Every component build sends two callbacks to each of the five tracers, so with the
+    slowest fake tracer the callbacks cost 100ms per component. None of it should show up
+    in the latency of the components.
+    """
+    p99_by_cost = {}
+    for tracer_cost in (0.0, 0.002, 0.01):
+        p99_by_cost[tracer_cost] = _p99(await _vertex_latencies(tracer_cost))
+
+    baseline = p99_by_cost[0.0]
+    for tracer_cost, p99 in p99_by_cost.items():
+        print(f"tracer cost {tracer_cost * 1000:.0f}ms: p99 vertex latency {p99 * 1000:.2f}ms")  # noqa: T201
+        callbacks_cost = tracer_cost * 2 * len(TRACER_NAMES)
+        assert p99 < baseline + 0.02
+        if callbacks_cost:
+            assert p99 < callbacks_cost
@@ -0,0 +1,92 @@
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+from langflow.utils.voice_utils import (
+    BYTES_PER_24K_FRAME,
+    SAMPLE_RATE_24K,
+    VAD_SAMPLE_RATE_16K,
+    VADPipeline,
+    resample_24k_to_16k,
+)
+
+STREAM_SECONDS = 600
+# Size of the audio chunks sent by the browser
+CHUNK_BYTES = 4096
+
+
+class ThresholdVAD:
+    """Stand-in for webrtcvad when it is not installed."""
+
+    def is_speech(self, buf: bytes, sample_rate: int, length: int | None = None) -> bool:  # noqa: ARG002
+        return bool(np.abs(np.frombuffer(buf, dtype=np.int16)).max() > 1000)
+
+
+def _get_vad():
+    try:
+        import webrtcvad
+    except ImportError:
+        return ThresholdVAD()
+    return webrtcvad.Vad(mode=3)
+
+
+def _synthetic_stream(seconds: int) -> bytes:
+    """Alternating seconds of noise and of a voice-like tone, as 16-bit PCM at 24kHz."""
+    rng = np.random.default_rng(seed=42)
+    time_axis = np.arange(seconds * SAMPLE_RATE_24K) / SAMPLE_RATE_24K
+    tone = np.sin(2 * np.pi * 220 * time_axis) * 8000 * (time_axis.astype(int) % 2)
+    noise = rng.normal(0, 200, len(time_axis))
+    return (tone + noise).astype(np.int16).tobytes()
+
+
+def _legacy_vad(stream: bytes, vad) -> int:
+    """The previous pipeline: a bytearray trimmed from the front and frames resampled one by one."""
+    buffer = bytearray()
+    speech_frames = 0
+    for start in range(0, len(stream), CHUNK_BYTES):
+        buffer.extend(stream[start : start + CHUNK_BYTES])
+        while len(buffer) >= BYTES_PER_24K_FRAME:
+            frame_24k = buffer[:BYTES_PER_24K_FRAME]
+            del buffer[:BYTES_PER_24K_FRAME]
+            speech_frames += vad.is_speech(resample_24k_to_16k(frame_24k), VAD_SAMPLE_RATE_16K)
+    return speech_frames
+
+
+def _pipeline_vad(stream: bytes, vad) -> int:
+    pipeline = VADPipeline(vad)
+    return sum(
+        sum(pipeline.process(stream[start : start + CHUNK_BYTES])) for start in range(0, len(stream), CHUNK_BYTES)
+    )
+
+
+def _measure(func, stream: bytes) -> tuple[float, int, int]:
+    start = time.process_time()
+    speech_frames = func(stream, _get_vad())
+    cpu_time = time.process_time() - start
+
+    # Allocations are measured on the first minute only, tracing slows everything down
+    first_minute = stream[: 60 * SAMPLE_RATE_24K * 2]
+    vad = _get_vad()
+    tracemalloc.start()
+    func(first_minute, vad)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu_time, peak, speech_frames
+
+
+@pytest.mark.benchmark
+def test_voice_vad_pipeline():
+    """Benchmark the VAD of 10 minutes of audio, received in chunks like from the browser."""
+    stream = _synthetic_stream(STREAM_SECONDS)
+
+    results = {}
+    for name, func in [("per frame", _legacy_vad), ("pipeline", _pipeline_vad)]:
+        cpu_time, peak, speech_frames = _measure(func, stream)
+        results[name] = cpu_time
+        print(  # noqa: T201
+            f"{name}: {cpu_time / STREAM_SECONDS * 1000:.3f}ms CPU per audio second, "
+            f"{peak / 1024:.0f}KiB peak allocations, {speech_frames} speech frames"
+        )
+
+    assert results["pipeline"] < results["per frame"]
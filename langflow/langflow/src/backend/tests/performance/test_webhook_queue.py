@@ -0,0 +1,129 @@
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import pytest
+from langflow.services.deps import get_settings_service, get_webhook_queue_service
+from langflow.services.manager import service_manager
+from langflow.services.schema import ServiceType
+from langflow.services.webhook_queue import service as webhook_queue_module
+from langflow.services.webhook_queue.service import WebhookQueueService, WebhookRunStatus
+
+WEBHOOKS = 5_000
+DUPLICATES = 200
+CONCURRENT_REQUESTS = 10
+RUN_SECONDS = 0.005
+# Long enough for the leases not to expire while the event loop is busy with the storm
+LEASE_SECONDS = 5
+
+
+def _p95(latencies: list[float]) -> float:
+    return statistics.quantiles(latencies, n=20)[-1]
+
+
+async def _wait_until_drained(webhook_queue: WebhookQueueService) -> None:
+    while True:
+        stats = await asyncio.to_thread(webhook_queue.get_stats)
+        if not stats["queued"] and not stats["running"]:
+            return
+        await asyncio.sleep(0.1)
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(600)
+async def test_webhook_storm(client, added_webhook_test, logged_in_headers, monkeypatch):
+    """A burst of webhooks should be run by a bounded number of workers, survive a restart and leave the API usable."""
+    endpoint = f"api/v1/webhook/{added_webhook_test['endpoint_name']}"
+    flow_endpoint = f"api/v1/flows/{added_webhook_test['id']}"
+    settings = get_settings_service().settings
+    executions: Counter[str] = Counter()
+    in_flight = 0
+    max_in_flight = 0
+    interrupted = 0
+
+    async def run_webhook(run):
+        nonlocal in_flight, max_in_flight, interrupted
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            await asyncio.sleep(RUN_SECONDS)
+            executions[run.id] += 1
+        except asyncio.CancelledError:
+            interrupted += 1
+            raise
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(webhook_queue_module, "run_webhook", run_webhook)
+    webhook_queue = get_webhook_queue_service()
+    await webhook_queue.stop()
+    webhook_queue.lease_seconds = LEASE_SECONDS
+    webhook_queue.start()
+
+    async def api_latency() -> float:
+        start = time.perf_counter()
+        response = await client.get(flow_endpoint, headers=logged_in_headers)
+        assert response.status_code == 200
+        return time.perf_counter() - start
+
+    idle_latencies = [await api_latency() for _ in range(50)]
+
+    storm_latencies: list[float] = []
+    webhook_latencies: list[float] = []
+    run_ids: set[str] = set()
+
+    async def sample_api_latency() -> None:
+        while True:
+            storm_latencies.append(await api_latency())
+            await asyncio.sleep(0.02)
+
+    async def send_webhook(index: int) -> None:
+        start = time.perf_counter()
+        response = await client.post(endpoint, json={"index": index}, headers={"Idempotency-Key": f"event-{index}"})
+        webhook_latencies.append(time.perf_counter() - start)
+        assert response.status_code == 202, response.text
+        run_ids.add(response.json()["run_id"])
+
+    async def send_webhooks(indexes: range) -> None:
+        for batch_start in range(indexes.start, indexes.stop, CONCURRENT_REQUESTS):
+            batch_stop = min(batch_start + CONCURRENT_REQUESTS, indexes.stop)
+            await asyncio.gather(*(send_webhook(index) for index in range(batch_start, batch_stop)))
+
+    sampler = asyncio.create_task(sample_api_latency())
+    start = time.perf_counter()
+    await send_webhooks(range(WEBHOOKS // 2))
+
+    # Simulate a crash: the workers die without giving back the runs they were running
+    for task in webhook_queue._tasks:
+        task.cancel()
+    await asyncio.gather(*webhook_queue._tasks, return_exceptions=True)
+    webhook_queue._tasks = []
+    restarted = WebhookQueueService(get_settings_service())
+    restarted.lease_seconds = LEASE_SECONDS
+    service_manager.services[ServiceType.WEBHOOK_QUEUE_SERVICE] = restarted
+    restarted.start()
+    await webhook_queue.teardown()
+
+    await send_webhooks(range(WEBHOOKS // 2, WEBHOOKS))
+    # Senders retrying webhooks that were already received
+    await send_webhooks(range(DUPLICATES))
+    accepted = time.perf_counter() - start
+    await _wait_until_drained(restarted)
+    drained = time.perf_counter() - start
+    sampler.cancel()
+
+    runs = [await restarted.get_run(run_id) for run_id in run_ids]
+    print(  # noqa: T201
+        f"{WEBHOOKS} webhooks (+{DUPLICATES} duplicates) accepted in {accepted:.1f}s and run in {drained:.1f}s "
+        f"with {settings.webhook_queue_workers} workers, max {max_in_flight} runs in flight, "
+        f"{interrupted} runs interrupted by the crash and run after the restart; "
+        f"webhook p95 {_p95(webhook_latencies) * 1000:.1f}ms; API p95 {_p95(idle_latencies) * 1000:.1f}ms idle, "
+        f"{_p95(storm_latencies) * 1000:.1f}ms during the storm"
+    )
+    assert len(run_ids) == WEBHOOKS
+    assert all(run.status == WebhookRunStatus.SUCCEEDED for run in runs)
+    assert set(executions) == run_ids
+    assert all(count == 1 for count in executions.values())
+    assert max_in_flight <= min(settings.webhook_queue_workers, settings.webhook_queue_max_runs_per_flow)
+    assert _p95(storm_latencies) < 0.5
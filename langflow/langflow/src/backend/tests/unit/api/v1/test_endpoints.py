@@ -7,6 +7,7 @@ from fastapi import status
 from httpx import AsyncClient
 from langflow.api.v1.schemas import UpdateCustomComponentRequest
 from langflow.components.agents.agent import AgentComponent
+from langflow.custom import Component
 from langflow.custom.utils import build_custom_component_template
 
 
@@ -106,3 +107,41 @@ async def test_update_component_model_name_options(client: AsyncClient, logged_i
     assert response.status_code == status.HTTP_200_OK
     assert "template" in result
     assert "model_name" not in result["template"]
+
+
+async def test_update_component_superseded_by_a_newer_update(client: AsyncClient, logged_in_headers: dict):
+    path = Path(__file__).parent.parent.parent.parent / "data" / "slow_update_component.py"
+    code = await path.read_text(encoding="utf-8")
+    component_node, _ = build_custom_component_template(Component(_code=code))
+
+    async def update(value: str, field: str = "text"):
+        request = UpdateCustomComponentRequest(
+            code=code,
+            frontend_node=component_node,
+            field=field,
+            field_value=value,
+            template=component_node["template"],
+            node_id="SlowUpdateComponent-abc12",
+        )
+        return await client.post("api/v1/custom_component/update", json=request.model_dump(), headers=logged_in_headers)
+
+    first = asyncio.create_task(update("Hel"))
+    await asyncio.sleep(0.1)
+    second = await update("Hello")
+    first = await first
+
+    assert first.status_code == status.HTTP_200_OK
+    assert second.status_code == status.HTTP_200_OK
+    assert first.json()["template"]["text"]["info"] == "Hello"
+    assert second.json()["template"]["text"]["info"] == "Hello"
+
+    # The update of another field of the node has its own effects, it doesn't cancel the first one
+    first = asyncio.create_task(update("Hello"))
+    await asyncio.sleep(0.1)
+    second = await update("World", field="other_text")
+    first = await first
+
+    assert first.status_code == status.HTTP_200_OK
+    assert second.status_code == status.HTTP_200_OK
+    assert first.json()["template"]["text"]["info"] == "Hello"
+    assert second.json()["template"]["other_text"]["info"] == "World"
@@ -1,13 +1,14 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import anyio
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from langflow.api.v1 import mcp, mcp_projects
 from langflow.api.v1.mcp_projects import (
     get_project_mcp_server,
     get_project_sse,
-    init_mcp_servers,
     project_mcp_servers,
     project_sse_transports,
 )
@@ -15,8 +16,10 @@ from langflow.services.auth.utils import get_password_hash
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.folder import Folder
 from langflow.services.database.models.user import User
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_db_service, get_settings_service, get_storage_service, session_scope
+from mcp import types
 from mcp.server.sse import SseServerTransport
+from sqlalchemy import event
 
 # Mark all tests in this module as asyncio
 pytestmark = pytest.mark.asyncio
@@ -453,52 +456,105 @@ async def test_project_sse_creation(user_test_project):
     assert mcp_server2 is mcp_server
 
 
-async def test_init_mcp_servers(user_test_project, other_test_project):
-    """Test the initialization of MCP servers for all projects."""
-    # Clear existing caches
+@pytest.fixture
+def project_servers_settings(monkeypatch):
+    settings = get_settings_service().settings
+    monkeypatch.setattr(settings, "mcp_project_servers_max", 50)
+    monkeypatch.setattr(settings, "mcp_project_server_idle_timeout", 3600)
+    project_sse_transports.clear()
+    project_mcp_servers.clear()
+    yield settings
     project_sse_transports.clear()
     project_mcp_servers.clear()
 
-    # Test the initialization function
-    await init_mcp_servers()
 
-    # Verify that both test projects have SSE transports and MCP servers initialized
-    project1_id = str(user_test_project.id)
-    project2_id = str(other_test_project.id)
+@pytest.mark.usefixtures("project_servers_settings")
+async def test_project_servers_are_created_on_first_connection(user_test_project):
+    """Projects get an SSE transport and an MCP server when a client connects, not at startup."""
+    assert str(user_test_project.id) not in project_sse_transports
+    assert str(user_test_project.id) not in project_mcp_servers
 
-    # Both projects should have SSE transports created
-    assert project1_id in project_sse_transports
-    assert project2_id in project_sse_transports
+    get_project_sse(user_test_project.id)
+    get_project_mcp_server(user_test_project.id)
 
-    # Both projects should have MCP servers created
-    assert project1_id in project_mcp_servers
-    assert project2_id in project_mcp_servers
+    assert set(project_sse_transports) == {str(user_test_project.id)}
+    assert set(project_mcp_servers) == {str(user_test_project.id)}
 
-    # Verify the correct configuration
-    assert isinstance(project_sse_transports[project1_id], SseServerTransport)
-    assert isinstance(project_sse_transports[project2_id], SseServerTransport)
 
-    assert project_mcp_servers[project1_id].project_id == user_test_project.id
-    assert project_mcp_servers[project2_id].project_id == other_test_project.id
+async def test_idle_project_servers_are_dropped(user_test_project, other_test_project, project_servers_settings):
+    """Servers of projects without clients are dropped after the idle timeout, connected ones are kept."""
+    project_id = str(user_test_project.id)
+    sse = get_project_sse(user_test_project.id)
+    get_project_mcp_server(user_test_project.id)
+    read_stream_writer, _ = anyio.create_memory_object_stream(0)
+    sse._read_stream_writers[uuid4()] = read_stream_writer
 
+    project_servers_settings.mcp_project_server_idle_timeout = 0
+    mcp_projects._project_connections[project_id] += 1
+    try:
+        get_project_mcp_server(other_test_project.id)
+        assert project_id in project_mcp_servers
+    finally:
+        mcp_projects._project_connections[project_id] -= 1
+
+    get_project_mcp_server(uuid4())
+
+    assert project_id not in project_sse_transports
+    assert project_id not in project_mcp_servers
+    assert str(other_test_project.id) not in project_mcp_servers
+    with pytest.raises(anyio.ClosedResourceError):
+        read_stream_writer.send_nowait(None)
 
-async def test_init_mcp_servers_error_handling():
-    """Test that init_mcp_servers handles errors correctly and continues initialization."""
-    # Clear existing caches
-    project_sse_transports.clear()
-    project_mcp_servers.clear()
 
-    # Create a mock to simulate an error when initializing one project
-    original_get_project_sse = get_project_sse
+async def _list_project_resources(project_id, cursor=None) -> types.ListResourcesResult:
+    handler = get_project_mcp_server(project_id).server.request_handlers[types.ListResourcesRequest]
+    request = types.ListResourcesRequest(method="resources/list", params=types.PaginatedRequestParams(cursor=cursor))
+    return (await handler(request)).root
 
-    def mock_get_project_sse(project_id):
-        # Raise an exception for the first project only
-        if not project_sse_transports:  # Only for the first project
-            msg = "Test error for project SSE creation"
-            raise ValueError(msg)
-        return original_get_project_sse(project_id)
 
-    # Apply the patch
-    with patch("langflow.api.v1.mcp_projects.get_project_sse", side_effect=mock_get_project_sse):
-        # This should not raise any exception, as the error should be caught
-        await init_mcp_servers()
+@pytest.mark.timeout(300)
+async def test_list_resources_queries_the_project_once(active_user, user_test_project, monkeypatch):
+    """Listing the resources of a project takes one query, however many flows there are."""
+    flows = [
+        Flow(id=uuid4(), name=f"Resource Flow {index}", folder_id=user_test_project.id, user_id=active_user.id)
+        for index in range(2000)
+    ]
+    async with session_scope() as session:
+        session.add_all(flows)
+    storage_service = get_storage_service()
+    expected = set()
+    for flow in flows[::500]:
+        for file_name in ("a.txt", "b.csv"):
+            await storage_service.save_file(flow_id=str(flow.id), file_name=file_name, data=b"data")
+            expected.add((str(flow.id), file_name))
+
+    statements: list[str] = []
+
+    def count_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    engine = get_db_service().engine.sync_engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        result = await _list_project_resources(user_test_project.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert {(str(resource.uri).split("/")[-2], resource.name) for resource in result.resources} == expected
+    assert result.nextCursor is None
+    assert len(statements) == 1
+
+    with monkeypatch.context() as patch:
+        patch.setattr(mcp, "MCP_RESOURCES_PAGE_SIZE", 3)
+        pages = [await _list_project_resources(user_test_project.id)]
+        while pages[-1].nextCursor:
+            pages.append(await _list_project_resources(user_test_project.id, pages[-1].nextCursor))
+
+    assert [len(page.resources) for page in pages] == [3, 3, 2]
+    assert [resource.uri for page in pages for resource in page.resources] == [
+        resource.uri for resource in result.resources
+    ]
+
+    await storage_service.delete_file(flow_id=str(flows[0].id), file_name="a.txt")
+    result = await _list_project_resources(user_test_project.id)
+    assert len(result.resources) == len(expected) - 1
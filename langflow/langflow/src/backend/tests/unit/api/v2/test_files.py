@@ -1,5 +1,7 @@
 import asyncio
+import io
 import tempfile
+import zipfile
 from contextlib import suppress
 from pathlib import Path
 
@@ -521,3 +523,40 @@ async def test_unique_filename_path_storage(files_client, files_created_api_key)
     download2 = await files_client.get(f"api/v2/files/{file2['id']}", headers=headers)
     assert download2.status_code == 200
     assert download2.content == b"path content 2"
+
+
+async def test_download_files_batch_streams_zip(files_client, files_created_api_key):
+    """Test that large uploads are stored intact and batch downloads stream a valid ZIP."""
+    headers = {"x-api-key": files_created_api_key.api_key}
+    # Spans several storage chunks
+    large_content = bytes(range(256)) * 12_000
+
+    response1 = await files_client.post(
+        "api/v2/files",
+        files={"file": ("large.bin", large_content)},
+        headers=headers,
+    )
+    assert response1.status_code == 201
+    file1 = response1.json()
+    assert file1["size"] == len(large_content)
+
+    response2 = await files_client.post(
+        "api/v2/files",
+        files={"file": ("small.txt", b"small content")},
+        headers=headers,
+    )
+    assert response2.status_code == 201
+    file2 = response2.json()
+
+    download = await files_client.get(f"api/v2/files/{file1['id']}", headers=headers)
+    assert download.status_code == 200
+    assert download.content == large_content
+
+    response = await files_client.post("api/v2/files/batch/", json=[file1["id"], file2["id"]], headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-zip-compressed"
+
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+        assert zip_file.testzip() is None
+        assert zip_file.read("large.bin") == large_content
+        assert zip_file.read("small.txt") == b"small content"
@@ -0,0 +1,47 @@
+import pytest
+from langchain_core.prompts.prompt import PromptTemplate
+from langflow.base.prompts.api_utils import validate_prompt
+from langflow.base.prompts.formatter import PromptFormatter, get_prompt_formatter
+
+
+@pytest.mark.parametrize(
+    ("template", "variables"),
+    [
+        ("Hello, {name}!", {"name": "Langflow"}),
+        ("{a} and {b}, then {a} again", {"a": "x", "b": 2}),
+        ('Escaped {{"key": "{value}"}}', {"value": "v"}),
+        ("No variables at all", {"unused": "value"}),
+        ("", {}),
+        ("{name!r:>12}", {"name": "padded"}),
+        ("{number.real}", {"number": 3}),
+    ],
+)
+def test_format_matches_prompt_template(template, variables):
+    expected = PromptTemplate.from_template(template).format(**variables)
+
+    assert PromptFormatter(template).format(**variables) == expected
+
+
+def test_variables_are_unique_and_in_order():
+    assert PromptFormatter("{b} {a} {b} {{c}}").variables == ("b", "a")
+
+
+def test_missing_variable_raises_key_error():
+    with pytest.raises(KeyError, match="name"):
+        PromptFormatter("Hello, {name}!").format()
+
+
+def test_malformed_template_raises_value_error():
+    with pytest.raises(ValueError, match="expected '}'"):
+        PromptFormatter("Hello, {name")
+
+
+def test_formatters_are_cached_by_template():
+    assert get_prompt_formatter("Hi {name}") is get_prompt_formatter("Hi {name}")
+
+
+def test_validate_prompt_returns_a_new_list():
+    variables = validate_prompt("{question} about {topic}")
+    variables.append("mutated")
+
+    assert validate_prompt("{question} about {topic}") == ["question", "topic"]
@@ -206,6 +206,23 @@ class TestFilterOperations:
         assert len(result) == 2  # John(50k) and Alice(55k)
         assert all(salary < 60000 for salary in result["salary"])
 
+    @pytest.mark.parametrize(
+        ("operator", "value", "expected"),
+        [("contains", "gmail", 2), ("starts with", "jane", 1), ("ends with", ".com", 5)],
+    )
+    def test_filter_arrow_backed_strings(self, component, sample_dataframe, operator, value, expected):
+        """Test string filters on Arrow-backed columns."""
+        pytest.importorskip("pyarrow")
+        component.df = DataFrame.from_data_list(sample_dataframe.to_data_list(), dtype_backend="pyarrow")
+        component.operation = [{"name": "Filter", "icon": "filter"}]
+        component.column_name = "email"
+        component.filter_operator = operator
+        component.filter_value = value
+
+        result = component.perform_operation()
+
+        assert len(result) == expected
+
 
 class TestEdgeCases:
     """Test edge cases and error conditions."""
@@ -0,0 +1,85 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from langflow.components.input_output import ChatInput, ChatOutput
+from langflow.graph import Graph
+from langflow.interface.initialize.component_pool import ComponentPool, get_component_pool
+from langflow.schema.message import Message
+from langflow.template.field.base import UNDEFINED
+
+
+def _graph_payload(input_value: str = "") -> dict:
+    chat_input = ChatInput(_id="chat_input", input_value=input_value, should_store_message=False)
+    chat_output = ChatOutput(_id="chat_output", should_store_message=False)
+    chat_output.set(input_value=chat_input.message_response)
+    return Graph(chat_input, chat_output).dump()["data"]
+
+
+async def test_clone_has_independent_state():
+    prototype = ChatInput(_id="chat_input")
+    clone1 = prototype.clone(_id="chat_input")
+    clone2 = prototype.clone(_id="chat_input")
+
+    clone1.set_attributes({"input_value": "Hello from clone1", "should_store_message": False})
+    clone1._outputs_map["message"].value = "result"
+    clone1._results["message"] = "result"
+    clone1._ctx["key"] = "value"
+    clone1._inputs["input_value"].value = "Hello from clone1"
+    message = await clone1.message_response()
+
+    assert isinstance(message, Message)
+    assert message.text == "Hello from clone1"
+    for component in (prototype, clone2):
+        assert component._results == {}
+        assert component._ctx == {}
+        assert component._attributes == {}
+        assert component._outputs_map["message"].value is UNDEFINED
+        assert component._inputs["input_value"].value == ""
+    assert clone1._inputs["input_value"] is not prototype._inputs["input_value"]
+
+
+async def test_pool_reuses_prototype_across_graphs():
+    payload = _graph_payload()
+    flow_id = str(uuid4())
+    pool = ComponentPool()
+
+    with (
+        patch("langflow.interface.initialize.component_pool.eval_custom_component_code") as eval_code,
+        patch("langflow.interface.initialize.loading.get_component_pool", return_value=pool),
+    ):
+        eval_code.side_effect = lambda code: ChatInput if "class ChatInput" in code else ChatOutput
+        components = []
+        entries = []
+        for _ in range(3):
+            graph = Graph.from_payload(payload, flow_id=flow_id)
+            vertex = graph.get_vertex("chat_input")
+            vertex.instantiate_component()
+            components.append(vertex.custom_component)
+            entries.append(pool._flows[flow_id]["chat_input"])
+
+    # The first graph evaluates the code of its two vertices, the following ones reuse the pooled entries
+    assert eval_code.call_count == 2
+    assert entries[0].prototype is not None
+    assert all(entry is entries[0] for entry in entries)
+    assert len({id(component) for component in components}) == 3
+    assert all(type(component) is entries[0].class_object for component in components)
+    assert all(component is not entries[0].prototype for component in components)
+    assert all(component._vertex is not None for component in components)
+
+    pool.invalidate(flow_id)
+    assert pool._get_entry(flow_id, vertex, "", b"") is None
+
+
+async def test_pooled_graph_runs_like_a_fresh_one():
+    flow_id = str(uuid4())
+    get_component_pool().invalidate()
+
+    for text in ("first run", "second run"):
+        graph = Graph.from_payload(_graph_payload(text), flow_id=flow_id)
+        graph.prepare()
+        results = [result async for result in graph.async_start()]
+        assert len(results) == 3
+
+        chat_output = graph.get_vertex("chat_output")
+        assert chat_output.custom_component._vertex is chat_output
+        assert chat_output.built_object["message"].text == text
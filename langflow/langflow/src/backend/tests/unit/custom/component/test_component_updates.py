@@ -0,0 +1,105 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from langflow.custom.component_updates import BuildConfigUpdateCoalescer, ComponentTemplateCache
+from langflow.custom.custom_component.component import Component
+
+SLOW_UPDATE_CODE = (Path(__file__).parents[3] / "data" / "slow_update_component.py").read_text(encoding="utf-8")
+
+
+async def test_superseded_updates_return_the_newer_result():
+    coalescer = BuildConfigUpdateCoalescer()
+    finished = []
+
+    async def update(value: str) -> str:
+        await asyncio.sleep(0.1)
+        finished.append(value)
+        return value
+
+    first = asyncio.create_task(coalescer.run("node", lambda: update("a")))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(coalescer.run("node", lambda: update("ab")))
+    await asyncio.sleep(0.01)
+    third = await coalescer.run("node", lambda: update("abc"))
+
+    assert [await first, await second, third] == ["abc", "abc", "abc"]
+    assert finished == ["abc"]
+    assert coalescer._pending == {}
+
+
+async def test_updates_of_other_nodes_are_not_cancelled():
+    coalescer = BuildConfigUpdateCoalescer()
+
+    async def update(value: str) -> str:
+        await asyncio.sleep(0.05)
+        return value
+
+    results = await asyncio.gather(
+        coalescer.run("node-1", lambda: update("a")),
+        coalescer.run("node-2", lambda: update("b")),
+        coalescer.run(None, lambda: update("c")),
+        coalescer.run(None, lambda: update("d")),
+    )
+
+    assert results == ["a", "b", "c", "d"]
+
+
+async def test_errors_reach_the_waiting_requests():
+    coalescer = BuildConfigUpdateCoalescer()
+
+    async def update() -> str:
+        await asyncio.sleep(0.01)
+        msg = "Invalid value"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="Invalid value"):
+        await coalescer.run("node", update)
+    assert coalescer._pending == {}
+
+
+async def test_cancelling_a_request_cancels_its_update():
+    coalescer = BuildConfigUpdateCoalescer()
+    started = asyncio.Event()
+
+    async def update() -> str:
+        started.set()
+        await asyncio.sleep(10)
+        return "done"
+
+    request = asyncio.create_task(coalescer.run("node", update))
+    await started.wait()
+    request.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await request
+
+
+def test_template_cache_builds_the_node_once_per_code(monkeypatch):
+    from langflow.custom import component_updates
+
+    cache = ComponentTemplateCache()
+    builds = 0
+    build_custom_component_template = component_updates.build_custom_component_template
+
+    def counting_build(*args, **kwargs):
+        nonlocal builds
+        builds += 1
+        return build_custom_component_template(*args, **kwargs)
+
+    monkeypatch.setattr(component_updates, "build_custom_component_template", counting_build)
+
+    first_node, first_instance = cache.build(SLOW_UPDATE_CODE)
+    first_node["template"]["text"]["info"] = "changed"
+    second_node, second_instance = cache.build(SLOW_UPDATE_CODE)
+
+    assert builds == 1
+    assert isinstance(second_instance, Component)
+    assert second_instance is not first_instance
+    assert type(second_instance) is type(first_instance)
+    assert second_node["template"]["text"]["info"] != "changed"
+    assert second_node["template"]["code"]["value"] == SLOW_UPDATE_CODE
+
+    cache.invalidate()
+    cache.build(SLOW_UPDATE_CODE)
+    assert builds == 2
@@ -0,0 +1,142 @@
+import copy
+
+import pytest
+from langflow.api.utils import update_graph_from_data
+from langflow.components.input_output import ChatInput, ChatOutput, TextOutputComponent
+from langflow.components.logic import LoopComponent
+from langflow.components.processing import MessageToDataComponent, ParserComponent, SplitTextComponent
+from langflow.graph import Graph
+
+
+@pytest.fixture
+def payload() -> dict:
+    chat_input = ChatInput(_id="chat_input", should_store_message=False)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output", should_store_message=False)
+    chat_output.set(input_value=text_output.text_response)
+    return Graph(chat_input, chat_output).dump()["data"]
+
+
+def _node(payload: dict, node_id: str) -> dict:
+    return next(node for node in payload["nodes"] if node["id"] == node_id)
+
+
+def _set_field(payload: dict, node_id: str, field: str, value) -> dict:
+    payload = copy.deepcopy(payload)
+    _node(payload, node_id)["data"]["node"]["template"][field]["value"] = value
+    return payload
+
+
+def test_apply_diff_without_changes(payload):
+    graph = Graph.from_payload(copy.deepcopy(payload))
+    vertices = list(graph.vertices)
+    moved = copy.deepcopy(payload)
+    _node(moved, "text_output")["position"] = {"x": 100, "y": 100}
+
+    diff = graph.apply_diff(moved)
+
+    assert diff.added == diff.removed == diff.changed == diff.dirty == set()
+    assert not diff.edges_changed
+    assert graph.vertices == vertices
+    assert all(vertex is old_vertex for vertex, old_vertex in zip(graph.vertices, vertices, strict=True))
+    assert graph.raw_graph_data["nodes"] is moved["nodes"]
+
+
+def test_apply_diff_rebuilds_the_changed_vertex_and_keeps_the_layers(payload, monkeypatch):
+    graph = Graph.from_payload(copy.deepcopy(payload))
+    layers = graph.sorted_vertices_layers
+    chat_input = graph.get_vertex("chat_input")
+    old_chat_output = graph.get_vertex("chat_output")
+
+    diff = graph.apply_diff(_set_field(payload, "chat_output", "sender_name", "Bot"))
+
+    assert diff.changed == diff.dirty == {"chat_output"}
+    assert not diff.edges_changed
+    assert graph.get_vertex("chat_input") is chat_input
+    assert graph.get_vertex("chat_output") is not old_chat_output
+    assert graph.get_vertex("chat_output").params["sender_name"] == "Bot"
+    assert graph.get_vertex("chat_output").params["input_value"] is graph.get_vertex("text_output")
+
+    def sort_again(*_args, **_kwargs):
+        msg = "The layers should be reused"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("langflow.graph.graph.base.get_sorted_vertices", sort_again)
+    assert [graph.sort_vertices(), *graph.vertices_layers] == layers
+
+
+def test_apply_diff_resets_the_successors_of_a_changed_vertex(payload):
+    graph = Graph.from_payload(copy.deepcopy(payload))
+
+    diff = graph.apply_diff(_set_field(payload, "chat_input", "sender_name", "Someone"))
+
+    assert diff.changed == {"chat_input"}
+    assert diff.dirty == {"chat_input", "text_output", "chat_output"}
+    # The params of the successors hold the new vertex
+    assert graph.get_vertex("text_output").params["input_value"] is graph.get_vertex("chat_input")
+
+
+def test_apply_diff_matches_a_full_rebuild_when_edges_change(payload):
+    graph = Graph.from_payload(copy.deepcopy(payload))
+    graph.sort_vertices()
+    new_payload = copy.deepcopy(payload)
+    # Connect the chat input to the chat output directly, without the text output
+    new_payload["nodes"] = [node for node in new_payload["nodes"] if node["id"] != "text_output"]
+    edge = next(edge for edge in new_payload["edges"] if edge["target"] == "chat_output")
+    new_payload["edges"] = [edge]
+    edge["source"] = edge["data"]["sourceHandle"]["id"] = "chat_input"
+    edge["data"]["sourceHandle"].update(dataType="ChatInput", name="message", output_types=["Message"], id="chat_input")
+
+    diff = graph.apply_diff(copy.deepcopy(new_payload))
+    rebuilt = Graph.from_payload(copy.deepcopy(new_payload))
+
+    assert diff.removed == {"text_output"}
+    assert diff.edges_changed
+    assert diff.dirty == {"chat_output"}
+    assert graph.get_vertex_ids() == rebuilt.get_vertex_ids()
+    assert {(edge.source_id, edge.target_id) for edge in graph.edges} == {("chat_input", "chat_output")}
+    assert dict(graph.successor_map) == dict(rebuilt.successor_map)
+    assert dict(graph.predecessor_map) == dict(rebuilt.predecessor_map)
+    assert graph.sort_vertices() == rebuilt.sort_vertices()
+    assert graph.vertices_layers == rebuilt.vertices_layers
+    assert graph.get_vertex("chat_output").params["input_value"] is graph.get_vertex("chat_input")
+
+
+async def test_run_after_apply_diff(payload):
+    graph = Graph.from_payload(copy.deepcopy(payload))
+    await graph.arun(inputs=[{"input_value": "hello"}])
+    assert graph.get_vertex("chat_output").built_object["message"].sender_name == "AI"
+
+    graph.apply_diff(_set_field(payload, "chat_output", "sender_name", "Bot"))
+    await graph.arun(inputs=[{"input_value": "hello"}])
+
+    assert graph.get_vertex("chat_output").built_object["message"].sender_name == "Bot"
+
+
+def _loop_payload(text: str) -> dict:
+    chat_input = ChatInput(_id="chat_input", input_value=text, should_store_message=False)
+    split_text = SplitTextComponent(_id="split_text")
+    split_text.set(data_inputs=chat_input.message_response, chunk_size=1, chunk_overlap=0, separator=",")
+    loop = LoopComponent(_id="loop")
+    loop.set(data=split_text.split_text)
+    parser = ParserComponent(_id="parser")
+    parser.set(input_data=loop.item_output, pattern="{text}!")
+    message_to_data = MessageToDataComponent(_id="message_to_data")
+    message_to_data.set(message=parser.parse_combined_text)
+    loop.set(item=message_to_data.convert_message_to_data)
+    chat_output = ChatOutput(_id="chat_output", should_store_message=False)
+    chat_output.set(input_value=loop.done_output)
+    return Graph(chat_input, chat_output).dump()["data"]
+
+
+async def test_run_loop_again_after_update_graph_from_data():
+    graph = Graph.from_payload(_loop_payload("a,b,c"))
+    await graph.arun(inputs=[{}])
+    assert graph.get_vertex("loop").built_object["done"]["text"].tolist() == ["a!", "b!", "c!"]
+
+    # The loop keeps its state in the context and the split text its input, neither should leak into the next run
+    await update_graph_from_data(graph, _loop_payload("x,y"), session_id="session")
+    await graph.arun(inputs=[{}])
+
+    assert graph.get_vertex("loop").built_object["done"]["text"].tolist() == ["x!", "y!"]
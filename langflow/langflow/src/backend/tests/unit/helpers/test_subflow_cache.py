@@ -0,0 +1,142 @@
+import pytest
+from fastapi.encoders import jsonable_encoder
+from langflow.components.input_output import ChatInput, ChatOutput, TextOutputComponent
+from langflow.components.logic import LoopComponent
+from langflow.components.processing import MessageToDataComponent, ParserComponent, SplitTextComponent
+from langflow.graph import Graph
+from langflow.helpers import subflow_cache
+from langflow.helpers.flow import build_function_and_schema, run_flow
+from langflow.helpers.subflow_cache import get_subflow_graph_cache
+from langflow.services.database.models.flow.model import Flow, FlowCreate
+from langflow.services.deps import session_scope
+
+CALLS = 100
+
+
+async def _add_flow(name: str, graph: Graph, user_id) -> Flow:
+    # The default values of some inputs are messages, with their timestamp
+    data = jsonable_encoder(graph.dump()["data"])
+    flow = Flow.model_validate(FlowCreate(name=name, data=data, user_id=user_id))
+    async with session_scope() as session:
+        session.add(flow)
+    return flow
+
+
+@pytest.fixture
+async def subflow(client, active_user):  # noqa: ARG001
+    chat_input = ChatInput(_id="ChatInput-subflow", should_store_message=False)
+    text_output = TextOutputComponent(_id="TextOutput-subflow")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(_id="ChatOutput-subflow", should_store_message=False)
+    chat_output.set(input_value=text_output.text_response)
+
+    flow = await _add_flow("subflow", Graph(chat_input, chat_output), active_user.id)
+    get_subflow_graph_cache().invalidate()
+    yield flow
+    get_subflow_graph_cache().invalidate()
+
+
+@pytest.fixture
+async def loop_subflow(client, active_user):  # noqa: ARG001
+    chat_input = ChatInput(_id="ChatInput-loop", should_store_message=False)
+    split_text = SplitTextComponent(_id="SplitText-loop")
+    split_text.set(data_inputs=chat_input.message_response, chunk_size=1, chunk_overlap=0, separator=",")
+    loop = LoopComponent(_id="Loop-loop")
+    loop.set(data=split_text.split_text)
+    parser = ParserComponent(_id="Parser-loop")
+    parser.set(input_data=loop.item_output, pattern="{text}!")
+    message_to_data = MessageToDataComponent(_id="MessageToData-loop")
+    message_to_data.set(message=parser.parse_combined_text)
+    loop.set(item=message_to_data.convert_message_to_data)
+    chat_output = ChatOutput(_id="ChatOutput-loop", should_store_message=False)
+    chat_output.set(input_value=loop.done_output)
+
+    flow = await _add_flow("loop subflow", Graph(chat_input, chat_output), active_user.id)
+    get_subflow_graph_cache().invalidate()
+    yield flow
+    get_subflow_graph_cache().invalidate()
+
+
+@pytest.fixture
+def counters(monkeypatch):
+    counters = {"loads": 0, "parses": 0}
+    load_flow_data = subflow_cache._load_flow_data
+    from_payload = Graph.from_payload.__func__
+
+    async def counting_load_flow_data(*args, **kwargs):
+        counters["loads"] += 1
+        return await load_flow_data(*args, **kwargs)
+
+    def counting_from_payload(cls, *args, **kwargs):
+        counters["parses"] += 1
+        return from_payload(cls, *args, **kwargs)
+
+    monkeypatch.setattr(subflow_cache, "_load_flow_data", counting_load_flow_data)
+    monkeypatch.setattr(Graph, "from_payload", classmethod(counting_from_payload))
+    return counters
+
+
+async def _flow_tool(flow: Flow, user_id):
+    graph = Graph.from_payload(flow.data, flow_id=str(flow.id), user_id=str(user_id))
+    flow_function, _ = build_function_and_schema(flow.to_data(), graph, user_id)
+    return flow_function
+
+
+async def test_flow_tool_called_in_a_loop_loads_and_parses_the_flow_once(subflow, active_user, counters):
+    flow_function = await _flow_tool(subflow, active_user.id)
+    counters["parses"] = 0
+
+    for index in range(CALLS):
+        result = await flow_function(chat_input=f"question {index}")
+        assert result.endswith(f"question {index}")
+
+    assert counters == {"loads": 1, "parses": 1}
+
+
+async def test_saving_the_flow_invalidates_its_graph(subflow, active_user, counters, client, logged_in_headers):
+    flow_function = await _flow_tool(subflow, active_user.id)
+    await flow_function(chat_input="before")
+
+    data = subflow.data
+    chat_output = next(node for node in data["nodes"] if node["id"] == "ChatOutput-subflow")
+    chat_output["data"]["node"]["template"]["sender_name"]["value"] = "Bot"
+    response = await client.patch(f"api/v1/flows/{subflow.id}", json={"data": data}, headers=logged_in_headers)
+    assert response.status_code == 200
+
+    result = await flow_function(chat_input="after")
+
+    assert result.endswith("after")
+    assert counters["loads"] == 2
+
+
+async def _run_subflow(flow: Flow, user_id, input_value: str, session_id: str | None = None):
+    outputs = await run_flow(
+        inputs={"input_value": input_value}, flow_id=str(flow.id), user_id=str(user_id), session_id=session_id
+    )
+    return outputs[0].outputs[0].results["message"]
+
+
+async def test_subflow_runs_dont_keep_the_session_of_the_last_caller(subflow, active_user, counters, monkeypatch):
+    sessions = []
+    arun = Graph.arun
+
+    async def recording_arun(graph, *args, **kwargs):
+        sessions.append(graph.session_id)
+        return await arun(graph, *args, **kwargs)
+
+    monkeypatch.setattr(Graph, "arun", recording_arun)
+    for session_id in (None, "caller session", None):
+        await _run_subflow(subflow, active_user.id, "question", session_id=session_id)
+
+    assert counters["parses"] == 1
+    assert sessions == ["", "caller session", ""]
+
+
+async def test_loop_subflow_runs_again(loop_subflow, active_user, counters):
+    first = await _run_subflow(loop_subflow, active_user.id, "a,b,c")
+    second = await _run_subflow(loop_subflow, active_user.id, "x,y")
+
+    assert counters["parses"] == 1
+    assert all(f"{item}!" in first.text for item in "abc")
+    assert all(f"{item}!" in second.text for item in "xy")
+    assert not any(f"{item}!" in second.text for item in "abc")
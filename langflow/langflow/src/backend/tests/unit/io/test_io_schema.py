@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Literal
 import pytest
 from langflow.components.input_output import ChatInput
 from langflow.inputs.inputs import DropdownInput, FileInput, IntInput, NestedDictInput, StrInput
-from langflow.io.schema import create_input_schema
+from langflow.io.schema import create_input_schema, create_input_schema_from_dict
+from langflow.schema.dotdict import dotdict
 
 if TYPE_CHECKING:
     from pydantic.fields import FieldInfo
@@ -171,3 +172,38 @@ class TestCreateInputSchema:
         input_instance = StrInput(name="test@field#name")
         schema = create_input_schema([input_instance])
         assert "test@field#name" in schema.model_fields
+
+
+class TestInputSchemaReuse:
+    def test_inputs_with_the_same_definition_share_a_model(self):
+        def inputs():
+            return [StrInput(name="query", info="The query"), DropdownInput(name="mode", options=["a", "b"])]
+
+        assert create_input_schema(inputs()) is create_input_schema(inputs())
+
+    def test_inputs_with_a_different_definition_get_their_own_model(self):
+        schema = create_input_schema([DropdownInput(name="mode", options=["a", "b"])])
+
+        assert create_input_schema([DropdownInput(name="mode", options=["a", "c"])]) is not schema
+        assert create_input_schema([DropdownInput(name="mode", options=["a", "b"], info="Mode")]) is not schema
+        assert create_input_schema([IntInput(name="count", value=1)]) is not create_input_schema(
+            [IntInput(name="count", value=2)]
+        )
+
+    def test_default_is_not_shared_with_the_input(self):
+        nested_input = NestedDictInput(name="nested_field", value={"key": "value"})
+        schema = create_input_schema([nested_input])
+
+        nested_input.value["key"] = "changed"
+
+        assert schema.model_fields["nested_field"].default == {"key": "value"}
+        assert create_input_schema([nested_input]).model_fields["nested_field"].default == {"key": "changed"}
+
+    def test_flow_inputs_with_the_same_definition_share_a_model(self):
+        def inputs():
+            return [dotdict({"name": "input_value", "type": str, "info": "", "required": False, "value": ""})]
+
+        schema = create_input_schema_from_dict(inputs(), param_key="flow_tweak_data")
+
+        assert create_input_schema_from_dict(inputs(), param_key="flow_tweak_data") is schema
+        assert create_input_schema_from_dict(inputs()) is not schema
@@ -1,8 +1,9 @@
+import numpy as np
 import pandas as pd
 import pytest
 from langchain_core.documents import Document
 from langflow.schema.data import Data
-from langflow.schema.dataframe import DataFrame
+from langflow.schema.dataframe import DataFrame, DataFrameRowBuffer
 
 
 @pytest.fixture
@@ -22,6 +23,75 @@ class TestDataFrameSchema:
         assert data_list[0].data["name"] == "John"
         assert data_list[0].data["text"] == "name is John"
 
+    def test_to_data_list_matches_records(self):
+        """Test the rows of the Data objects are the records of the DataFrame, for every kind of column."""
+        data_frame = DataFrame(
+            pd.DataFrame(
+                {
+                    "int": [1, 2],
+                    "float": [np.nan, 1.5],
+                    "bool": [True, False],
+                    "date": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+                    "object": [np.int64(3), None],
+                    "nullable": pd.array([1, None], dtype="Int64"),
+                    "category": pd.Categorical(["a", "b"]),
+                }
+            )
+        )
+        expected = data_frame.to_dict(orient="records")
+
+        rows = [item.data for item in data_frame.to_data_list()]
+
+        assert repr(rows) == repr(expected)
+        assert [list(map(type, row.values())) for row in rows] == [list(map(type, row.values())) for row in expected]
+
+    def test_from_data_list(self):
+        """Test building a DataFrame from Data objects and dictionaries."""
+        data_frame = DataFrame.from_data_list(
+            [Data(data={"name": "John", "age": 30}), {"name": "Jane"}], text_key="name"
+        )
+        assert isinstance(data_frame, DataFrame)
+        assert data_frame.text_key == "name"
+        assert data_frame["name"].tolist() == ["John", "Jane"]
+        assert data_frame["age"].isna().tolist() == [False, True]
+
+    def test_from_data_list_with_arrow_backend(self):
+        """Test the columns are backed by Arrow arrays when asked to."""
+        pytest.importorskip("pyarrow")
+        data_frame = DataFrame.from_data_list(
+            [{"name": "John", "age": 30, "joined": pd.Timestamp("2024-01-01")}, {"name": None, "score": 1.5}],
+            dtype_backend="pyarrow",
+        )
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in data_frame.dtypes)
+        expected = data_frame.to_dict(orient="records")
+        assert repr([item.data for item in data_frame.to_data_list()]) == repr(expected)
+
+    def test_from_data_list_with_arrow_backend_and_mixed_types(self):
+        """Test columns mixing types are still converted."""
+        pytest.importorskip("pyarrow")
+        data_frame = DataFrame.from_data_list([{"value": 1}, {"value": "one"}], dtype_backend="pyarrow")
+        assert data_frame["value"].tolist() == [1, "one"]
+
+    def test_row_buffer(self, sample_dataframe):
+        """Test appending rows through a buffer builds the DataFrame once, when it is read."""
+        data_frame = DataFrame(sample_dataframe)
+        buffer = data_frame.row_buffer()
+        buffer.append({"name": "Bob", "text": "name is Bob"})
+        buffer.extend([Data(data={"name": "Alice", "text": "name is Alice"})])
+        assert len(buffer) == 4
+        assert len(data_frame) == 2
+
+        new_df = buffer.to_dataframe()
+        assert isinstance(new_df, DataFrame)
+        assert new_df["name"].tolist() == ["John", "Jane", "Bob", "Alice"]
+        assert buffer.to_dataframe() is new_df
+
+    def test_row_buffer_without_dataframe(self):
+        """Test a buffer started empty builds a DataFrame with the appended rows only."""
+        buffer = DataFrameRowBuffer()
+        buffer.append({"name": "Bob"})
+        assert buffer.to_dataframe()["name"].tolist() == ["Bob"]
+
     def test_add_row(self, sample_dataframe):
         """Test adding a single row to DataFrame."""
         data_frame = DataFrame(sample_dataframe)
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
+from fastapi.encoders import jsonable_encoder
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.prompts.chat import ChatPromptTemplate
 from langflow.schema.message import Message
@@ -58,6 +59,15 @@ def test_message_prompt_serialization():
     assert prompt.messages[0].content == "Hello, Langflow!"
 
 
+def test_message_prompt_matches_langchain_serialization():
+    message = Message.from_template("Tell me about {topic}", topic=Message(text="{braces}"))
+
+    expected = jsonable_encoder(ChatPromptTemplate.from_messages([HumanMessage(content=message.text)]).to_json())
+    assert message.text == "Tell me about {braces}"
+    assert message.prompt == expected
+    assert message.messages == expected["kwargs"]["messages"]
+
+
 def test_message_from_human_text():
     """Test creating a message from human text."""
     text = "Hello, AI!"
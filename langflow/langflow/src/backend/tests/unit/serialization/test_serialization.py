@@ -342,3 +342,33 @@ class TestSerializationHypothesis:
         assert isinstance(result, dict)
         assert len(result) == MAX_ITEMS_LENGTH
         assert all(isinstance(v, int) for v in result.values())
+
+    def test_dataframe_columns_match_record_serialization(self) -> None:
+        """Column-wise DataFrame serialization matches serializing each record."""
+        test_df = pd.DataFrame(
+            {
+                "int": [1, 2, 3],
+                "float": [1.5, np.nan, 3.5],
+                "bool": [True, False, True],
+                "text": ["short", "x" * 50, "y"],
+                "mixed": ["a", 1, None],
+                "nested": [{"key": "z" * 50}, [1, 2], None],
+                "date": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            }
+        )
+        result = serialize(test_df, max_length=10, max_items=2)
+        expected = serialize(test_df.head(2).to_dict(orient="records"), max_length=10, max_items=2)
+
+        assert len(result) == 2
+        for row, expected_row in zip(result, expected, strict=True):
+            assert row.keys() == expected_row.keys()
+            for key, value in row.items():
+                if isinstance(value, float) and math.isnan(value):
+                    assert math.isnan(expected_row[key])
+                else:
+                    assert value == expected_row[key]
+                    assert type(value) is type(expected_row[key])
+
+    def test_dataframe_without_columns(self) -> None:
+        """Test serialization of a DataFrame with rows but no columns."""
+        assert serialize(pd.DataFrame(index=range(3))) == [{}, {}, {}]
@@ -0,0 +1,77 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from langflow.services.build_scheduler.service import BuildQueueFullError, BuildSchedulerService
+from langflow.services.settings.base import Settings
+from langflow.services.settings.service import SettingsService
+
+
+def _scheduler(**quotas) -> BuildSchedulerService:
+    settings = Settings()
+    for name, value in quotas.items():
+        setattr(settings, name, value)
+    return BuildSchedulerService(SettingsService(settings, MagicMock()))
+
+
+async def test_builds_take_turns_between_users():
+    scheduler = _scheduler(max_concurrent_builds=1, max_concurrent_builds_per_user=0, max_queued_builds_per_user=0)
+    started: list[str] = []
+
+    async def build(user_id: str) -> None:
+        started.append(user_id)
+        await asyncio.sleep(0)
+
+    first = scheduler.submit("noisy")
+    # The noisy user queues many builds before the other user submits one
+    noisy_tickets = [scheduler.submit("noisy") for _ in range(5)]
+    other_ticket = scheduler.submit("other")
+    assert scheduler.get_stats() == {"running": 1, "waiting": 6, "users_running": 1, "users_waiting": 2}
+
+    tasks = [
+        asyncio.create_task(scheduler.run(ticket, build(ticket.user_id))) for ticket in [*noisy_tickets, other_ticket]
+    ]
+    await scheduler.run(first, build("noisy"))
+    await asyncio.gather(*tasks)
+
+    assert started[:3] == ["noisy", "noisy", "other"]
+    assert scheduler.get_stats() == {"running": 0, "waiting": 0, "users_running": 0, "users_waiting": 0}
+
+
+async def test_queue_quotas_reject_builds():
+    scheduler = _scheduler(max_concurrent_builds=0, max_concurrent_builds_per_user=1, max_queued_builds_per_user=2)
+
+    running = scheduler.submit("user")
+    assert running.running
+    waiting = [scheduler.submit("user"), scheduler.submit("user")]
+    with pytest.raises(BuildQueueFullError) as exc_info:
+        scheduler.submit("user")
+    assert exc_info.value.retry_after > 0
+
+    # Other users have their own quotas
+    assert scheduler.submit("other").running
+
+    running.release()
+    assert waiting[0].running
+    assert scheduler.submit("user") is not None
+
+
+async def test_cancelled_builds_release_their_slot():
+    scheduler = _scheduler(max_concurrent_builds=1, max_concurrent_builds_per_user=0)
+    release_build = asyncio.Event()
+    running = scheduler.submit("user")
+    running_task = asyncio.create_task(scheduler.run(running, release_build.wait()))
+
+    waiting = scheduler.submit("other")
+    waiting_task = asyncio.create_task(scheduler.run(waiting, release_build.wait()))
+    await asyncio.sleep(0)
+    waiting_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting_task
+    assert scheduler.get_stats()["waiting"] == 0
+
+    running_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running_task
+    assert scheduler.get_stats()["running"] == 0
+    assert scheduler.submit("other").running
@@ -0,0 +1,62 @@
+import math
+
+import dill
+import pytest
+from langflow.services.cache.serialization import CacheSerializer, DillCodec, OrjsonCodec
+from langflow.services.cache.service import RedisCache
+from langflow.services.cache.utils import CACHE_MISS
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+async def redis_cache():
+    cache = RedisCache(expiration_time=60)
+    cache._client = fakeredis.aioredis.FakeRedis()
+    yield cache
+    await cache._client.aclose()
+
+
+@pytest.mark.parametrize(
+    ("value", "tag"),
+    [
+        ({"result": {"text": "Hello", "count": 3, "ratio": 0.5, "ok": True, "items": [1, None]}}, OrjsonCodec.tag),
+        ({"text": "Hello", "raw": b"\x00\x01"}, b"\x02"),
+        ({"point": (1, 2)}, DillCodec.tag),
+        ({1: "non-string key"}, DillCodec.tag),
+        ([math.inf], DillCodec.tag),
+        ({1, 2}, DillCodec.tag),
+    ],
+)
+def test_serializer_round_trip(value, tag):
+    serializer = CacheSerializer()
+
+    data = serializer.dumps(value)
+
+    assert data[:1] == tag
+    assert serializer.loads(data) == value
+
+
+def test_serializer_reads_values_pickled_before_the_codecs():
+    assert CacheSerializer().loads(dill.dumps({"a": (1, 2)}, recurse=True)) == {"a": (1, 2)}
+
+
+async def test_redis_cache_get_set(redis_cache):
+    await redis_cache.set("key", {"a": [1, 2, 3]})
+
+    assert await redis_cache.get("key") == {"a": [1, 2, 3]}
+    assert await redis_cache.get("missing") is CACHE_MISS
+    assert (await redis_cache._client.get("key"))[:1] == OrjsonCodec.tag
+
+
+async def test_redis_cache_get_many_set_many(redis_cache):
+    await redis_cache.set_many({"a": {"value": 1}, "b": ("not", "json")})
+
+    assert await redis_cache.get_many(["a", "missing", "b"]) == [{"value": 1}, CACHE_MISS, ("not", "json")]
+    assert await redis_cache.get_many([]) == []
+    assert 0 < await redis_cache._client.ttl("b") <= 60
+
+
+async def test_redis_cache_rejects_unpicklable_values(redis_cache):
+    with pytest.raises(TypeError, match="can be pickled"):
+        await redis_cache.set("key", (_ for _ in range(3)))
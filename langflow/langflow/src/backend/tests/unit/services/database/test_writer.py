@@ -0,0 +1,79 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from langflow.services.database.service import DatabaseService
+from langflow.services.database.writer import SQLiteWriter
+from langflow.services.settings.base import Settings
+from langflow.services.settings.service import SettingsService
+from sqlmodel import text
+
+
+@pytest.fixture
+async def writer(tmp_path):
+    writer = SQLiteWriter(f"sqlite+aiosqlite:///{tmp_path / 'writer.db'}", batch_interval=0.01)
+    async with writer.engine.begin() as connection:
+        await connection.exec_driver_sql("CREATE TABLE item (name TEXT PRIMARY KEY)")
+    yield writer
+    await writer.stop()
+
+
+def _insert(name: str):
+    async def write(session):
+        await session.exec(text("INSERT INTO item (name) VALUES (:name)").bindparams(name=name))
+        return name
+
+    return write
+
+
+async def _names(writer: SQLiteWriter) -> list[str]:
+    async with writer.engine.connect() as connection:
+        result = await connection.exec_driver_sql("SELECT name FROM item ORDER BY name")
+        return [row[0] for row in result]
+
+
+async def test_concurrent_writes_are_committed_in_one_batch(writer):
+    names = [f"item-{index:02d}" for index in range(20)]
+
+    results = await asyncio.gather(*(writer.write(_insert(name)) for name in names))
+
+    assert results == names
+    assert await _names(writer) == names
+    assert writer.batches == 1
+    assert writer.writes == len(names)
+
+
+async def test_failing_write_only_fails_its_caller(writer):
+    results = await asyncio.gather(
+        writer.write(_insert("first")),
+        writer.write(_insert("first")),
+        writer.write(_insert("second")),
+        return_exceptions=True,
+    )
+
+    assert results[0] == "first"
+    assert "UNIQUE constraint failed" in str(results[1])
+    assert results[2] == "second"
+    assert await _names(writer) == ["first", "second"]
+
+
+async def test_stop_commits_the_queued_writes(writer):
+    pending = [asyncio.ensure_future(writer.write(_insert(name))) for name in ("a", "b")]
+    await asyncio.sleep(0)
+
+    await writer.stop()
+
+    assert await asyncio.gather(*pending) == ["a", "b"]
+    assert await _names(writer) == ["a", "b"]
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+async def test_database_service_creates_the_writer(tmp_path, enabled):
+    settings = Settings()
+    settings.sqlite_write_batching = enabled
+    db_service = DatabaseService(SettingsService(settings, MagicMock()))
+    db_service.database_url = f"sqlite:///{tmp_path / 'langflow.db'}"
+    db_service.reload_engine()
+
+    assert (db_service.writer is not None) is enabled
+    await db_service.engine.dispose()
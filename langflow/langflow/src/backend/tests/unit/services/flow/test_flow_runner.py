@@ -1,6 +1,11 @@
+import json
+import os
+import time
 from uuid import uuid4
 
 import pytest
+from langflow.components.input_output import ChatInput, ChatOutput
+from langflow.graph import Graph
 from langflow.services.flow.flow_runner import LangflowRunnerExperimental
 
 
@@ -84,3 +89,82 @@ async def test_initialize_database(flow_runner):
     flow_runner.should_initialize_db = True
     await flow_runner.init_db_if_needed()
     assert not flow_runner.should_initialize_db
+
+
+def _sender_name(flow_dict: dict) -> dict:
+    node = next(node for node in flow_dict["data"]["nodes"] if node["id"] == "ChatOutput-runner")
+    return node["data"]["node"]["template"]["sender_name"]
+
+
+@pytest.fixture
+def chat_flow_dict():
+    chat_input = ChatInput(_id="ChatInput-runner", should_store_message=False)
+    chat_output = ChatOutput(_id="ChatOutput-runner", should_store_message=False)
+    chat_output.set(input_value=chat_input.message_response)
+    flow_dict = Graph(chat_input, chat_output).dump(name="chat_flow")
+    flow_dict["id"] = str(uuid4())
+    sender_name = _sender_name(flow_dict)
+    sender_name["load_from_db"] = True
+    sender_name["value"] = "RUNNER_SENDER_NAME"
+    return flow_dict
+
+
+def test_process_tweaks_replaces_variables_with_env(flow_runner, chat_flow_dict):
+    flow_dict = flow_runner.process_tweaks(chat_flow_dict, tweaks_values={"RUNNER_SENDER_NAME": "Bot"})
+
+    assert _sender_name(flow_dict)["value"] == "Bot"
+    assert _sender_name(flow_dict)["load_from_db"] is False
+
+
+async def test_embedded_runner_reads_flow_files_once(chat_flow_dict, tmp_path, monkeypatch):
+    flow_runner = LangflowRunnerExperimental(embedded=True)
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(json.dumps(chat_flow_dict), encoding="utf-8")
+    reads = 0
+    get_flow_dict = flow_runner.get_flow_dict
+
+    async def counting_get_flow_dict(flow):
+        nonlocal reads
+        reads += 1
+        return await get_flow_dict(flow)
+
+    monkeypatch.setattr(flow_runner, "get_flow_dict", counting_get_flow_dict)
+
+    first = await flow_runner.prepare_flow(flow=flow_path, tweaks_values={"RUNNER_SENDER_NAME": "Bot"})
+    second = await flow_runner.prepare_flow(flow=str(flow_path), tweaks_values={"RUNNER_SENDER_NAME": "Assistant"})
+    assert reads == 1
+    assert _sender_name(first)["value"] == "Bot"
+    assert _sender_name(second)["value"] == "Assistant"
+    assert first is not second
+
+    chat_flow_dict["name"] = "renamed_flow"
+    flow_path.write_text(json.dumps(chat_flow_dict), encoding="utf-8")
+    os.utime(flow_path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+    renamed = await flow_runner.prepare_flow(flow=flow_path, tweaks_values={})
+    assert reads == 2
+    assert renamed["name"] == "renamed_flow"
+    assert _sender_name(renamed)["value"] == "RUNNER_SENDER_NAME"
+
+
+async def test_embedded_run_does_not_store_the_flow(chat_flow_dict, tmp_path, monkeypatch):
+    flow_runner = LangflowRunnerExperimental(embedded=True)
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(json.dumps(chat_flow_dict), encoding="utf-8")
+
+    async def fail(*args, **kwargs):  # noqa: ARG001
+        msg = "The flow should not be stored or deleted"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(flow_runner, "add_flow_to_db", fail)
+    monkeypatch.setattr(flow_runner, "clear_flow_state", fail)
+
+    result = await flow_runner.run(
+        session_id=str(uuid4()),
+        flow=flow_path,
+        input_value="Hello",
+        tweaks_values={"RUNNER_SENDER_NAME": "Bot"},
+    )
+
+    message = result[0].outputs[0].results["message"]
+    assert message.text == "Hello"
+    assert message.sender_name == "Bot"
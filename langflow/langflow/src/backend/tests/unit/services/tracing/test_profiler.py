@@ -0,0 +1,155 @@
+import asyncio
+import contextvars
+
+from langflow.components.input_output import ChatInput, ChatOutput
+from langflow.graph import Graph
+from langflow.services.deps import get_settings_service
+from langflow.services.tracing.profiler import ProfileStore, bind_to_current_span, profile_span, profile_store
+
+
+def _in_new_context(coro) -> asyncio.Task:
+    """Run a coroutine in a task that doesn't inherit the profile of the test."""
+    return contextvars.Context().run(asyncio.create_task, coro)
+
+
+def _children(span) -> list[tuple[str, str]]:
+    return [(child.category, child.name) for child in span.children]
+
+
+def _all_categories(span) -> set[str]:
+    categories = {span.category}
+    for child in span.children:
+        categories |= _all_categories(child)
+    return categories
+
+
+def test_profile_span_is_a_noop_outside_of_a_profiled_run():
+    def run():
+        with profile_span("build", "component") as span:
+            return span
+
+    span = contextvars.copy_context().run(run)
+
+    assert span._span is None
+
+
+async def test_profile_records_a_span_tree():
+    store = ProfileStore()
+
+    async def run():
+        profile = store.start("run-1", user_id="user", name="flow")
+        async with profile_span("build A", "component"):
+            with profile_span("A.build_output", "output"):
+                await asyncio.sleep(0.001)
+        # Tasks copy the context, so their spans go under the span that started them
+        async with profile_span("build B", "component"):
+            await asyncio.gather(asyncio.create_task(_child_span()), asyncio.create_task(_child_span()))
+        profile.finish()
+        return profile
+
+    async def _child_span():
+        async with profile_span("wait for a build slot", "scheduling"):
+            await asyncio.sleep(0.001)
+
+    profile = await _in_new_context(run())
+
+    assert store.get("run-1") is profile
+    assert profile.finished
+    assert _children(profile.root) == [("component", "build A"), ("component", "build B")]
+    assert _children(profile.root.children[0]) == [("output", "A.build_output")]
+    assert _children(profile.root.children[1]) == [("scheduling", "wait for a build slot")] * 2
+
+    data = profile.to_dict()
+    assert data["run_id"] == "run-1"
+    assert data["root"]["children"][0]["children"][0]["duration_ms"] >= 1
+
+    lines = profile.to_collapsed().splitlines()
+    assert "run:flow;component:build_A;output:A.build_output" in [line.rsplit(" ", 1)[0] for line in lines]
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+
+
+async def test_nested_runs_are_recorded_in_the_outer_run():
+    store = ProfileStore()
+
+    async def run():
+        outer = store.start("outer")
+        inner = store.start("inner")
+        with profile_span("subflow component", "component"):
+            pass
+        return outer, inner
+
+    outer, inner = await _in_new_context(run())
+
+    assert inner is None
+    assert store.get("inner") is None
+    assert _children(outer.root) == [("component", "subflow component")]
+
+
+async def test_bind_to_current_span_for_background_tasks():
+    store = ProfileStore()
+    background = []
+
+    async def log_build():
+        with profile_span("log build", "persistence"):
+            pass
+
+    async def run():
+        profile = store.start("run")
+        with profile_span("build", "component"):
+            background.append(bind_to_current_span(log_build))
+        return profile
+
+    profile = await _in_new_context(run())
+    # Background tasks run after the response, in another context
+    await _in_new_context(background[0]())
+
+    assert _children(profile.root.children[0]) == [("persistence", "log build")]
+
+
+def test_profile_store_keeps_the_most_recent_profiles():
+    store = ProfileStore(max_profiles=2)
+
+    for run_id in ["a", "b", "c"]:
+        contextvars.Context().run(store.start, run_id)
+
+    assert store.get("a") is None
+    assert store.get("b") is not None
+    assert store.get("c") is not None
+
+
+async def test_graph_run_is_profiled(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "profile_runs", True)
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+
+    await _in_new_context(graph.arun(inputs=[{"input_value": "hello"}]))
+
+    profile = profile_store.get(graph.run_id)
+    assert profile is not None
+    assert profile.finished
+    assert {"component", "output", "scheduling"} <= _all_categories(profile.root)
+
+
+async def test_get_run_profile(client, logged_in_headers, active_user):
+    async def run():
+        profile = profile_store.start("profiled-run", user_id=str(active_user.id))
+        with profile_span("build A", "component"):
+            await asyncio.sleep(0.001)
+        profile.finish()
+
+    await _in_new_context(run())
+
+    response = await client.get("api/v1/monitor/profile/profiled-run", headers=logged_in_headers)
+    assert response.status_code == 200
+    assert response.json()["root"]["children"][0]["name"] == "build A"
+
+    response = await client.get(
+        "api/v1/monitor/profile/profiled-run", params={"format": "collapsed"}, headers=logged_in_headers
+    )
+    assert response.status_code == 200
+    assert "\nrun:run;component:build_A " in "\n" + response.text
+
+    response = await client.get("api/v1/monitor/profile/unknown-run", headers=logged_in_headers)
+    assert response.status_code == 404
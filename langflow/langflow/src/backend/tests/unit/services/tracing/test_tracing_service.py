@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import uuid
 from unittest.mock import MagicMock, patch
 
@@ -11,6 +12,7 @@ from langflow.services.tracing.service import (
     component_context_var,
     trace_context_var,
 )
+from langflow.services.tracing.worker import TraceWorker
 
 
 class MockTracer(BaseTracer):
@@ -179,9 +181,9 @@ async def test_start_end_tracers(tracing_service):
         assert tracer.metadata_param == outputs
         assert tracer.outputs_param == trace_context.all_outputs
 
-    # Verify worker_task is cancelled
-    assert trace_context.worker_task is None
+    # Verify the trace context is stopped and the worker is drained
     assert not trace_context.running
+    assert tracing_service.worker.get_stats()["queued"] == 0
 
 
 @pytest.mark.asyncio
@@ -419,20 +421,45 @@ async def test_trace_worker_with_exception(tracing_service):
         # Remove incorrect context manager usage
         await tracing_service.start_tracers(run_id, run_name, user_id, session_id, project_name)
 
-        # Get trace_context and add failing trace function to queue
-        trace_context = trace_context_var.get()
-        await trace_context.traces_queue.put((failing_trace_func, ()))
+        # Add failing trace function to the worker queue
+        tracing_service.worker.submit(failing_trace_func)
 
-        # Wait for async queue processing
-        await asyncio.sleep(0.1)
+        # Wait for the worker thread to process the queue
+        await tracing_service.worker.flush()
 
         # Verify exception was logged
         mock_logger.assert_called_with("Error processing trace_func")
+        assert tracing_service.worker.get_stats()["failed"] == 1
 
         # Cleanup
         await tracing_service.end_tracers({})
 
 
+async def test_trace_worker_drops_oldest_when_full():
+    """Test the worker keeps the newest callbacks when its queue is full."""
+    worker = TraceWorker(max_queue_size=2)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def block_worker():
+        started.set()
+        release.wait()
+
+    # Blocks the worker thread while the queue fills up
+    worker.submit(block_worker)
+    await asyncio.to_thread(started.wait)
+
+    for i in range(5):
+        worker.submit(calls.append, i)
+    release.set()
+    await worker.flush()
+
+    assert calls == [3, 4]
+    assert worker.get_stats()["dropped"] == 3
+    worker.close()
+
+
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("mock_tracers")
 async def test_concurrent_tracing(tracing_service, mock_component):
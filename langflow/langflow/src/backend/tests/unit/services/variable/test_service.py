@@ -240,3 +240,33 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_get_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name1", "value1", session=session)
+    await service.create_variable(user_id, "name2", "value2", session=session)
+    await service.create_variable(uuid4(), "name3", "value3", session=session)
+
+    values = await service.get_variables(user_id, ["name1", "name2", "name3", "name1"], session=session)
+
+    assert values == {"name1": "value1", "name2": "value2"}
+
+
+async def test_get_variable__cache_is_invalidated(service, session: AsyncSession):
+    user_id = uuid4()
+    variable = await service.create_variable(user_id, "name", "value", session=session)
+    assert await service.get_variables(user_id, ["name"], session=session) == {"name": "value"}
+
+    await service.update_variable(user_id, "name", "new_value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "new_value"
+
+    await service.update_variable_fields(
+        user_id, variable.id, VariableUpdate(id=variable.id, name="renamed", value="renamed_value"), session=session
+    )
+    assert await service.get_variables(user_id, ["name", "renamed"], session=session) == {"renamed": "renamed_value"}
+
+    await service.delete_variable(user_id, "renamed", session=session)
+    assert await service.get_variables(user_id, ["renamed"], session=session) == {}
+    with pytest.raises(ValueError, match="renamed variable not found."):
+        await service.get_variable(user_id, "renamed", "", session=session)
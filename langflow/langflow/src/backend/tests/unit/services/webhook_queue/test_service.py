@@ -0,0 +1,196 @@
+import asyncio
+import sqlite3
+from collections import Counter
+from unittest.mock import MagicMock
+
+import pytest
+from langflow.services.settings.base import Settings
+from langflow.services.settings.service import SettingsService
+from langflow.services.webhook_queue import service as webhook_queue_module
+from langflow.services.webhook_queue.service import WebhookQueueFullError, WebhookQueueService, WebhookRunStatus
+
+
+def _webhook_queue(path, **settings_values) -> WebhookQueueService:
+    settings = Settings()
+    settings_values = {"webhook_queue_path": str(path), "webhook_queue_retry_backoff": 0.01, **settings_values}
+    for name, value in settings_values.items():
+        setattr(settings, name, value)
+    webhook_queue = WebhookQueueService(SettingsService(settings, MagicMock()))
+    webhook_queue.poll_interval = 0.05
+    return webhook_queue
+
+
+async def _wait_until_finished(webhook_queue: WebhookQueueService) -> None:
+    for _ in range(200):
+        stats = webhook_queue.get_stats()
+        if not stats["queued"] and not stats["running"]:
+            return
+        await asyncio.sleep(0.05)
+    msg = f"Runs did not finish: {webhook_queue.get_stats()}"
+    raise TimeoutError(msg)
+
+
+@pytest.fixture
+def webhook_queue_path(tmp_path):
+    return tmp_path / "webhook_queue.db"
+
+
+async def test_requests_with_the_same_idempotency_key_are_run_once(webhook_queue_path):
+    webhook_queue = _webhook_queue(webhook_queue_path)
+
+    first, created = await webhook_queue.enqueue("flow", "user", "{}", idempotency_key="event-1")
+    assert created
+    duplicate, created = await webhook_queue.enqueue("flow", "user", "{}", idempotency_key="event-1")
+    assert not created
+    assert duplicate.id == first.id
+    other_flow, created = await webhook_queue.enqueue("other-flow", "user", "{}", idempotency_key="event-1")
+    assert created
+    assert other_flow.id != first.id
+
+    assert webhook_queue.get_stats()["queued"] == 2
+    await webhook_queue.teardown()
+
+
+async def test_runs_are_capped_per_flow_and_per_worker(webhook_queue_path, monkeypatch):
+    webhook_queue = _webhook_queue(webhook_queue_path, webhook_queue_workers=3, webhook_queue_max_runs_per_flow=2)
+    running: Counter[str] = Counter()
+    max_running: Counter[str] = Counter()
+    max_total = 0
+
+    async def run_webhook(run):
+        nonlocal max_total
+        running[run.flow_id] += 1
+        max_running[run.flow_id] = max(max_running[run.flow_id], running[run.flow_id])
+        max_total = max(max_total, running.total())
+        await asyncio.sleep(0.02)
+        running[run.flow_id] -= 1
+
+    monkeypatch.setattr(webhook_queue_module, "run_webhook", run_webhook)
+    for flow_id, runs in (("busy", 10), ("quiet", 2)):
+        for _ in range(runs):
+            await webhook_queue.enqueue(flow_id, "user", "{}")
+
+    webhook_queue.start()
+    await _wait_until_finished(webhook_queue)
+
+    assert max_running["busy"] == 2
+    assert max_total == 3
+    assert webhook_queue.get_stats()["succeeded"] == 12
+    await webhook_queue.teardown()
+
+
+async def test_workers_keep_going_after_a_database_error(webhook_queue_path, monkeypatch):
+    webhook_queue = _webhook_queue(webhook_queue_path, webhook_queue_workers=1)
+    claim = webhook_queue.store.claim
+    errors = 0
+
+    def locked_once_claim(*args, **kwargs):
+        nonlocal errors
+        if not errors:
+            errors += 1
+            msg = "database is locked"
+            raise sqlite3.OperationalError(msg)
+        return claim(*args, **kwargs)
+
+    async def run_webhook(_run):
+        pass
+
+    monkeypatch.setattr(webhook_queue.store, "claim", locked_once_claim)
+    monkeypatch.setattr(webhook_queue_module, "run_webhook", run_webhook)
+    await webhook_queue.enqueue("flow", "user", "{}")
+
+    webhook_queue.start()
+    await _wait_until_finished(webhook_queue)
+
+    assert errors == 1
+    assert webhook_queue.get_stats()["succeeded"] == 1
+    await webhook_queue.teardown()
+
+
+async def test_failing_runs_are_retried_until_the_last_attempt(webhook_queue_path, monkeypatch):
+    webhook_queue = _webhook_queue(webhook_queue_path, webhook_queue_max_attempts=3)
+    attempts: Counter[str] = Counter()
+
+    async def run_webhook(run):
+        attempts[run.body] += 1
+        if run.body == "broken" or attempts[run.body] < 3:
+            msg = "Flow failed"
+            raise ValueError(msg)
+
+    monkeypatch.setattr(webhook_queue_module, "run_webhook", run_webhook)
+    flaky, _ = await webhook_queue.enqueue("flow", "user", "flaky")
+    broken, _ = await webhook_queue.enqueue("flow", "user", "broken")
+
+    webhook_queue.start()
+    await _wait_until_finished(webhook_queue)
+
+    flaky = await webhook_queue.get_run(flaky.id)
+    broken = await webhook_queue.get_run(broken.id)
+    assert (flaky.status, flaky.attempts) == (WebhookRunStatus.SUCCEEDED, 3)
+    assert (broken.status, broken.attempts, broken.error) == (WebhookRunStatus.FAILED, 3, "Flow failed")
+    assert attempts == {"flaky": 3, "broken": 3}
+    await webhook_queue.teardown()
+
+
+async def test_runs_are_not_lost_when_a_worker_stops(webhook_queue_path, monkeypatch):
+    started = asyncio.Event()
+    finished: list[str] = []
+
+    async def hanging_run_webhook(run):  # noqa: ARG001
+        started.set()
+        await asyncio.sleep(60)
+
+    async def run_webhook(run):
+        finished.append(run.body)
+
+    monkeypatch.setattr(webhook_queue_module, "run_webhook", hanging_run_webhook)
+    crashed = _webhook_queue(webhook_queue_path)
+    crashed.lease_seconds = 0.2
+    interrupted, _ = await crashed.enqueue("flow", "user", "interrupted")
+    crashed.start()
+    await started.wait()
+    # The worker dies without giving its run back, which is then run again once its lease expires
+    for task in crashed._tasks:
+        task.cancel()
+    crashed._tasks = []
+
+    monkeypatch.setattr(webhook_queue_module, "run_webhook", run_webhook)
+    restarted = _webhook_queue(webhook_queue_path)
+    restarted.start()
+    await _wait_until_finished(restarted)
+
+    assert finished == ["interrupted"]
+    run = await restarted.get_run(interrupted.id)
+    assert (run.status, run.attempts) == (WebhookRunStatus.SUCCEEDED, 2)
+    await restarted.teardown()
+    await crashed.teardown()
+
+
+async def test_stopping_gives_back_the_running_runs(webhook_queue_path, monkeypatch):
+    started = asyncio.Event()
+
+    async def run_webhook(run):  # noqa: ARG001
+        started.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(webhook_queue_module, "run_webhook", run_webhook)
+    webhook_queue = _webhook_queue(webhook_queue_path)
+    run, _ = await webhook_queue.enqueue("flow", "user", "{}")
+    webhook_queue.start()
+    await started.wait()
+
+    await webhook_queue.stop()
+
+    run = await webhook_queue.get_run(run.id)
+    assert (run.status, run.attempts) == (WebhookRunStatus.QUEUED, 0)
+    await webhook_queue.teardown()
+
+
+async def test_webhooks_are_rejected_when_too_many_runs_are_pending(webhook_queue_path):
+    webhook_queue = _webhook_queue(webhook_queue_path, webhook_queue_max_pending=2)
+    await webhook_queue.enqueue("flow", "user", "{}")
+    await webhook_queue.enqueue("flow", "user", "{}")
+
+    with pytest.raises(WebhookQueueFullError):
+        await webhook_queue.enqueue("flow", "user", "{}")
+    await webhook_queue.teardown()
@@ -1,12 +1,15 @@
 import asyncio
 import json
 import uuid
+from unittest.mock import patch
 from uuid import UUID
 
 import pytest
 from httpx import codes
+from langflow.api.utils import update_graph_from_data
 from langflow.memory import aget_messages
 from langflow.services.database.models.flow import FlowUpdate
+from langflow.services.deps import get_chat_service
 from loguru import logger
 
 from tests.unit.build_utils import build_flow, consume_and_assert_stream, create_flow, get_build_events
@@ -51,6 +54,60 @@ async def test_build_flow_from_request_data(client, json_memory_chatbot_no_llm,
     await check_messages(flow_id)
 
 
+async def test_build_flow_from_request_data_patches_the_previous_graph(
+    client, json_memory_chatbot_no_llm, logged_in_headers
+):
+    """Test that a second build of a flow patches the graph of the first one."""
+    flow_id = await create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+    response = await client.get(f"api/v1/flows/{flow_id}", headers=logged_in_headers)
+    flow_data = response.json()
+
+    build_response = await build_flow(client, flow_id, logged_in_headers, json={"data": flow_data["data"]})
+    events_response = await get_build_events(client, build_response["job_id"], logged_in_headers)
+    await consume_and_assert_stream(events_response, build_response["job_id"])
+    graph = (await get_chat_service().get_cache(str(flow_id)))["result"]
+    first_run_id = graph.run_id
+
+    chat_output = next(node for node in flow_data["data"]["nodes"] if node["id"].startswith("ChatOutput"))
+    chat_output["data"]["node"]["template"]["sender_name"]["value"] = "Bot"
+    build_response = await build_flow(client, flow_id, logged_in_headers, json={"data": flow_data["data"]})
+    events_response = await get_build_events(client, build_response["job_id"], logged_in_headers)
+    await consume_and_assert_stream(events_response, build_response["job_id"])
+
+    assert (await get_chat_service().get_cache(str(flow_id)))["result"] is graph
+    assert graph.run_id != first_run_id
+    messages = await aget_messages(flow_id=flow_id, order="ASC")
+    assert [message.sender_name for message in messages] == ["User", "AI", "User", "Bot"]
+
+
+async def test_concurrent_builds_dont_patch_the_same_graph(client, json_memory_chatbot_no_llm, logged_in_headers):
+    """Test that only one of two builds started together patches the graph of the last build."""
+    flow_id = await create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+    response = await client.get(f"api/v1/flows/{flow_id}", headers=logged_in_headers)
+    flow_data = response.json()
+    build_response = await build_flow(client, flow_id, logged_in_headers, json={"data": flow_data["data"]})
+    events_response = await get_build_events(client, build_response["job_id"], logged_in_headers)
+    await consume_and_assert_stream(events_response, build_response["job_id"])
+
+    patched_graphs = []
+
+    async def slow_update_graph_from_data(graph, *args, **kwargs):
+        patched_graphs.append(graph)
+        # Leave time for the other build to look for the previous graph
+        await asyncio.sleep(0.2)
+        return await update_graph_from_data(graph, *args, **kwargs)
+
+    with patch("langflow.api.build.update_graph_from_data", slow_update_graph_from_data):
+        build_responses = await asyncio.gather(
+            *(build_flow(client, flow_id, logged_in_headers, json={"data": flow_data["data"]}) for _ in range(2))
+        )
+        for build_response in build_responses:
+            events_response = await get_build_events(client, build_response["job_id"], logged_in_headers)
+            await consume_and_assert_stream(events_response, build_response["job_id"])
+
+    assert len(patched_graphs) == 1
+
+
 async def test_build_flow_with_frozen_path(client, json_memory_chatbot_no_llm, logged_in_headers):
     """Test building a flow with a frozen path."""
     flow_id = await create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
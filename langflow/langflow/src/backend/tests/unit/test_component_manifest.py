@@ -0,0 +1,55 @@
+import orjson
+import pytest
+from langflow.interface import component_manifest
+from langflow.interface.component_manifest import (
+    compute_components_fingerprint,
+    load_component_manifest,
+    write_component_manifest,
+)
+from langflow.interface.components import import_langflow_components
+
+COMPONENTS = {"inputs": {"TextInput": {"display_name": "Text Input", "template": {"code": {"value": "..."}}}}}
+MODULES = {"inputs": {"TextInput": "langflow.components.inputs.text"}}
+
+
+def test_manifest_round_trip(tmp_path):
+    path = write_component_manifest(COMPONENTS, MODULES, tmp_path / "manifest.json")
+
+    manifest = load_component_manifest(path)
+
+    assert manifest["components"] == COMPONENTS
+    assert manifest["modules"] == MODULES
+
+
+def test_outdated_or_missing_manifest_is_ignored(tmp_path):
+    path = write_component_manifest(COMPONENTS, MODULES, tmp_path / "manifest.json")
+    manifest = orjson.loads(path.read_bytes())
+    manifest["fingerprint"] = "outdated"
+    path.write_bytes(orjson.dumps(manifest))
+
+    assert load_component_manifest(path) is None
+    assert load_component_manifest(tmp_path / "missing.json") is None
+
+
+def test_fingerprint_changes_with_the_components(tmp_path):
+    (tmp_path / "inputs").mkdir()
+    component_file = tmp_path / "inputs" / "text.py"
+    component_file.write_text("class TextInput: ...\n")
+    fingerprint = compute_components_fingerprint(tmp_path)
+
+    (tmp_path / "deactivated").mkdir()
+    (tmp_path / "deactivated" / "old.py").write_text("class Old: ...\n")
+    assert compute_components_fingerprint(tmp_path) == fingerprint
+
+    component_file.write_text("class TextInput:\n    name = 'TextInput'\n")
+    assert compute_components_fingerprint(tmp_path) != fingerprint
+
+
+@pytest.mark.no_blockbuster
+async def test_import_langflow_components_reads_the_manifest(tmp_path, monkeypatch):
+    path = write_component_manifest(COMPONENTS, MODULES, tmp_path / "manifest.json")
+    monkeypatch.setattr(component_manifest, "MANIFEST_PATH", path)
+
+    result = await import_langflow_components()
+
+    assert result == {"components": COMPONENTS}
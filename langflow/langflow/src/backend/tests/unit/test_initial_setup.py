@@ -7,14 +7,17 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from anyio import Path
+from filelock import FileLock
 from httpx import AsyncClient
 from langflow.custom.directory_reader.utils import abuild_custom_component_list_from_path
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.initial_setup.setup import (
+    _get_fs_flows_sync_lock,
     detect_github_url,
     get_project_data,
     load_bundles_from_urls,
     load_starter_projects,
+    sync_flows_from_fs,
     update_projects_components_with_latest_component_versions,
 )
 from langflow.interface.components import aget_all_types_dict
@@ -301,3 +304,26 @@ async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
         assert result["locked"] is True
     finally:
         await flow_file.unlink(missing_ok=True)
+
+
+@pytest.mark.usefixtures("set_fs_flows_polling_interval")
+async def test_sync_flows_from_fs_single_leader(client: AsyncClient):  # noqa: ARG001
+    # The app started by the client fixture already holds the sync lock for this database
+    with patch("langflow.initial_setup.setup._sync_flows_from_fs_as_leader", new_callable=AsyncMock) as leader_sync:
+        task = asyncio.create_task(sync_flows_from_fs())
+        await asyncio.sleep(0.3)
+        task.cancel()
+        await asyncio.wait([task])
+
+    leader_sync.assert_not_called()
+
+
+async def test_fs_flows_sync_lock_is_released_from_another_thread():
+    lock = _get_fs_flows_sync_lock(f"sqlite:///{uuid.uuid4()}.db")
+    # Acquired in a worker thread and released from the event loop, like in sync_flows_from_fs
+    await asyncio.to_thread(lock.acquire, timeout=0)
+    lock.release()
+
+    other_worker_lock = FileLock(lock.lock_file)
+    other_worker_lock.acquire(timeout=0)
+    other_worker_lock.release()
@@ -1,6 +1,15 @@
+from types import SimpleNamespace
+
+from langflow.custom.custom_component.custom_component import CustomComponent
 from langflow.graph import Graph
 from langflow.initial_setup.setup import load_starter_projects
+from langflow.interface.initialize.loading import (
+    prefetch_load_from_db_variables,
+    update_params_with_load_from_db_fields,
+)
 from langflow.load import aload_flow_from_json
+from langflow.services.deps import get_db_service, get_variable_service, session_scope
+from sqlalchemy import event
 
 # TODO: UPDATE BASIC EXAMPLE
 # def test_load_flow_from_json():
@@ -25,3 +34,49 @@ async def test_load_flow_from_json_object():
     loaded = await aload_flow_from_json(project)
     assert loaded is not None
     assert isinstance(loaded, Graph)
+
+
+async def test_load_from_db_variables_are_fetched_in_one_query(client, active_user):  # noqa: ARG001
+    """Resolving the credentials of a flow run queries the variables once, whatever the number of components."""
+    user_id = active_user.id
+    variable_service = get_variable_service()
+    async with session_scope() as session:
+        for i in range(30):
+            await variable_service.create_variable(user_id, f"API_KEY_{i}", f"secret-{i}", session=session)
+
+    vertices = [
+        SimpleNamespace(
+            load_from_db_fields=["api_key", "base_url"],
+            params={"api_key": f"API_KEY_{i}", "base_url": "API_KEY_0", "temperature": 0.1},
+        )
+        for i in range(30)
+    ]
+    components = [CustomComponent(_user_id=str(user_id)) for _ in vertices]
+
+    statements: list[str] = []
+
+    def count_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    engine = get_db_service().engine.sync_engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        await prefetch_load_from_db_variables(vertices, user_id)
+        results = [
+            await update_params_with_load_from_db_fields(component, dict(vertex.params), vertex.load_from_db_fields)
+            for component, vertex in zip(components, vertices, strict=True)
+        ]
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert [params["api_key"] for params in results] == [f"secret-{i}" for i in range(30)]
+    assert all(params["base_url"] == "secret-0" for params in results)
+    assert len([statement for statement in statements if "FROM variable" in statement]) == 1
+
+    # Updating a variable is seen by the next run
+    async with session_scope() as session:
+        await variable_service.update_variable(user_id, "API_KEY_0", "rotated", session=session)
+    params = await update_params_with_load_from_db_fields(
+        components[0], dict(vertices[0].params), vertices[0].load_from_db_fields
+    )
+    assert params["base_url"] == "rotated"
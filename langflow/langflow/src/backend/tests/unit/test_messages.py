@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
 import pytest
@@ -10,7 +10,9 @@ from langflow.memory import (
     aget_messages,
     astore_message,
     aupdate_messages,
+    delete_message,
     delete_messages,
+    get_message_tail_cache,
     get_messages,
 )
 from langflow.schema.content_block import ContentBlock
@@ -21,7 +23,7 @@ from langflow.schema.properties import Properties, Source
 # Assuming you have these imports available
 from langflow.services.database.models.message import MessageCreate, MessageRead
 from langflow.services.database.models.message.model import MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_settings_service, session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
 
 
@@ -356,3 +358,91 @@ async def test_aupdate_message_with_nested_properties(created_message):
     assert updated[0].properties.allow_markdown is True
     assert updated[0].properties.state == "complete"
     assert updated[0].properties.targets == []
+
+
+async def _add_history(session_id: str, count: int) -> list[MessageRead]:
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    messages = [
+        MessageTable(
+            text=f"Message {index}",
+            sender="User" if index % 2 == 0 else "Machine",
+            sender_name="User" if index % 2 == 0 else "AI",
+            session_id=session_id,
+            timestamp=start + timedelta(seconds=index),
+            category="message",
+        )
+        for index in range(count)
+    ]
+    async with session_scope() as session:
+        return await aadd_messagetables(messages, session)
+
+
+@pytest.fixture
+def tail_cache(client, monkeypatch):  # noqa: ARG001
+    monkeypatch.setattr(get_settings_service().settings, "message_tail_cache_max_sessions", 100)
+    get_message_tail_cache.cache_clear()
+    yield get_message_tail_cache()
+    get_message_tail_cache.cache_clear()
+
+
+@pytest.mark.usefixtures("client")
+def test_tail_cache_is_disabled_by_default():
+    get_message_tail_cache.cache_clear()
+
+    assert not get_message_tail_cache().enabled
+
+
+async def test_aget_messages_windows_match_the_database(tail_cache, monkeypatch):
+    session_id = "long_session_id"
+    await _add_history(session_id, tail_cache.max_messages + 50)
+    queries = [
+        {"limit": 5},
+        {"limit": 5, "order": "ASC"},
+        {"limit": 7, "sender": "Machine"},
+        {"limit": 3, "sender_name": "User"},
+        {"limit": 200},
+        {},
+    ]
+
+    cached = [[message.text for message in await aget_messages(session_id=session_id, **query)] for query in queries]
+    monkeypatch.setattr(tail_cache, "enabled", False)
+    expected = [[message.text for message in await aget_messages(session_id=session_id, **query)] for query in queries]
+
+    assert cached == expected
+    assert cached[0] == ["Message 149", "Message 148", "Message 147", "Message 146", "Message 145"]
+
+
+@pytest.mark.usefixtures("tail_cache")
+async def test_aget_messages_reads_the_tail_of_a_session_once(monkeypatch):
+    session_id = "tail_session_id"
+    await _add_history(session_id, 10)
+    await aget_messages(session_id=session_id, limit=5)
+
+    def fail(*_args, **_kwargs):
+        msg = "The messages should be read from the tail cache"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("langflow.memory.session_scope", fail)
+    messages = await aget_messages(session_id=session_id, limit=5, sender="Machine")
+
+    assert [message.text for message in messages] == ["Message 9", "Message 7", "Message 5", "Message 3", "Message 1"]
+
+
+@pytest.mark.usefixtures("tail_cache")
+async def test_tail_cache_follows_stored_updated_and_deleted_messages():
+    session_id = "coherent_session_id"
+    history = await _add_history(session_id, 3)
+    assert len(await aget_messages(session_id=session_id)) == 3
+
+    await astore_message(Message(text="New message", sender="User", sender_name="User", session_id=session_id))
+    assert (await aget_messages(session_id=session_id, limit=1))[0].text == "New message"
+
+    history[1].text = "Edited message"
+    await aupdate_messages(Message(**history[1].model_dump()))
+    assert "Edited message" in [message.text for message in await aget_messages(session_id=session_id)]
+
+    await delete_message(history[1].id)
+    assert len(await aget_messages(session_id=session_id)) == 3
+
+    await adelete_messages(session_id)
+    assert await aget_messages(session_id=session_id) == []
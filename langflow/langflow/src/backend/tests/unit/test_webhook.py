@@ -1,6 +1,10 @@
+import asyncio
+
 import aiofiles
 import anyio
 import pytest
+from langflow.services.deps import get_webhook_queue_service
+from langflow.services.webhook_queue.service import WebhookRunStatus
 
 
 @pytest.fixture(autouse=True)
@@ -8,6 +12,17 @@ def _check_openai_api_key_in_environment_variables():
     pass
 
 
+async def _wait_for_run(run_id: str):
+    webhook_queue = get_webhook_queue_service()
+    for _ in range(200):
+        run = await webhook_queue.get_run(run_id)
+        if run.status not in {WebhookRunStatus.QUEUED, WebhookRunStatus.RUNNING}:
+            return run
+        await asyncio.sleep(0.05)
+    msg = f"Webhook run {run_id} did not finish"
+    raise TimeoutError(msg)
+
+
 async def test_webhook_endpoint(client, added_webhook_test):
     # The test is as follows:
     # 1. The flow when run will get a "path" from the payload and save a file with the path as the name.
@@ -23,7 +38,9 @@ async def test_webhook_endpoint(client, added_webhook_test):
 
         response = await client.post(endpoint, json=payload)
         assert response.status_code == 202
-        # Wait a few seconds for the file to be created
+        # Wait for the queued run to create the file
+        run = await _wait_for_run(response.json()["run_id"])
+        assert run.status == WebhookRunStatus.SUCCEEDED, run.error
         assert await file_path.exists(), f"File {file_path} does not exist"
     file_does_not_exist = not await file_path.exists()
     assert file_does_not_exist, f"File {file_path} still exists"
@@ -32,6 +49,7 @@ async def test_webhook_endpoint(client, added_webhook_test):
     payload = {"invalid_key": "invalid_value"}
     response = await client.post(endpoint, json=payload)
     assert response.status_code == 202
+    await _wait_for_run(response.json()["run_id"])
     assert not await file_path.exists(), f"File {file_path} should not exist"
 
 
@@ -1,7 +1,10 @@
 import base64
+import io
+import os
 
 import pytest
-from langflow.utils.image import convert_image_to_base64, create_data_url, create_image_content_dict
+from langflow.utils.image import ImageCache, convert_image_to_base64, create_data_url, create_image_content_dict
+from PIL import Image as PILImage
 
 
 @pytest.fixture
@@ -106,3 +109,49 @@ def test_create_image_content_dict_unrecognized_extension(tmp_path):
     invalid_file.touch()
     with pytest.raises(ValueError, match="Could not determine MIME type"):
         create_image_content_dict(invalid_file)
+
+
+def _write_png(path, size):
+    PILImage.new("RGB", size, color="red").save(path, format="PNG")
+    return path
+
+
+def test_image_cache_reuses_encoded_image(sample_image):
+    """The image is read and encoded once, until the file changes."""
+    cache = ImageCache(max_bytes=1024 * 1024)
+    first = cache.get_data_url(sample_image, "image/png")
+    assert cache.get_data_url(sample_image, "image/png") == first
+    assert cache.get_stats()["misses"] == 1
+    assert cache.get_stats()["hits"] == 1
+
+    _write_png(sample_image, (4, 4))
+    os.utime(sample_image, ns=(0, sample_image.stat().st_mtime_ns + 1_000_000))
+    assert cache.get_data_url(sample_image, "image/png") != first
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_image_cache_is_bounded_by_bytes(tmp_path):
+    """Least recently used images are evicted once the encoded images exceed the budget."""
+    images = [_write_png(tmp_path / f"image_{i}.png", (64, 64)) for i in range(3)]
+    entry_size = len(ImageCache(max_bytes=0).get_data_url(images[0], "image/png"))
+    cache = ImageCache(max_bytes=entry_size * 2)
+
+    for image in images:
+        cache.get_data_url(image, "image/png")
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= entry_size * 2
+    cache.get_data_url(images[0], "image/png")
+    assert cache.get_stats()["misses"] == 4
+
+
+def test_image_cache_downscales_large_images(tmp_path):
+    """Images larger than the maximum edge are resized, keeping their aspect ratio."""
+    image_path = _write_png(tmp_path / "large.png", (400, 200))
+    data_url = ImageCache(max_bytes=0, max_edge=100).get_data_url(image_path, "image/png")
+
+    image_bytes = base64.b64decode(data_url.split(",")[1])
+    with PILImage.open(io.BytesIO(image_bytes)) as image:
+        assert image.size == (100, 50)
+        assert image.format == "PNG"
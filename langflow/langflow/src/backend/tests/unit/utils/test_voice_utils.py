@@ -0,0 +1,91 @@
+import numpy as np
+from langflow.utils.voice_utils import (
+    BYTES_PER_16K_FRAME,
+    BYTES_PER_24K_FRAME,
+    SAMPLE_RATE_24K,
+    SAMPLES_PER_24K_FRAME,
+    VAD_SAMPLE_RATE_16K,
+    AudioRingBuffer,
+    StreamingResampler,
+    VADPipeline,
+    coalesce_audio_chunks,
+)
+
+
+def _tone(frequency: float, seconds: float, sample_rate: int = SAMPLE_RATE_24K) -> np.ndarray:
+    time = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (np.sin(2 * np.pi * frequency * time) * 10_000).astype(np.int16)
+
+
+class EnergyVAD:
+    """Labels frames as speech when they are loud enough."""
+
+    def __init__(self) -> None:
+        self.frame_sizes: list[int] = []
+
+    def is_speech(self, buf: bytes, sample_rate: int, length: int | None = None) -> bool:  # noqa: ARG002
+        assert sample_rate == VAD_SAMPLE_RATE_16K
+        self.frame_sizes.append(len(buf))
+        return bool(np.abs(np.frombuffer(buf, dtype=np.int16)).mean() > 1000)
+
+
+def test_streaming_resampler_matches_resampling_at_once():
+    """Resampling frame by frame gives the same audio as resampling the whole stream."""
+    samples = _tone(440, 1.0)
+    at_once = StreamingResampler().process(samples)
+
+    resampler = StreamingResampler()
+    frames = [
+        resampler.process(samples[start : start + SAMPLES_PER_24K_FRAME])
+        for start in range(0, len(samples), SAMPLES_PER_24K_FRAME)
+    ]
+
+    assert len(at_once) == len(samples) * 2 // 3
+    np.testing.assert_array_equal(np.concatenate(frames), at_once)
+
+
+def test_streaming_resampler_keeps_the_frequency():
+    resampled = StreamingResampler().process(_tone(1000, 1.0)).astype(np.float32)
+
+    spectrum = np.abs(np.fft.rfft(resampled))
+    frequencies = np.fft.rfftfreq(len(resampled), 1 / VAD_SAMPLE_RATE_16K)
+    assert abs(frequencies[np.argmax(spectrum)] - 1000) < 5
+    # Past the filter delay, the amplitude is preserved
+    assert 9000 < np.abs(resampled[100:]).max() < 11000
+
+
+def test_audio_ring_buffer_returns_whole_frames_in_order():
+    samples = np.arange(5 * SAMPLES_PER_24K_FRAME, dtype=np.int16)
+    data = samples.tobytes()
+    buffer = AudioRingBuffer(capacity=SAMPLES_PER_24K_FRAME)
+
+    # Chunks of odd sizes, splitting samples in half
+    read = []
+    for start in range(0, len(data), 333):
+        buffer.write(data[start : start + 333])
+        read.append(buffer.read_frames(SAMPLES_PER_24K_FRAME, max_frames=2))
+
+    np.testing.assert_array_equal(np.concatenate(read), samples)
+    assert len(buffer) == 0
+
+
+def test_vad_pipeline_checks_each_frame():
+    vad = EnergyVAD()
+    pipeline = VADPipeline(vad, max_batch_frames=4)
+    audio = np.concatenate([np.zeros(10 * SAMPLES_PER_24K_FRAME, dtype=np.int16), _tone(300, 0.2)]).tobytes()
+
+    results = pipeline.process(audio[:1000]) + pipeline.process(audio[1000:])
+
+    assert len(results) == len(audio) // BYTES_PER_24K_FRAME
+    assert set(vad.frame_sizes) == {BYTES_PER_16K_FRAME}
+    assert not any(results[:10])
+    assert all(results[12:])
+
+
+def test_coalesce_audio_chunks():
+    chunks = [b"\x01" * 101 for _ in range(10)]
+
+    coalesced = list(coalesce_audio_chunks(chunks, min_bytes=300))
+
+    assert b"".join(coalesced) == b"".join(chunks)
+    assert all(len(chunk) >= 300 and len(chunk) % 2 == 0 for chunk in coalesced[:-1])